@@ -0,0 +1,144 @@
+"""
+Memory and build-time benchmark of the typed config model against to_ns.
+
+Builds BotConfig and the former SimpleNamespace tree from the same parsed
+template, scaled to a given number of sample utterances (5,000 by
+default) with synonyms in proportion:
+
+    python benchmarks/bench_config_model.py
+    python benchmarks/bench_config_model.py --utterances 50000
+
+Memory is what each build allocates on top of the parsed YAML, whose
+strings both representations share.
+"""
+
+import argparse
+import gc
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from bot_engine.utils.config_model import BotConfig
+from bot_engine.utils.yaml_loader import to_ns
+
+
+UTTERANCES_PER_INTENT = 250
+SLOTS_PER_INTENT = 4
+VALUES_PER_SLOT_TYPE = 25
+SYNONYMS_PER_VALUE = 4
+REPEATS = 20
+
+
+def template_data(utterances: int) -> Dict:
+    """Parsed bot section with the given total number of sample utterances"""
+    intents = max(1, utterances // UTTERANCES_PER_INTENT)
+    return {
+        "name": "bench_bot",
+        "description": "Config model benchmark bot",
+        "region": "us-east-1",
+        "roleArn": None,
+        "dataPrivacy": {"childDirected": False},
+        "idleSessionTTLInSeconds": 300,
+        "alias": {"name": "bench", "description": "Benchmark alias"},
+        "locale": [
+            {
+                "localeId": "en_US",
+                "nluIntentConfidenceThreshold": 0.4,
+                "lambdaHooks": {
+                    "arn": "arn:aws:lambda:us-east-1:123456789012:function:bench",
+                    "codeHookInterfaceVersion": "1.0",
+                },
+                "voiceSettings": {"voiceId": "Joanna", "engine": "neural"},
+                "intents": [
+                    {
+                        "name": f"INTENT_{i}",
+                        "codeHook": ["fulfillmentCodeHook"],
+                        "description": f"Benchmark intent {i}",
+                        "sampleUtterances": [
+                            f"utterance {u} for intent {i} {{SLOT_{i}_0}}"
+                            for u in range(UTTERANCES_PER_INTENT)
+                        ],
+                    }
+                    for i in range(intents)
+                ],
+                "slotDefinitions": [
+                    {
+                        "name": f"SLOT_{i}_{s}",
+                        "intent": f"INTENT_{i}",
+                        "slotPhraseName": f"SLOT_{i}_{s}",
+                        "type": "Custom",
+                        "description": f"Custom slot {i}/{s}",
+                        "priority": s + 1,
+                        "slotType": {
+                            "resolutionStrategy": "TopResolution",
+                            "slotTypeValues": [
+                                {
+                                    "sampleValue": f"value {v}",
+                                    "synonyms": [
+                                        f"synonym {v}.{n}"
+                                        for n in range(SYNONYMS_PER_VALUE)
+                                    ],
+                                }
+                                for v in range(VALUES_PER_SLOT_TYPE)
+                            ],
+                        },
+                    }
+                    for i in range(intents)
+                    for s in range(SLOTS_PER_INTENT)
+                ],
+            }
+        ],
+    }
+
+
+def measure(build: Callable[[Dict], object], data: Dict) -> Dict[str, float]:
+    """Median build time and memory allocated by one build"""
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        build(data)
+        timings.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    config = build(data)
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del config
+    return {
+        "build_ms": statistics.median(timings) * 1000,
+        "memory_kib": allocated / 1024,
+    }
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--utterances",
+        type=int,
+        default=5000,
+        help="total sample utterances in the template (default: 5000)",
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    data = template_data(args.utterances)
+    results = {
+        "to_ns": measure(lambda bot: to_ns(bot), data),
+        "BotConfig": measure(BotConfig.from_dict, data),
+    }
+    for name, result in results.items():
+        print(
+            f"{name:>10}: {result['build_ms']:8.2f} ms build "
+            f"{result['memory_kib']:10.1f} KiB"
+        )
+    ratio = results["BotConfig"]["memory_kib"] / results["to_ns"]["memory_kib"]
+    print(f"BotConfig uses {ratio:.0%} of the to_ns memory")
@@ -0,0 +1,207 @@
+"""
+End-to-end provisioning benchmark against the in-process fake Lex client.
+
+Times full CreateUniversalBot runs for synthetic bots of increasing size
+(locales x intents x slots) and compares wall time and API-call count with
+a saved baseline:
+
+    python benchmarks/bench_provisioning.py --save benchmarks/baseline.json
+    python benchmarks/bench_provisioning.py --baseline benchmarks/baseline.json
+
+Exits with status 1 when any size regressed.
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from bot_engine.universal_bot_orchestrator import CreateUniversalBot
+from bot_engine.utils.config_model import BotConfig
+from common.fake_lex_client import FakeLexModelsClient, install_fake_clients
+from common.rate_limiter import RATE_LIMITER
+
+
+# (locales, intents per locale, slots per intent)
+SIZES: List[Tuple[int, int, int]] = [(1, 2, 2), (1, 5, 4), (2, 10, 4), (3, 20, 5)]
+
+# Fake service timings, scaled down from real Lex so a full run takes seconds
+FAKE_SERVICE = {
+    "latency": 0.002,
+    "visibility_delay": 0.05,
+    "create_seconds": 0.2,
+    "build_seconds": 0.5,
+    "build_seconds_per_intent": 0.02,
+    "version_seconds": 0.2,
+}
+
+WALL_TOLERANCE = 0.25
+CALLS_TOLERANCE = 0.0
+
+
+def synthetic_bot_config(locales: int, intents: int, slots: int):
+    """
+    Build a BotConfig shaped like bot_template.yaml.
+
+    Every intent gets `slots` slots, alternating between custom slot types
+    (each with its own slot type) and built-in slot types.
+    """
+    locale_ids = ["en_US", "en_GB", "es_US", "fr_CA", "de_DE", "ja_JP"][:locales]
+    return BotConfig.from_dict(
+        {
+            "name": f"bench_bot_{locales}x{intents}x{slots}",
+            "description": "Synthetic benchmark bot",
+            "region": "us-east-1",
+            "roleArn": "arn:aws:iam::123456789012:role/bench",
+            "dataPrivacy": {"childDirected": False},
+            "idleSessionTTLInSeconds": 300,
+            "alias": {"name": "bench", "description": "Benchmark alias"},
+            "locale": [
+                {
+                    "localeId": locale_id,
+                    "nluIntentConfidenceThreshold": 0.4,
+                    "lambdaHooks": {
+                        "arn": "arn:aws:lambda:us-east-1:123456789012:function:bench",
+                        "codeHookInterfaceVersion": "1.0",
+                    },
+                    "voiceSettings": {"voiceId": "Joanna", "engine": "neural"},
+                    "intents": [
+                        {
+                            "name": f"INTENT_{i}",
+                            "codeHook": ["fulfillmentCodeHook"],
+                            "description": f"Benchmark intent {i}",
+                            "sampleUtterances": [
+                                f"utterance {u} for intent {i} {{SLOT_{i}_0}}"
+                                for u in range(10)
+                            ],
+                        }
+                        for i in range(intents)
+                    ],
+                    "slotDefinitions": [
+                        _slot_definition(intent, slot)
+                        for intent in range(intents)
+                        for slot in range(slots)
+                    ],
+                }
+                for locale_id in locale_ids
+            ],
+        }
+    )
+
+
+def _slot_definition(intent: int, slot: int) -> Dict:
+    definition = {
+        "name": f"SLOT_{intent}_{slot}",
+        "intent": f"INTENT_{intent}",
+        "slotPhraseName": f"SLOT_{intent}_{slot}",
+        "slotConstraint": "Optional",
+        "priority": slot + 1,
+    }
+    if slot % 2:
+        definition.update({"type": "BuiltIn", "slotTypeId": "AMAZON.Number"})
+    else:
+        definition.update(
+            {
+                "type": "Custom",
+                "description": f"Custom slot {intent}/{slot}",
+                "slotType": {
+                    "resolutionStrategy": "TopResolution",
+                    "slotTypeValues": [
+                        {"sampleValue": f"value {v}", "synonyms": [f"synonym {v}"]}
+                        for v in range(5)
+                    ],
+                },
+            }
+        )
+    return definition
+
+
+def run_size(locales: int, intents: int, slots: int) -> Dict:
+    """Provision one synthetic bot from scratch and measure it"""
+    fake = install_fake_clients(FakeLexModelsClient(**FAKE_SERVICE))
+    RATE_LIMITER.reset()
+    bot_config = synthetic_bot_config(locales, intents, slots)
+
+    start = time.monotonic()
+    CreateUniversalBot(bot_config=bot_config)
+    wall = time.monotonic() - start
+    return {
+        "wall_seconds": round(wall, 3),
+        "api_calls": fake.total_calls(),
+        "throttled": sum(fake.throttled.values()),
+    }
+
+
+def compare(results: Dict, baseline: Dict) -> List[str]:
+    """Return a message for every size that regressed against the baseline"""
+    regressions = []
+    for size, result in results.items():
+        base = baseline.get(size)
+        if base is None:
+            continue
+        if result["wall_seconds"] > base["wall_seconds"] * (1 + WALL_TOLERANCE):
+            regressions.append(
+                f"{size}: wall time {result['wall_seconds']}s vs "
+                f"{base['wall_seconds']}s baseline"
+            )
+        if result["api_calls"] > base["api_calls"] * (1 + CALLS_TOLERANCE):
+            regressions.append(
+                f"{size}: {result['api_calls']} API calls vs "
+                f"{base['api_calls']} baseline"
+            )
+    return regressions
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--baseline", type=Path, help="baseline JSON to compare with")
+    parser.add_argument("--save", type=Path, help="write the results as JSON")
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        metavar="LxIxS",
+        help="sizes to run as locales x intents x slots, e.g. 1x5x4",
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    sizes = (
+        [tuple(int(n) for n in size.split("x")) for size in args.sizes]
+        if args.sizes
+        else SIZES
+    )
+
+    save_path = args.save.resolve() if args.save else None
+    baseline_path = args.baseline.resolve() if args.baseline else None
+
+    results = {}
+    with tempfile.TemporaryDirectory() as work_dir:
+        # Deployment state and journals go to .lex_state in the working dir
+        os.chdir(work_dir)
+        for locales, intents, slots in sizes:
+            size = f"{locales}x{intents}x{slots}"
+            results[size] = run_size(locales, intents, slots)
+            print(
+                f"{size:>10}: {results[size]['wall_seconds']:7.2f}s "
+                f"{results[size]['api_calls']:5d} calls "
+                f"{results[size]['throttled']:3d} throttled"
+            )
+
+    if save_path:
+        save_path.write_text(json.dumps(results, indent=2) + "\n")
+
+    if baseline_path:
+        regressions = compare(results, json.loads(baseline_path.read_text()))
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        sys.exit(1 if regressions else 0)
@@ -1,3 +1,5 @@
+import argparse
+import asyncio
 import sys
 import logging
 from pathlib import Path
@@ -13,7 +15,164 @@ logging.basicConfig(
 
 # Now import and run
 from src.bot_engine.universal_bot_orchestrator import CreateUniversalBot
+from src.bot_engine.universal_bot_updater import UpdateUniversalBot
+from src.bot_engine.universal_bot_importer import ImportUniversalBot
+from src.bot_engine.universal_bot_fleet import DeployBotFleet, FleetDeploymentException
+from src.bot_engine.async_bot_orchestrator import deploy
+from src.bot_engine.builder.bot_archive_compiler import BotArchiveCompiler
+from src.bot_engine.utils.deploy_planner import DeploymentPlanner, LatencyModel
+from src.bot_engine.utils.overlap_analyzer import OverlapAnalyzer
+from src.bot_engine.utils.yaml_loader import BotConfigException, load_bot_config
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Deploy the Lex V2 universal bot")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--update",
+        action="store_true",
+        help="apply only the differences between bot_template.yaml and the live bot",
+    )
+    mode.add_argument(
+        "--import-archive",
+        action="store_true",
+        help="provision the bot with a single Lex import of the compiled template",
+    )
+    mode.add_argument(
+        "--async-engine",
+        action="store_true",
+        help="create the bot with the asyncio engine (see requirements-async.txt)",
+    )
+    mode.add_argument(
+        "--compile-archive",
+        metavar="PATH",
+        help="only compile the template into a Lex import zip at PATH (no AWS calls)",
+    )
+    mode.add_argument(
+        "--fleet",
+        metavar="DIR",
+        type=Path,
+        help="create every bot template in DIR concurrently, each with its own "
+        "deployment state (--resume and --resync-state apply to every bot)",
+    )
+    mode.add_argument(
+        "--plan",
+        action="store_true",
+        help="list the API calls of a fresh deployment and estimate its wall time "
+        "(no AWS calls)",
+    )
+    mode.add_argument(
+        "--validate",
+        action="store_true",
+        help="only check bot_template.yaml and list every problem found "
+        "(no AWS calls)",
+    )
+    mode.add_argument(
+        "--overlaps",
+        metavar="MIN_SIMILARITY",
+        nargs="?",
+        const=OverlapAnalyzer.MIN_SIMILARITY,
+        type=float,
+        help="report near-duplicate sample utterances across intents "
+        f"(default similarity: {OverlapAnalyzer.MIN_SIMILARITY}; no AWS calls)",
+    )
+    parser.add_argument(
+        "--state-file",
+        metavar="PATH",
+        type=Path,
+        help="deployment state file (default: .lex_state/<bot>-<region>.json)",
+    )
+    parser.add_argument(
+        "--resync-state",
+        action="store_true",
+        help="rebuild the deployment state from the live bot before deploying",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="continue the last interrupted deployment from its journal",
+    )
+    parser.add_argument(
+        "--report",
+        metavar="PATH",
+        type=Path,
+        help="write a JSON timing report of the run to PATH "
+        "(default, --update and --fleet)",
+    )
+    parser.add_argument(
+        "--overwrite",
+        action="store_true",
+        help="let --import-archive replace an existing bot of the same name",
+    )
+    parser.add_argument(
+        "--max-bots",
+        metavar="N",
+        type=int,
+        help="bots deployed at once in --fleet mode (default: 4)",
+    )
+    parser.add_argument(
+        "--calibrate",
+        metavar="REPORT",
+        nargs="+",
+        type=Path,
+        help="calibrate the --plan latency model from earlier --report files",
+    )
+    args = parser.parse_args()
+    if args.fleet and args.state_file:
+        parser.error(
+            "--state-file cannot be used with --fleet: every bot keeps its own "
+            "state in .lex_state/<bot>-<region>.json"
+        )
+    return args
+
 
 if __name__ == "__main__":
-    c = CreateUniversalBot()
-    print(c)
+    args = parse_args()
+    if args.validate:
+        try:
+            load_bot_config(cache_dir=None)
+        except BotConfigException as e:
+            print(e)
+            sys.exit(1)
+        print("Bot template is valid")
+    elif args.overlaps is not None:
+        analyzer = OverlapAnalyzer(args.overlaps)
+        bot_config = load_bot_config(allow_duplicate_utterances=True)
+        print(analyzer.render(analyzer.analyze(bot_config)))
+    elif args.compile_archive:
+        Path(args.compile_archive).write_bytes(
+            BotArchiveCompiler(load_bot_config()).to_zip_bytes()
+        )
+        print(f"Archive written to {args.compile_archive}")
+    elif args.fleet:
+        try:
+            print(
+                DeployBotFleet(
+                    args.fleet,
+                    args.max_bots,
+                    report_path=args.report,
+                    resync_state=args.resync_state,
+                    resume=args.resume,
+                )
+            )
+        except FleetDeploymentException as e:
+            print(e)
+            sys.exit(1)
+    elif args.plan:
+        planner = DeploymentPlanner(
+            LatencyModel.from_reports(args.calibrate) if args.calibrate else None
+        )
+        planner.dry_run()
+        print(planner.render())
+    elif args.async_engine:
+        print(asyncio.run(deploy(load_bot_config())))
+    elif args.import_archive:
+        print(ImportUniversalBot(overwrite=args.overwrite))
+    elif args.update:
+        print(UpdateUniversalBot(args.report))
+    else:
+        print(
+            CreateUniversalBot(
+                args.state_file, args.resync_state, args.resume, args.report
+            )
+        )
@@ -0,0 +1,630 @@
+import asyncio
+import functools
+import logging
+import random
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from bot_engine.builder.alias_builder import CreateBotAlias
+from bot_engine.builder.instance_builder import (
+    CreateBotInstance,
+    _build_service_role_params,
+)
+from bot_engine.builder.intent_builder import CreateBotIntent
+from bot_engine.builder.locale_builder import CreateBuildBotLocale
+from bot_engine.builder.resource_waiter import (
+    RETRYABLE_ERROR_CODES,
+    ResourceFailedException,
+    ResourceWaiter,
+    WaiterTimeoutException,
+    _error_code,
+)
+from bot_engine.builder.slots_type_builder import CreateBotSlotsType
+from bot_engine.builder.version_builder import CreateBotVersion
+from bot_engine.utils.slot_value_catalog import slot_type_values
+from common.client_factory import CLIENT_FACTORY
+from common.lex_v2_client import lex_v2_client
+from common.rate_limiter import RATE_LIMITER, RateLimitedClient, RateLimiter
+
+try:
+    from aiobotocore.config import AioConfig
+    from aiobotocore.session import get_session
+except ImportError:  # pragma: no cover - optional dependency
+    AioConfig = None
+    get_session = None
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncBotCreationException(Exception):
+    """Exception for failures of the asyncio provisioning engine"""
+
+    pass
+
+
+class AsyncAwsClient:
+    """
+    Awaitable facade over an AWS client.
+
+    With aiobotocore installed every call is a native coroutine awaited
+    through the shared RateLimiter, which paces it and retries throttles.
+    Without it, calls on the shared rate-limited boto3 client are run on
+    the default executor so the engine still works, at the cost of one
+    thread per in-flight call. Either way calls are traced like those of
+    the sync engine.
+    """
+
+    MAX_IN_FLIGHT = 32
+
+    def __init__(self, client, native: bool, limiter: Optional[RateLimiter] = None):
+        self._client = client
+        self._native = native
+        self._limiter = limiter or RATE_LIMITER
+        self._semaphore = asyncio.Semaphore(self.MAX_IN_FLIGHT)
+
+    async def call(self, operation_name: str, **kwargs) -> Dict:
+        """
+        Await one API call within the shared rate limits.
+
+        Args:
+            operation_name: Client method name, e.g. "create_intent"
+            **kwargs: API parameters
+
+        Returns:
+            API response
+        """
+        method = getattr(self._client, operation_name)
+        async with self._semaphore:
+            if self._native:
+                return await self._limiter.call_async(operation_name, method, **kwargs)
+            # to_thread runs the call in a copy of this task's context, so
+            # it is attributed to the task's step
+            return await asyncio.to_thread(method, **kwargs)
+
+    def __getattr__(self, operation_name: str) -> Callable[..., Awaitable[Dict]]:
+        return functools.partial(self.call, operation_name)
+
+
+@asynccontextmanager
+async def async_aws_client(service_name: str, region_name: Optional[str] = None):
+    """
+    Open an awaitable client for a service.
+
+    Uses aiobotocore when it is installed (pip install -r
+    requirements-async.txt), else the cached boto3 client behind the shared
+    RateLimiter, as the sync engine does.
+    """
+    if get_session is None:
+        logger.warning(
+            "aiobotocore is not installed, running API calls on threads; "
+            "install requirements-async.txt for native asyncio calls"
+        )
+        if service_name == "lexv2-models":
+            client = lex_v2_client(region_name)
+        else:
+            client = CLIENT_FACTORY.client(service_name, region_name)
+        yield AsyncAwsClient(RateLimitedClient(client), native=False)
+        return
+
+    config = AioConfig(
+        max_pool_connections=AsyncAwsClient.MAX_IN_FLIGHT,
+        retries={"max_attempts": CLIENT_FACTORY.MAX_RETRY_ATTEMPTS, "mode": "standard"},
+        connect_timeout=CLIENT_FACTORY.CONNECT_TIMEOUT,
+        read_timeout=CLIENT_FACTORY.READ_TIMEOUT,
+    )
+    async with get_session().create_client(
+        service_name, region_name=region_name, config=config
+    ) as client:
+        yield AsyncAwsClient(client, native=True)
+
+
+async def gather_or_cancel(awaitables: Iterable[Awaitable]) -> List[Any]:
+    """
+    Run awaitables concurrently, cancelling the rest on the first failure.
+
+    Returns:
+        Results in the order the awaitables were given
+
+    Raises:
+        The first exception raised by any awaitable
+    """
+    tasks = [asyncio.ensure_future(awaitable) for awaitable in awaitables]
+    if not tasks:
+        return []
+    done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    failed = [task for task in done if task.exception() is not None]
+    if failed:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        raise failed[0].exception()
+    return [task.result() for task in tasks]
+
+
+class AsyncCreateUniversalBot:
+    """
+    asyncio version of CreateUniversalBot.
+
+    Runs the same steps (bot, locales, slot types, intents, slots, slot
+    priorities, builds, version, alias) with every API call and status poll
+    awaited on one event loop. Each instance carries its own bot name and
+    client, so several bots can be deployed concurrently in one process.
+    """
+
+    # Locales provisioned at once; an included locale is held in memory
+    # only while it is provisioned
+    MAX_LOCALE_TASKS = 4
+
+    def __init__(self, bot_config, lex, iam=None):
+        """
+        Args:
+            bot_config: Bot template namespace, as loaded from bot_template.yaml
+            lex: AsyncAwsClient for lexv2-models
+            iam: Optional AsyncAwsClient for IAM, needed when the template
+                has no roleArn
+        """
+        self.bot_config = bot_config
+        self.lex = lex
+        self.iam = iam
+        self.bot_id: Optional[str] = None
+
+    async def _wait(
+        self,
+        resource_type: str,
+        resource_name: str,
+        describe: Callable[[], Awaitable[Dict]],
+        is_ready: Callable[[Dict], bool],
+        is_failed: Optional[Callable[[Dict], bool]] = None,
+    ) -> Dict:
+        """
+        Poll a describe call with backoff until ready, like ResourceWaiter.wait.
+
+        Raises:
+            ResourceFailedException: If the resource reaches a failed status
+            WaiterTimeoutException: If the resource is not ready before timeout
+        """
+        timeout = ResourceWaiter.TIMEOUTS[resource_type]
+        deadline = time.monotonic() + timeout
+        delay = ResourceWaiter.INITIAL_DELAY
+        attempt = 0
+
+        while True:
+            attempt += 1
+            try:
+                response = await describe()
+                if is_failed and is_failed(response):
+                    reasons = response.get("failureReasons", [])
+                    raise ResourceFailedException(
+                        f"{resource_name} reached a failed status: {reasons}"
+                    )
+                if is_ready(response):
+                    return response
+            except ResourceFailedException:
+                raise
+            except Exception as e:
+                if _error_code(e) not in RETRYABLE_ERROR_CODES:
+                    raise
+                logger.debug(f"{resource_name} not ready (attempt {attempt}): {e}")
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise WaiterTimeoutException(
+                    f"{resource_name} not ready after {timeout} seconds "
+                    f"({attempt} attempts)"
+                )
+            await asyncio.sleep(min(random.uniform(delay / 2, delay), remaining))
+            delay = min(delay * ResourceWaiter.BACKOFF_FACTOR, ResourceWaiter.MAX_DELAY)
+
+    async def _wait_for_status(
+        self,
+        resource_type: str,
+        resource_name: str,
+        describe: Callable[[], Awaitable[Dict]],
+        status_key: str,
+        ready_statuses: Iterable[str],
+    ) -> Dict:
+        """Wait for a status field of a describe_* response to reach a ready value"""
+        ready_statuses = tuple(ready_statuses)
+        return await self._wait(
+            resource_type,
+            resource_name,
+            describe,
+            lambda response: response.get(status_key) in ready_statuses,
+            lambda response: response.get(status_key) == "Failed",
+        )
+
+    async def _wait_for_locale(
+        self, locale_id: str, ready_statuses: Iterable[str], resource_type: str
+    ) -> Dict:
+        return await self._wait_for_status(
+            resource_type,
+            f"Locale {locale_id}",
+            lambda: self.lex.describe_bot_locale(
+                botId=self.bot_id, botVersion="DRAFT", localeId=locale_id
+            ),
+            "botLocaleStatus",
+            ready_statuses,
+        )
+
+    async def _create_bot(self) -> str:
+        """Create the bot and wait until it is Available"""
+        config = self.bot_config
+        role_arn = config.roleArn
+        if not role_arn:
+            if self.iam is None:
+                raise AsyncBotCreationException("No roleArn and no IAM client given")
+            response = await self.iam.create_service_linked_role(
+                **_build_service_role_params(config.name)
+            )
+            role_arn = response["Role"]["Arn"]
+
+        response = await self.lex.create_bot(
+            **CreateBotInstance._build_bot_settings(
+                config.name,
+                config.description,
+                role_arn,
+                config.idleSessionTTLInSeconds,
+                config.dataPrivacy.childDirected,
+                {"name": config.name, "created_time": datetime.now().isoformat()},
+            )
+        )
+        bot_id = response["botId"]
+        await self._wait_for_status(
+            "bot",
+            f"Bot {bot_id}",
+            lambda: self.lex.describe_bot(botId=bot_id),
+            "botStatus",
+            ("Available",),
+        )
+        logger.info(f"Bot created: {config.name} ({bot_id})")
+        return bot_id
+
+    async def _create_slot_type(self, locale_id: str, slot) -> str:
+        """Create a custom or extended slot type and wait until it is visible"""
+        if slot.type == "Custom":
+            # Values may be streamed from a catalog file
+            values = await asyncio.to_thread(
+                slot_type_values, slot.slotType, self.bot_config.template_dir
+            )
+            params = CreateBotSlotsType._build_slot_type_params(
+                self.bot_id,
+                "DRAFT",
+                locale_id,
+                slot.name,
+                slot.description,
+                slot.slotType.resolutionStrategy,
+                slot_type_values=values,
+            )
+        else:
+            params = CreateBotSlotsType._build_slot_type_params(
+                self.bot_id,
+                "DRAFT",
+                locale_id,
+                slot.name,
+                slot.description,
+                slot.slotType.resolutionStrategy,
+                parent_slot_type_signature=(
+                    slot.slotType.parentSlotTypeSignature
+                    or CreateBotSlotsType.DEFAULT_PARENT_SLOT_TYPE
+                ),
+                regex_pattern=slot.slotType.regexPattern,
+            )
+
+        slot_type_id = (await self.lex.create_slot_type(**params))["slotTypeId"]
+        await self._wait(
+            "slot_type",
+            f"Slot type {slot_type_id}",
+            lambda: self.lex.describe_slot_type(
+                slotTypeId=slot_type_id,
+                botId=self.bot_id,
+                botVersion="DRAFT",
+                localeId=locale_id,
+            ),
+            lambda response: True,
+        )
+        return slot_type_id
+
+    def _intent_params(self, locale_id: str, intent) -> Dict:
+        """Full DRAFT definition of an intent, as the sync builder sends it"""
+        return CreateBotIntent._build_intent_params(
+            self.bot_id,
+            "DRAFT",
+            locale_id,
+            intent.name,
+            intent.description,
+            intent.sampleUtterances,
+            intent.codeHook,
+        )
+
+    async def _create_intent(self, locale_id: str, intent) -> str:
+        """Create an intent and wait until it is visible"""
+        response = await self.lex.create_intent(
+            **self._intent_params(locale_id, intent)
+        )
+        intent_id = response["intentId"]
+        await self._wait(
+            "intent",
+            f"Intent {intent_id}",
+            lambda: self.lex.describe_intent(
+                intentId=intent_id,
+                botId=self.bot_id,
+                botVersion="DRAFT",
+                localeId=locale_id,
+            ),
+            lambda response: True,
+        )
+        return intent_id
+
+    async def _create_slot(
+        self,
+        locale_id: str,
+        slot,
+        intent_task: Awaitable[str],
+        slot_type_task: Optional[Awaitable[str]],
+    ) -> str:
+        """Create a slot as soon as its intent and slot type exist"""
+        intent_id = await intent_task
+        slot_type_id = await slot_type_task if slot_type_task else slot.slotTypeId
+        response = await self.lex.create_slot(
+            **CreateBotIntent._build_slot_params(
+                self.bot_id,
+                "DRAFT",
+                locale_id,
+                intent_id,
+                slot.slotPhraseName,
+                slot_type_id,
+                slot.slotConstraint,
+            )
+        )
+        slot_id = response["slotId"]
+        await self._wait(
+            "slot",
+            f"Slot {slot_id}",
+            lambda: self.lex.describe_slot(
+                slotId=slot_id,
+                botId=self.bot_id,
+                botVersion="DRAFT",
+                localeId=locale_id,
+                intentId=intent_id,
+            ),
+            lambda response: True,
+        )
+        return slot_id
+
+    async def _update_slot_priorities(
+        self,
+        locale_id: str,
+        intent,
+        intent_task: Awaitable[str],
+        slot_tasks: List[tuple],
+    ) -> None:
+        """Send the full intent definition with its slot priorities"""
+        intent_id = await intent_task
+        slot_ids = await gather_or_cancel(task for task, _ in slot_tasks)
+        await self.lex.update_intent(
+            intentId=intent_id,
+            slotPriorities=CreateBotIntent._build_slot_priorities(
+                [
+                    {"slotId": slot_id, "priority": priority}
+                    for slot_id, (_, priority) in zip(slot_ids, slot_tasks)
+                ]
+            ),
+            **self._intent_params(locale_id, intent),
+        )
+
+    async def _deploy_locale(self, locale) -> Dict[str, Dict[str, str]]:
+        """
+        Provision and build one locale.
+
+        Slot types and intents start together once the locale exists; each
+        slot starts as soon as its own intent and slot type are created.
+
+        Returns:
+            {"slotTypes": {name: id}, "intents": {name: id}}
+        """
+        locale_id = locale.localeId
+        # Read an include file off the event loop
+        await asyncio.to_thread(locale.load)
+        await self.lex.create_bot_locale(
+            **CreateBuildBotLocale._build_locale_settings(
+                self.bot_id,
+                locale_id,
+                locale.nluIntentConfidenceThreshold,
+                locale.voiceSettings.voiceId,
+                locale.voiceSettings.engine,
+            )
+        )
+        await self._wait_for_locale(locale_id, ("NotBuilt",), "bot_locale")
+
+        slot_type_tasks = {
+            slot.name: asyncio.ensure_future(self._create_slot_type(locale_id, slot))
+            for slot in locale.slotDefinitions
+            if slot.type in ("Custom", "Extended")
+        }
+        intent_tasks = {
+            intent.name: asyncio.ensure_future(self._create_intent(locale_id, intent))
+            for intent in locale.intents
+        }
+
+        intent_slot_tasks = {name: [] for name in intent_tasks}
+        for slot in locale.slotDefinitions:
+            if slot.intent not in intent_tasks:
+                logger.warning(
+                    f"Slot '{slot.name}' references non-existent intent "
+                    f"'{slot.intent}'. Skipping."
+                )
+                continue
+            slot_task = asyncio.ensure_future(
+                self._create_slot(
+                    locale_id,
+                    slot,
+                    intent_tasks[slot.intent],
+                    slot_type_tasks.get(slot.name),
+                )
+            )
+            intent_slot_tasks[slot.intent].append((slot_task, slot.priority))
+
+        pending = [*slot_type_tasks.values(), *intent_tasks.values()]
+        for intent in locale.intents:
+            slot_tasks = intent_slot_tasks[intent.name]
+            if not slot_tasks:
+                continue
+            pending.extend(task for task, _ in slot_tasks)
+            pending.append(
+                self._update_slot_priorities(
+                    locale_id, intent, intent_tasks[intent.name], slot_tasks
+                )
+            )
+        await gather_or_cancel(pending)
+
+        await self.lex.build_bot_locale(
+            botId=self.bot_id, botVersion="DRAFT", localeId=locale_id
+        )
+        await self._wait_for_locale(locale_id, ("Built",), "bot_locale_build")
+        logger.info(f"Locale {locale_id} built")
+
+        return {
+            "slotTypes": {
+                name: task.result() for name, task in slot_type_tasks.items()
+            },
+            "intents": {name: task.result() for name, task in intent_tasks.items()},
+        }
+
+    async def _deploy_locale_bounded(
+        self, locale, semaphore: asyncio.Semaphore
+    ) -> Dict[str, Dict[str, str]]:
+        """Provision a locale once a slot is free, then release its include"""
+        async with semaphore:
+            try:
+                return await self._deploy_locale(locale)
+            finally:
+                locale.release()
+
+    async def _create_version(self) -> str:
+        """Create a version from the DRAFT locales and wait until it is Available"""
+        response = await self.lex.create_bot_version(
+            botId=self.bot_id,
+            description="First bot version 1 based on DRAFT",
+            botVersionLocaleSpecification=CreateBotVersion._build_locale_specification(
+                [{locale.localeId: "DRAFT"} for locale in self.bot_config.locale]
+            ),
+        )
+        bot_version = response["botVersion"]
+        await self._wait_for_status(
+            "bot_version",
+            f"Bot version {bot_version}",
+            lambda: self.lex.describe_bot_version(
+                botId=self.bot_id, botVersion=bot_version
+            ),
+            "botStatus",
+            ("Available",),
+        )
+        return bot_version
+
+    async def _create_alias(self, bot_version: str) -> str:
+        """Create the alias and point it at the version"""
+        alias = self.bot_config.alias
+        response = await self.lex.create_bot_alias(
+            botId=self.bot_id,
+            botAliasName=alias.name,
+            description=alias.description,
+        )
+        bot_alias_id = response["botAliasId"]
+
+        def describe_alias() -> Awaitable[Dict]:
+            return self.lex.describe_bot_alias(
+                botId=self.bot_id, botAliasId=bot_alias_id
+            )
+
+        await self._wait_for_status(
+            "bot_alias",
+            f"Bot alias {bot_alias_id}",
+            describe_alias,
+            "botAliasStatus",
+            ("Available",),
+        )
+
+        await self.lex.update_bot_alias(
+            botAliasName=alias.name,
+            botId=self.bot_id,
+            botVersion=bot_version,
+            botAliasId=bot_alias_id,
+            botAliasLocaleSettings=CreateBotAlias._build_locale_settings(
+                [
+                    {
+                        "Locale": locale.localeId,
+                        "Lambda_arn": locale.lambdaHooks.arn,
+                        "codeHookInterfaceVersion": locale.lambdaHooks.codeHookInterfaceVersion,
+                    }
+                    for locale in self.bot_config.locale
+                ]
+            ),
+        )
+        await self._wait_for_status(
+            "bot_alias",
+            f"Bot alias {bot_alias_id}",
+            describe_alias,
+            "botAliasStatus",
+            ("Available",),
+        )
+        return bot_alias_id
+
+    async def deploy(self) -> Dict[str, Any]:
+        """
+        Run the full provisioning workflow.
+
+        Returns:
+            Bot ID, version, alias ID and per-locale resource IDs
+
+        Raises:
+            AsyncBotCreationException: If any step fails
+        """
+        name = self.bot_config.name
+        try:
+            logger.info(f"Starting async creation of bot {name}")
+            self.bot_id = await self._create_bot()
+            semaphore = asyncio.Semaphore(self.MAX_LOCALE_TASKS)
+            locale_results = await gather_or_cancel(
+                self._deploy_locale_bounded(locale, semaphore)
+                for locale in self.bot_config.locale
+            )
+            bot_version = await self._create_version()
+            bot_alias_id = await self._create_alias(bot_version)
+        except Exception as e:
+            logger.error(f"Async creation of bot {name} failed: {e}")
+            raise AsyncBotCreationException(f"Bot {name} creation failed: {e}") from e
+
+        logger.info(f"Bot {name} ready: {self.bot_id} version {bot_version}")
+        return {
+            "botId": self.bot_id,
+            "botVersion": bot_version,
+            "botAliasId": bot_alias_id,
+            "locales": {
+                locale.localeId: result
+                for locale, result in zip(self.bot_config.locale, locale_results)
+            },
+        }
+
+
+async def deploy(bot_config) -> Dict[str, Any]:
+    """
+    Deploy a bot template with the asyncio engine.
+
+    Several templates can be deployed concurrently from one event loop:
+
+        results = await asyncio.gather(deploy(config_a), deploy(config_b))
+
+    Args:
+        bot_config: Bot template namespace, as loaded from bot_template.yaml
+
+    Returns:
+        Bot ID, version, alias ID and per-locale resource IDs
+    """
+    async with async_aws_client("lexv2-models", bot_config.region) as lex:
+        if bot_config.roleArn:
+            return await AsyncCreateUniversalBot(bot_config, lex).deploy()
+        async with async_aws_client("iam") as iam:
+            return await AsyncCreateUniversalBot(bot_config, lex, iam).deploy()
@@ -1,6 +1,6 @@
 from bot_engine.builder.bot_base import BotBase
+from bot_engine.builder.resource_waiter import ResourceWaiter
 import logging
-import time
 from typing import Dict, List
 
 
@@ -48,8 +48,7 @@ class CreateBotAlias(BotBase):
 
             alias_id = response.get("botAliasId")
             logger.info(f"Bot alias created: {self.alias_name} ({alias_id})")
-            logger.debug("Waiting 10 seconds for AWS Lex to process...")
-            time.sleep(10)
+            ResourceWaiter().wait_for_bot_alias(self.bot_id, alias_id)
             return alias_id
 
         except Exception as e:
@@ -96,8 +95,7 @@ class CreateBotAlias(BotBase):
             )
 
             logger.info(f"Bot alias updated: {bot_alias_id}")
-            logger.debug("Waiting 10 seconds for AWS Lex to process...")
-            time.sleep(10)
+            ResourceWaiter().wait_for_bot_alias(self.bot_id, bot_alias_id)
             return response
 
         except Exception as e:
@@ -0,0 +1,229 @@
+import base64
+import hashlib
+import io
+import json
+import logging
+import zipfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from bot_engine.builder.intent_builder import CreateBotIntent
+from bot_engine.builder.slots_type_builder import CreateBotSlotsType
+from bot_engine.utils.slot_value_catalog import slot_type_values
+
+
+logger = logging.getLogger(__name__)
+
+
+class BotArchiveException(Exception):
+    """Exception for templates that cannot be compiled into an import archive"""
+
+    pass
+
+
+class BotArchiveCompiler:
+    """
+    Compiles a bot_config namespace into a Lex V2 bot import archive.
+
+    The archive uses the LexJson layout:
+
+        Manifest.json
+        <BotName>/Bot.json
+        <BotName>/BotLocales/<localeId>/BotLocale.json
+        <BotName>/BotLocales/<localeId>/SlotTypes/<name>/SlotType.json
+        <BotName>/BotLocales/<localeId>/Intents/<name>/Intent.json
+        <BotName>/BotLocales/<localeId>/Intents/<name>/Slots/<name>/Slot.json
+
+    Output is deterministic (sorted keys, fixed timestamps and identifiers),
+    so a compiled archive can be compared byte-for-byte or file-by-file
+    against golden files without touching AWS.
+    """
+
+    MANIFEST = {
+        "metadata": {
+            "schemaVersion": "1",
+            "fileFormat": "LexJson",
+            "resourceType": "Bot",
+        }
+    }
+    FALLBACK_INTENT = "FallbackIntent"
+    ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+    def __init__(self, bot_config):
+        self.bot_config = bot_config
+
+    @staticmethod
+    def _identifier(*parts: str) -> str:
+        """Stable 10-character resource identifier derived from its path"""
+        digest = hashlib.sha1("/".join(parts).encode("utf-8")).digest()
+        return base64.b32encode(digest).decode("ascii")[:10]
+
+    def _compile_slot_type(self, locale_id: str, slot) -> Dict:
+        if slot.type == "Custom":
+            values = slot_type_values(slot.slotType, self.bot_config.template_dir)
+            regex_pattern = None
+            parent_slot_type_signature = None
+        else:
+            values = []
+            regex_pattern = slot.slotType.regexPattern
+            parent_slot_type_signature = slot.slotType.parentSlotTypeSignature
+
+        return {
+            "name": slot.name,
+            "identifier": self._identifier(locale_id, "SlotTypes", slot.name),
+            "description": slot.description,
+            "parentSlotTypeSignature": parent_slot_type_signature,
+            "slotTypeValues": values,
+            "valueSelectionSetting": CreateBotSlotsType._build_value_selection_setting(
+                slot.slotType.resolutionStrategy, regex_pattern
+            ),
+        }
+
+    def _compile_slot(self, locale_id: str, slot) -> Dict:
+        slot_type_name = slot.name if slot.type in ("Custom", "Extended") else None
+        return {
+            "name": slot.slotPhraseName,
+            "identifier": self._identifier(
+                locale_id, "Intents", slot.intent, "Slots", slot.slotPhraseName
+            ),
+            "description": getattr(slot, "description", None),
+            "slotTypeName": slot_type_name or slot.slotTypeId,
+            "valueElicitationSetting": {"slotConstraint": slot.slotConstraint},
+        }
+
+    def _compile_intent(self, locale_id: str, intent, slots: List) -> Dict:
+        unprioritised = [slot.name for slot in slots if slot.priority is None]
+        if unprioritised:
+            # The import API rejects a slotPriorities entry without a priority
+            raise BotArchiveException(
+                f"Slot(s) {', '.join(unprioritised)} of intent '{intent.name}' "
+                f"need a priority"
+            )
+        intent_json = {
+            "name": intent.name,
+            "identifier": self._identifier(locale_id, "Intents", intent.name),
+            "description": intent.description,
+            "parentIntentSignature": None,
+            "sampleUtterances": [{"utterance": u} for u in intent.sampleUtterances],
+            "slotPriorities": [
+                {"priority": slot.priority, "slotName": slot.slotPhraseName}
+                for slot in slots
+            ],
+        }
+        intent_json.update(
+            CreateBotIntent._build_intent_definition(intent.codeHook or [])
+        )
+        return intent_json
+
+    def _compile_fallback_intent(self, locale_id: str) -> Dict:
+        return {
+            "name": self.FALLBACK_INTENT,
+            "identifier": self._identifier(locale_id, "Intents", self.FALLBACK_INTENT),
+            "description": "Default intent when no other intent matches",
+            "parentIntentSignature": "AMAZON.FallbackIntent",
+            "sampleUtterances": [],
+            "slotPriorities": [],
+        }
+
+    def compile(self) -> Dict[str, Dict]:
+        """
+        Compile the template into archive documents.
+
+        Returns:
+            Mapping of archive path to JSON document
+
+        Raises:
+            BotArchiveException: If a slot references an unknown intent or
+                has no priority
+        """
+        bot = self.bot_config
+        root = bot.name
+        files = {
+            "Manifest.json": self.MANIFEST,
+            f"{root}/Bot.json": {
+                "name": bot.name,
+                "version": "DRAFT",
+                "description": bot.description,
+                "dataPrivacy": {"childDirected": bot.dataPrivacy.childDirected},
+                "idleSessionTTLInSeconds": bot.idleSessionTTLInSeconds,
+            },
+        }
+
+        for locale in bot.locale:
+            locale_id = locale.localeId
+            locale_dir = f"{root}/BotLocales/{locale_id}"
+            files[f"{locale_dir}/BotLocale.json"] = {
+                "name": locale_id,
+                "identifier": locale_id,
+                "version": None,
+                "description": f"Bot: {bot.name}, Locale: {locale_id}",
+                "voiceSettings": {
+                    "voiceId": locale.voiceSettings.voiceId,
+                    "engine": locale.voiceSettings.engine,
+                },
+                "nluConfidenceThreshold": locale.nluIntentConfidenceThreshold,
+            }
+
+            intent_slots = {intent.name: [] for intent in locale.intents}
+            for slot in locale.slotDefinitions:
+                if slot.intent not in intent_slots:
+                    raise BotArchiveException(
+                        f"Slot '{slot.name}' references non-existent intent "
+                        f"'{slot.intent}'"
+                    )
+                intent_slots[slot.intent].append(slot)
+
+                if slot.type in ("Custom", "Extended"):
+                    files[f"{locale_dir}/SlotTypes/{slot.name}/SlotType.json"] = (
+                        self._compile_slot_type(locale_id, slot)
+                    )
+
+            for intent in locale.intents:
+                intent_dir = f"{locale_dir}/Intents/{intent.name}"
+                files[f"{intent_dir}/Intent.json"] = self._compile_intent(
+                    locale_id, intent, intent_slots[intent.name]
+                )
+                for slot in intent_slots[intent.name]:
+                    files[f"{intent_dir}/Slots/{slot.slotPhraseName}/Slot.json"] = (
+                        self._compile_slot(locale_id, slot)
+                    )
+
+            files[f"{locale_dir}/Intents/{self.FALLBACK_INTENT}/Intent.json"] = (
+                self._compile_fallback_intent(locale_id)
+            )
+
+        logger.info(f"Compiled {len(files)} archive files for bot {bot.name}")
+        return files
+
+    @staticmethod
+    def _dumps(document: Dict) -> bytes:
+        return (json.dumps(document, indent=2, sort_keys=True) + "\n").encode("utf-8")
+
+    def to_zip_bytes(self, files: Optional[Dict[str, Dict]] = None) -> bytes:
+        """Build the import archive as deterministic zip bytes"""
+        files = files or self.compile()
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+            for path in sorted(files):
+                info = zipfile.ZipInfo(path, self.ZIP_DATE_TIME)
+                info.compress_type = zipfile.ZIP_DEFLATED
+                archive.writestr(info, self._dumps(files[path]))
+        return buffer.getvalue()
+
+    def write_directory(self, output_dir: Path) -> List[Path]:
+        """
+        Write the archive contents as plain files, e.g. to refresh golden files.
+
+        Args:
+            output_dir: Directory to write into
+
+        Returns:
+            Paths of the written files
+        """
+        written = []
+        for path, document in sorted(self.compile().items()):
+            target = Path(output_dir) / path
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(self._dumps(document))
+            written.append(target)
+        return written
@@ -1,36 +1,129 @@
 import logging
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Iterator, Optional
 
 from common.lex_v2_client import lex_v2_client
+from common.rate_limiter import RateLimitedClient
 
 
 logger = logging.getLogger(__name__)
 
 
+class BotBaseException(Exception):
+    """Exception for builders used without a bot context"""
+
+    pass
+
+
+class BotContext:
+    """Configuration and AWS client of the one bot a group of builders works on"""
+
+    def __init__(
+        self,
+        bot_name: str,
+        description: str,
+        region_name: str,
+        lex_client=None,
+        cancel_event: Optional[threading.Event] = None,
+    ):
+        """
+        Args:
+            bot_name: Name of the bot
+            description: Bot description
+            region_name: AWS region of the bot
+            lex_client: Lex V2 models client (the rate-limited shared client
+                for the region if not given)
+            cancel_event: Optional event that stops every resource wait of
+                the bot's builders once set, e.g. when its plan fails
+        """
+        self.bot_name = bot_name
+        self.description = description
+        self.region_name = region_name
+        self.cancel_event = cancel_event
+        self.lex_client = lex_client or RateLimitedClient(lex_v2_client(region_name))
+        self.tags: Dict[str, str] = {
+            "name": bot_name,
+            "created_time": datetime.now().isoformat(),
+        }
+
+    def __repr__(self) -> str:
+        return f"BotContext({self.bot_name}, {self.region_name})"
+
+
+# Context of the bot being built by the current thread or task, if any
+_CURRENT_CONTEXT: ContextVar[Optional[BotContext]] = ContextVar(
+    "bot_context", default=None
+)
+
+
 class BotBase:
-    """Base class for bot builders with shared AWS Lex client and configuration"""
+    """
+    Base class for bot builders with shared AWS Lex client and configuration.
+
+    Each builder binds the bot context current when it is created: the one
+    entered with use_context(), or else the process-wide context from
+    set_base(). Builders of different bots can therefore run side by side
+    in one process, as long as each bot is built inside its own context.
+    """
 
-    BOT_NAME: str = ""
-    DESCRIPTION: str = ""
-    LEX_CLIENT = None
-    BOT_TAGS: Dict[str, str] = {}
+    _default_context: Optional[BotContext] = None
+
+    def __new__(cls, *args, **kwargs):
+        builder = super().__new__(cls)
+        builder.context = cls.current_context()
+        return builder
 
     @classmethod
     def set_base(cls, bot_name: str, description: str, region_name: str) -> None:
-        """Initialize base configuration and AWS clients"""
+        """Initialize the process-wide base configuration and AWS clients"""
         try:
             logger.info(
                 f"Initializing BotBase with name: {bot_name}, region: {region_name}"
             )
-            cls.BOT_NAME = bot_name
-            cls.DESCRIPTION = description
-            cls.LEX_CLIENT = lex_v2_client(region_name)
-            cls.BOT_TAGS = {
-                "name": bot_name,
-                "created_time": datetime.now().isoformat(),
-            }
+            BotBase._default_context = BotContext(bot_name, description, region_name)
             logger.info("BotBase initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize BotBase: {e}")
             raise
+
+    @staticmethod
+    def current_context() -> Optional[BotContext]:
+        """Context new builders bind to, if any"""
+        return _CURRENT_CONTEXT.get() or BotBase._default_context
+
+    @staticmethod
+    @contextmanager
+    def use_context(context: BotContext) -> Iterator[BotContext]:
+        """Build the given bot with every builder created in the block"""
+        token = _CURRENT_CONTEXT.set(context)
+        try:
+            yield context
+        finally:
+            _CURRENT_CONTEXT.reset(token)
+
+    def _bound_context(self) -> BotContext:
+        if self.context is None:
+            raise BotBaseException(
+                f"{type(self).__name__} created outside a bot context; "
+                f"call BotBase.set_base or use BotBase.use_context first"
+            )
+        return self.context
+
+    @property
+    def BOT_NAME(self) -> str:
+        return self._bound_context().bot_name
+
+    @property
+    def DESCRIPTION(self) -> str:
+        return self._bound_context().description
+
+    @property
+    def LEX_CLIENT(self):
+        return self._bound_context().lex_client
+
+    @property
+    def BOT_TAGS(self) -> Dict[str, str]:
+        return self._bound_context().tags
@@ -0,0 +1,214 @@
+import logging
+from typing import Callable, Dict, List, Optional
+
+from bot_engine.builder.bot_base import BotBase
+
+
+logger = logging.getLogger(__name__)
+
+
+class BotInspectionException(Exception):
+    """Exception for failures while reading a live bot"""
+
+    pass
+
+
+class BotInspector(BotBase):
+    """Reads the live definition of an existing bot"""
+
+    @staticmethod
+    def _paginate(method: Callable, result_key: str, **kwargs) -> List[Dict]:
+        """Collect every page of a Lex list_* call"""
+        items = []
+        while True:
+            response = method(**kwargs)
+            items.extend(response.get(result_key, []))
+            next_token = response.get("nextToken")
+            if not next_token:
+                return items
+            kwargs["nextToken"] = next_token
+
+    def find_bot_id(self, bot_name: str) -> Optional[str]:
+        """
+        Look up a bot ID by bot name.
+
+        Args:
+            bot_name: Bot name
+
+        Returns:
+            Bot ID, or None if no bot has that name
+        """
+        try:
+            summaries = self._paginate(
+                self.LEX_CLIENT.list_bots,
+                "botSummaries",
+                filters=[{"name": "BotName", "values": [bot_name], "operator": "EQ"}],
+            )
+            for summary in summaries:
+                if summary.get("botName") == bot_name:
+                    return summary.get("botId")
+            return None
+        except Exception as e:
+            logger.error(f"Failed to look up bot {bot_name}: {e}")
+            raise BotInspectionException(f"Bot lookup failed: {e}") from e
+
+    def find_alias_id(self, bot_id: str, alias_name: str) -> Optional[str]:
+        """Look up a bot alias ID by alias name"""
+        try:
+            summaries = self._paginate(
+                self.LEX_CLIENT.list_bot_aliases,
+                "botAliasSummaries",
+                botId=bot_id,
+            )
+            for summary in summaries:
+                if summary.get("botAliasName") == alias_name:
+                    return summary.get("botAliasId")
+            return None
+        except Exception as e:
+            logger.error(f"Failed to look up alias {alias_name}: {e}")
+            raise BotInspectionException(f"Alias lookup failed: {e}") from e
+
+    def _find_child_id(
+        self,
+        kind: str,
+        name: str,
+        method: Callable,
+        result_key: str,
+        **scope,
+    ) -> Optional[str]:
+        """Look up the ID of a slot type, intent or slot by name"""
+        # e.g. summaries carry "slotTypeName", filters name "SlotTypeName"
+        name_key = f"{kind}Name"
+        filter_name = name_key[0].upper() + name_key[1:]
+        try:
+            summaries = self._paginate(
+                method,
+                result_key,
+                filters=[{"name": filter_name, "values": [name], "operator": "EQ"}],
+                **scope,
+            )
+            for summary in summaries:
+                if summary.get(name_key) == name:
+                    return summary.get(f"{kind}Id")
+            return None
+        except Exception as e:
+            logger.error(f"Failed to look up {kind} {name}: {e}")
+            raise BotInspectionException(f"{kind} lookup failed: {e}") from e
+
+    def find_slot_type_id(
+        self, bot_id: str, locale_id: str, slot_type_name: str
+    ) -> Optional[str]:
+        """Look up a DRAFT slot type ID by slot type name"""
+        return self._find_child_id(
+            "slotType",
+            slot_type_name,
+            self.LEX_CLIENT.list_slot_types,
+            "slotTypeSummaries",
+            botId=bot_id,
+            botVersion="DRAFT",
+            localeId=locale_id,
+        )
+
+    def find_intent_id(
+        self, bot_id: str, locale_id: str, intent_name: str
+    ) -> Optional[str]:
+        """Look up a DRAFT intent ID by intent name"""
+        return self._find_child_id(
+            "intent",
+            intent_name,
+            self.LEX_CLIENT.list_intents,
+            "intentSummaries",
+            botId=bot_id,
+            botVersion="DRAFT",
+            localeId=locale_id,
+        )
+
+    def find_slot_id(
+        self, bot_id: str, locale_id: str, intent_id: str, slot_name: str
+    ) -> Optional[str]:
+        """Look up a DRAFT slot ID of an intent by slot name"""
+        return self._find_child_id(
+            "slot",
+            slot_name,
+            self.LEX_CLIENT.list_slots,
+            "slotSummaries",
+            botId=bot_id,
+            botVersion="DRAFT",
+            localeId=locale_id,
+            intentId=intent_id,
+        )
+
+    def describe_bot_locale(self, bot_id: str, locale_id: str) -> Optional[Dict]:
+        """Return the DRAFT locale settings, or None if the locale does not exist"""
+        summaries = self._paginate(
+            self.LEX_CLIENT.list_bot_locales,
+            "botLocaleSummaries",
+            botId=bot_id,
+            botVersion="DRAFT",
+        )
+        if locale_id not in {summary.get("localeId") for summary in summaries}:
+            return None
+        return self.LEX_CLIENT.describe_bot_locale(
+            botId=bot_id, botVersion="DRAFT", localeId=locale_id
+        )
+
+    def describe_locale_resources(self, bot_id: str, locale_id: str) -> Dict:
+        """
+        Read the slot types, intents and slots of a DRAFT locale.
+
+        Built-in intents such as AMAZON.FallbackIntent are left out.
+
+        Args:
+            bot_id: Bot ID
+            locale_id: Locale ID
+
+        Returns:
+            {"slotTypes": {name: describe_slot_type response},
+             "intents": {name: describe_intent response with a "slots" mapping
+                         of slot name to describe_slot response}}
+
+        Raises:
+            BotInspectionException: If reading the locale fails
+        """
+        scope = {"botId": bot_id, "botVersion": "DRAFT", "localeId": locale_id}
+        try:
+            logger.info(f"Reading live resources of locale {locale_id}")
+            slot_types = {}
+            for summary in self._paginate(
+                self.LEX_CLIENT.list_slot_types, "slotTypeSummaries", **scope
+            ):
+                slot_types[summary["slotTypeName"]] = (
+                    self.LEX_CLIENT.describe_slot_type(
+                        slotTypeId=summary["slotTypeId"], **scope
+                    )
+                )
+
+            intents = {}
+            for summary in self._paginate(
+                self.LEX_CLIENT.list_intents, "intentSummaries", **scope
+            ):
+                if summary.get("parentIntentSignature"):
+                    continue
+                intent = self.LEX_CLIENT.describe_intent(
+                    intentId=summary["intentId"], **scope
+                )
+                intent["slots"] = {
+                    slot_summary["slotName"]: self.LEX_CLIENT.describe_slot(
+                        slotId=slot_summary["slotId"],
+                        intentId=summary["intentId"],
+                        **scope,
+                    )
+                    for slot_summary in self._paginate(
+                        self.LEX_CLIENT.list_slots,
+                        "slotSummaries",
+                        intentId=summary["intentId"],
+                        **scope,
+                    )
+                }
+                intents[summary["intentName"]] = intent
+
+            return {"slotTypes": slot_types, "intents": intents}
+
+        except Exception as e:
+            logger.error(f"Failed to read locale {locale_id}: {e}")
+            raise BotInspectionException(f"Locale inspection failed: {e}") from e
@@ -0,0 +1,85 @@
+import logging
+from typing import Dict, List
+
+from bot_engine.builder.alias_builder import CreateBotAlias
+from bot_engine.builder.bot_base import BotBase
+from bot_engine.builder.bot_inspector import BotInspector
+from bot_engine.builder.build_monitor import BuildMonitor
+from bot_engine.builder.locale_builder import CreateBuildBotLocale
+from bot_engine.builder.version_builder import CreateBotVersion
+from bot_engine.utils.concurrency import run_concurrently
+
+
+logger = logging.getLogger(__name__)
+
+
+class PublishBot(BotBase):
+    """Builds DRAFT locales and publishes them as a version behind an alias"""
+
+    MAX_BUILD_WORKERS = 4
+
+    def __init__(self, bot_id: str):
+        self.bot_id = bot_id
+
+    def build_locales(self, locale_ids: List[str]) -> None:
+        """
+        Start every DRAFT locale build, then wait until all of them are Built.
+
+        Args:
+            locale_ids: Locales to build
+
+        Raises:
+            ConcurrentTaskException: If any build cannot be started
+            LocaleBuildFailedException: If any build fails
+            WaiterTimeoutException: If builds are still running at the deadline
+        """
+        tasks = {
+            locale_id: (
+                lambda locale_id=locale_id: CreateBuildBotLocale(
+                    self.bot_id, locale_id
+                ).build_bot_locale("DRAFT")
+            )
+            for locale_id in locale_ids
+        }
+        run_concurrently(tasks, self.MAX_BUILD_WORKERS)
+        BuildMonitor().wait_for_builds(self.bot_id, locale_ids)
+
+    def publish(
+        self,
+        version_description: str,
+        alias_name: str,
+        alias_description: str,
+        alias_locale_settings_list: List[Dict[str, str]],
+    ) -> str:
+        """
+        Create a version from DRAFT and point the alias at it.
+
+        The alias is created if it does not exist yet.
+
+        Args:
+            version_description: Version description
+            alias_name: Alias name
+            alias_description: Alias description
+            alias_locale_settings_list: List of locale settings for the alias
+
+        Returns:
+            Bot version string
+
+        Raises:
+            BotCreationException: If version or alias creation fails
+        """
+        bot_version = CreateBotVersion(self.bot_id).create_bot_version(
+            version_description,
+            [{setting["Locale"]: "DRAFT"} for setting in alias_locale_settings_list],
+        )
+
+        alias_builder = CreateBotAlias(self.bot_id, alias_name, alias_description)
+        bot_alias_id = BotInspector().find_alias_id(self.bot_id, alias_name)
+        if bot_alias_id is None:
+            bot_alias_id = alias_builder.create_bot_alias()
+
+        alias_builder.update_bot_alias(
+            bot_alias_id, bot_version, alias_locale_settings_list
+        )
+        logger.info(f"Alias {alias_name} now points to version {bot_version}")
+        return bot_version
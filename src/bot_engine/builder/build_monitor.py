@@ -0,0 +1,90 @@
+import logging
+import threading
+from typing import Dict, Iterable, Optional
+
+from bot_engine.builder.bot_base import BotBase
+from bot_engine.builder.polling_scheduler import (
+    POLLING_SCHEDULER,
+    ResourceFailedException,
+)
+from bot_engine.builder.resource_waiter import ResourceWaiter
+
+
+logger = logging.getLogger(__name__)
+
+
+class LocaleBuildFailedException(ResourceFailedException):
+    """Exception for locale builds that end in the Failed status"""
+
+    def __init__(self, locale_id: str, failure_reasons):
+        super().__init__(f"Locale {locale_id} build failed: {failure_reasons}")
+        self.locale_id = locale_id
+        self.failure_reasons = failure_reasons
+
+
+class BuildMonitor(BotBase):
+    """
+    Tracks several locale builds at once.
+
+    Every locale is registered with the shared polling scheduler, so each
+    keeps its own backoff while all of them are polled in the same ticks,
+    and one slow build does not delay noticing that another finished or
+    failed.
+    """
+
+    BUILT_STATUSES = ("Built",)
+    FAILED_STATUSES = ("Failed",)
+
+    def wait_for_builds(
+        self,
+        bot_id: str,
+        locale_ids: Iterable[str],
+        bot_version: str = "DRAFT",
+        cancel_event: Optional[threading.Event] = None,
+    ) -> Dict[str, Dict]:
+        """
+        Wait until every locale build reaches Built.
+
+        Args:
+            bot_id: Bot ID
+            locale_ids: Locales whose builds were started
+            bot_version: Bot version being built
+            cancel_event: Optional event that stops the wait when set
+
+        Returns:
+            Mapping of locale ID to its final describe_bot_locale response
+
+        Raises:
+            LocaleBuildFailedException: As soon as any locale build fails
+            WaiterTimeoutException: If builds are still running at the deadline
+            WaiterException: If cancel_event is set
+        """
+        handles = {
+            locale_id: POLLING_SCHEDULER.register(
+                f"Locale {locale_id} build",
+                lambda locale_id=locale_id: self.LEX_CLIENT.describe_bot_locale(
+                    botId=bot_id, botVersion=bot_version, localeId=locale_id
+                ),
+                lambda response: response.get("botLocaleStatus")
+                in self.BUILT_STATUSES,
+                lambda response: response.get("botLocaleStatus")
+                in self.FAILED_STATUSES,
+                ResourceWaiter.TIMEOUTS["bot_locale_build"],
+                group=self.context,
+            )
+            for locale_id in locale_ids
+        }
+        logger.info(f"Monitoring builds of {len(handles)} locale(s)")
+
+        try:
+            POLLING_SCHEDULER.wait_all(list(handles.values()), cancel_event)
+        except ResourceFailedException as e:
+            for locale_id, handle in handles.items():
+                if handle.error is e:
+                    reasons = (handle.response or {}).get("failureReasons", [])
+                    raise LocaleBuildFailedException(locale_id, reasons) from e
+            raise
+
+        for locale_id, handle in handles.items():
+            logger.info(f"Locale {locale_id} built after {handle.ready_after:.1f}s")
+        return {locale_id: handle.response for locale_id, handle in handles.items()}
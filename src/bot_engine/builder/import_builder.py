@@ -0,0 +1,108 @@
+import logging
+import urllib.request
+from typing import Dict, Literal
+
+from bot_engine.builder.bot_base import BotBase
+from bot_engine.builder.resource_waiter import ResourceWaiter
+
+
+logger = logging.getLogger(__name__)
+
+
+class BotCreationException(Exception):
+    """Base exception for bot creation failures"""
+
+    pass
+
+
+class CreateBotImport(BotBase):
+    """Handles uploading and importing a compiled bot archive"""
+
+    UPLOAD_TIMEOUT = 60
+
+    def upload_archive(self, archive_bytes: bytes) -> str:
+        """
+        Upload a bot archive to a pre-signed Lex upload URL.
+
+        Args:
+            archive_bytes: Zip archive contents
+
+        Returns:
+            Import ID to pass to start_bot_import
+
+        Raises:
+            BotCreationException: If the upload fails
+        """
+        try:
+            response = self.LEX_CLIENT.create_upload_url()
+            import_id = response["importId"]
+            logger.info(f"Uploading {len(archive_bytes)} byte archive ({import_id})")
+
+            request = urllib.request.Request(
+                response["uploadUrl"], data=archive_bytes, method="PUT"
+            )
+            with urllib.request.urlopen(request, timeout=self.UPLOAD_TIMEOUT):
+                pass
+
+            return import_id
+
+        except Exception as e:
+            logger.error(f"Failed to upload bot archive: {e}")
+            raise BotCreationException(f"Archive upload failed: {e}") from e
+
+    def start_bot_import(
+        self,
+        import_id: str,
+        role_arn: str,
+        idle_session_ttl_in_seconds: int = 300,
+        child_directed: bool = False,
+        merge_strategy: Literal["Overwrite", "FailOnConflict"] = "FailOnConflict",
+    ) -> str:
+        """
+        Import an uploaded archive as the bot and wait for the import to finish.
+
+        Args:
+            import_id: Import ID returned by upload_archive
+            role_arn: IAM role ARN for the bot
+            idle_session_ttl_in_seconds: Session timeout in seconds
+            child_directed: Whether bot is directed at children
+            merge_strategy: Fail if a bot of the same name exists (the
+                default), or Overwrite it
+
+        Returns:
+            Bot ID
+
+        Raises:
+            BotCreationException: If the import fails
+        """
+        try:
+            logger.info(f"Starting bot import: {import_id}")
+            self.LEX_CLIENT.start_import(
+                importId=import_id,
+                resourceSpecification={
+                    "botImportSpecification": {
+                        "botName": self.BOT_NAME,
+                        "roleArn": role_arn,
+                        "dataPrivacy": {"childDirected": child_directed},
+                        "idleSessionTTLInSeconds": idle_session_ttl_in_seconds,
+                        "botTags": self.BOT_TAGS,
+                        "testBotAliasTags": {
+                            "TestAliasName": f"{self.BOT_NAME}-test-alias"
+                        },
+                    }
+                },
+                mergeStrategy=merge_strategy,
+            )
+
+            response: Dict = ResourceWaiter().wait_for_import(import_id)
+            bot_id = response.get("importedResourceId")
+            if not bot_id:
+                raise ValueError("Import response missing importedResourceId")
+
+            logger.info(f"Bot imported successfully: {bot_id}")
+            ResourceWaiter().wait_for_bot(bot_id)
+            return bot_id
+
+        except Exception as e:
+            logger.error(f"Failed to import bot: {e}")
+            raise BotCreationException(f"Bot import failed: {e}") from e
@@ -1,8 +1,8 @@
 from bot_engine.builder.bot_base import BotBase
+from bot_engine.builder.resource_waiter import ResourceWaiter
 from common.iam_client import iam_client
 import logging
-import time
-from typing import Optional
+from typing import Dict, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -13,13 +13,20 @@ class BotCreationException(Exception):
     pass
 
 
+def _build_service_role_params(role_name: str) -> Dict:
+    """Build the CreateServiceLinkedRole parameters of the Lex V2 role"""
+    return {
+        "AWSServiceName": "lex.amazonaws.com",
+        "Description": f"IAM service linked role: {role_name} for Lex V2",
+    }
+
+
 def create_bot_service_role_arn(role_name: str) -> str:
     """Create IAM service-linked role for Lex V2"""
     try:
         logger.info(f"Creating service-linked role for Lex: {role_name}")
         response = iam_client().create_service_linked_role(
-            AWSServiceName="lex.amazonaws.com",
-            Description=f"IAM service linked role: {role_name} for Lex V2",
+            **_build_service_role_params(role_name)
         )
         arn = response["Role"]["Arn"]
         logger.info(f"Service-linked role created: {arn}")
@@ -59,14 +66,14 @@ class CreateBotInstance(BotBase):
             final_role_arn = role_arn or create_bot_service_role_arn(self.BOT_NAME)
 
             response = self.LEX_CLIENT.create_bot(
-                botName=self.BOT_NAME,
-                description=self.DESCRIPTION,
-                roleArn=final_role_arn,
-                idleSessionTTLInSeconds=idle_session_ttl_in_seconds,
-                dataPrivacy={"childDirected": child_directed},
-                botTags=self.BOT_TAGS,
-                testBotAliasTags={"TestAliasName": f"{self.BOT_NAME}-test-alias"},
-                botType="Bot",
+                **self._build_bot_settings(
+                    self.BOT_NAME,
+                    self.DESCRIPTION,
+                    final_role_arn,
+                    idle_session_ttl_in_seconds,
+                    child_directed,
+                    self.BOT_TAGS,
+                )
             )
 
             bot_id = response.get("botId")
@@ -74,8 +81,7 @@ class CreateBotInstance(BotBase):
                 raise ValueError("Bot creation response missing botId")
 
             logger.info(f"Bot instance created successfully: {bot_id}")
-            logger.debug("Waiting 10 seconds for AWS Lex to process...")
-            time.sleep(10)
+            ResourceWaiter().wait_for_bot(bot_id)
             return bot_id
 
         except Exception as e:
@@ -124,10 +130,30 @@ class CreateBotInstance(BotBase):
             updated_bot_id = response.get("botId")
 
             logger.info(f"Bot instance updated: {updated_bot_id}")
-            logger.debug("Waiting 10 seconds for AWS Lex to process...")
-            time.sleep(10)
+            ResourceWaiter().wait_for_bot(updated_bot_id)
             return updated_bot_id
 
         except Exception as e:
             logger.error(f"Failed to update bot instance: {e}")
             raise BotCreationException(f"Bot update failed: {e}") from e
+
+    @staticmethod
+    def _build_bot_settings(
+        bot_name: str,
+        description: str,
+        role_arn: str,
+        idle_session_ttl_in_seconds: int,
+        child_directed: bool,
+        bot_tags: Dict[str, str],
+    ) -> Dict:
+        """Build the bot creation request parameters"""
+        return {
+            "botName": bot_name,
+            "description": description,
+            "roleArn": role_arn,
+            "idleSessionTTLInSeconds": idle_session_ttl_in_seconds,
+            "dataPrivacy": {"childDirected": child_directed},
+            "botTags": bot_tags,
+            "testBotAliasTags": {"TestAliasName": f"{bot_name}-test-alias"},
+            "botType": "Bot",
+        }
@@ -1,6 +1,6 @@
 from bot_engine.builder.bot_base import BotBase
+from bot_engine.builder.resource_waiter import ResourceWaiter
 import logging
-import time
 
 from typing import Dict, List, Optional
 
@@ -47,22 +47,23 @@ class CreateBotIntent(BotBase):
         try:
             logger.info(f"Creating intent: {intent_name}")
 
-            intent_definition = self._build_intent_definition(intent_hooks or [])
-
             response = self.LEX_CLIENT.create_intent(
-                intentName=intent_name,
-                description=description,
-                botId=self.bot_id,
-                botVersion=self.bot_version,
-                sampleUtterances=[{"utterance": u} for u in utterances],
-                localeId=self.locale_id,
-                **intent_definition,
+                **self._build_intent_params(
+                    self.bot_id,
+                    self.bot_version,
+                    self.locale_id,
+                    intent_name,
+                    description,
+                    utterances,
+                    intent_hooks,
+                )
             )
 
             intent_id = response.get("intentId")
             logger.info(f"Intent created: {intent_name} ({intent_id})")
-            logger.debug("Waiting 10 seconds for AWS Lex to process...")
-            time.sleep(10)
+            ResourceWaiter().wait_for_intent(
+                self.bot_id, self.bot_version, self.locale_id, intent_id
+            )
             return intent_id
 
         except Exception as e:
@@ -95,25 +96,99 @@ class CreateBotIntent(BotBase):
             logger.info(f"Creating slot {slot_name} in intent {intent_id}")
 
             response = self.LEX_CLIENT.create_slot(
-                botId=self.bot_id,
-                botVersion=self.bot_version,
-                localeId=self.locale_id,
-                intentId=intent_id,
-                slotName=slot_name,
-                slotTypeId=slot_type_id,
-                valueElicitationSetting={"slotConstraint": slot_constraint},
+                **self._build_slot_params(
+                    self.bot_id,
+                    self.bot_version,
+                    self.locale_id,
+                    intent_id,
+                    slot_name,
+                    slot_type_id,
+                    slot_constraint,
+                )
             )
 
             slot_id = response.get("slotId")
             logger.info(f"Slot created: {slot_name} ({slot_id})")
-            logger.debug("Waiting 10 seconds for AWS Lex to process...")
-            time.sleep(10)
+            ResourceWaiter().wait_for_slot(
+                self.bot_id, self.bot_version, self.locale_id, intent_id, slot_id
+            )
             return slot_id
 
         except Exception as e:
             logger.error(f"Failed to create slot {slot_name}: {e}")
             raise BotCreationException(f"Slot creation failed: {e}") from e
 
+    def update_slot_in_intent(
+        self,
+        slot_id: str,
+        slot_name: str,
+        slot_type_id: str,
+        intent_id: str,
+        slot_constraint: str = "Optional",
+    ) -> Dict:
+        """
+        Update the type or constraint of an existing slot.
+
+        Args:
+            slot_id: Slot ID to update
+            slot_name: Slot name
+            slot_type_id: Slot type ID
+            intent_id: Intent ID the slot belongs to
+            slot_constraint: Required or Optional
+
+        Returns:
+            API response
+
+        Raises:
+            BotCreationException: If update fails
+        """
+        try:
+            logger.info(f"Updating slot {slot_name} in intent {intent_id}")
+
+            response = self.LEX_CLIENT.update_slot(
+                slotId=slot_id,
+                **self._build_slot_params(
+                    self.bot_id,
+                    self.bot_version,
+                    self.locale_id,
+                    intent_id,
+                    slot_name,
+                    slot_type_id,
+                    slot_constraint,
+                ),
+            )
+
+            logger.info(f"Slot updated: {slot_name} ({slot_id})")
+            return response
+
+        except Exception as e:
+            logger.error(f"Failed to update slot {slot_name}: {e}")
+            raise BotCreationException(f"Slot update failed: {e}") from e
+
+    def delete_slot_in_intent(self, slot_id: str, intent_id: str) -> None:
+        """
+        Remove a slot from an intent.
+
+        Args:
+            slot_id: Slot ID to delete
+            intent_id: Intent ID the slot belongs to
+
+        Raises:
+            BotCreationException: If deletion fails
+        """
+        try:
+            logger.info(f"Deleting slot {slot_id} from intent {intent_id}")
+            self.LEX_CLIENT.delete_slot(
+                slotId=slot_id,
+                botId=self.bot_id,
+                botVersion=self.bot_version,
+                localeId=self.locale_id,
+                intentId=intent_id,
+            )
+        except Exception as e:
+            logger.error(f"Failed to delete slot {slot_id}: {e}")
+            raise BotCreationException(f"Slot deletion failed: {e}") from e
+
     def update_intent_slot_priority(
         self,
         intent_id: str,
@@ -137,26 +212,23 @@ class CreateBotIntent(BotBase):
         try:
             logger.info(f"Updating slot priorities for intent {intent_id}")
 
-            slot_priorities = [
-                {
-                    "slotId": slot_dict["slotId"],
-                    "priority": slot_dict["priority"],
-                }
-                for slot_dict in slot_priorities_list
-            ]
-
             response = self.LEX_CLIENT.update_intent(
                 intentId=intent_id,
                 intentName=intent_name,
                 botId=self.bot_id,
                 botVersion=self.bot_version,
                 localeId=self.locale_id,
-                slotPriorities=slot_priorities,
+                slotPriorities=self._build_slot_priorities(slot_priorities_list),
             )
 
             logger.info(f"Slot priorities updated for intent {intent_id}")
-            logger.debug("Waiting 10 seconds for AWS Lex to process...")
-            time.sleep(10)
+            ResourceWaiter().wait_for_intent(
+                self.bot_id,
+                self.bot_version,
+                self.locale_id,
+                intent_id,
+                response.get("lastUpdatedDateTime"),
+            )
             return response
 
         except Exception as e:
@@ -212,24 +284,47 @@ class CreateBotIntent(BotBase):
                 update_params.update(self._build_intent_definition(intent_hooks))
 
             if slot_priorities_list:
-                update_params["slotPriorities"] = [
-                    {
-                        "slotId": slot_dict["slotId"],
-                        "priority": slot_dict["priority"],
-                    }
-                    for slot_dict in slot_priorities_list
-                ]
+                update_params["slotPriorities"] = self._build_slot_priorities(
+                    slot_priorities_list
+                )
 
             response = self.LEX_CLIENT.update_intent(**update_params)
             logger.info(f"Intent updated: {intent_name}")
-            logger.debug("Waiting 10 seconds for AWS Lex to process...")
-            time.sleep(10)
+            ResourceWaiter().wait_for_intent(
+                self.bot_id,
+                self.bot_version,
+                self.locale_id,
+                intent_id,
+                response.get("lastUpdatedDateTime"),
+            )
             return response
 
         except Exception as e:
             logger.error(f"Failed to update intent {intent_name}: {e}")
             raise BotCreationException(f"Intent update failed: {e}") from e
 
+    def delete_intent(self, intent_id: str) -> None:
+        """
+        Delete an intent and its slots.
+
+        Args:
+            intent_id: Intent ID to delete
+
+        Raises:
+            BotCreationException: If deletion fails
+        """
+        try:
+            logger.info(f"Deleting intent: {intent_id}")
+            self.LEX_CLIENT.delete_intent(
+                intentId=intent_id,
+                botId=self.bot_id,
+                botVersion=self.bot_version,
+                localeId=self.locale_id,
+            )
+        except Exception as e:
+            logger.error(f"Failed to delete intent {intent_id}: {e}")
+            raise BotCreationException(f"Intent deletion failed: {e}") from e
+
     @staticmethod
     def _build_intent_definition(intent_hooks: List[str]) -> Dict:
         """Build intent definition from hook list"""
@@ -253,3 +348,53 @@ class CreateBotIntent(BotBase):
             }
 
         return intent_definition
+
+    @staticmethod
+    def _build_intent_params(
+        bot_id: str,
+        bot_version: str,
+        locale_id: str,
+        intent_name: str,
+        description: str,
+        utterances: List[str],
+        intent_hooks: Optional[List[str]] = None,
+    ) -> Dict:
+        """Build the intent creation request parameters"""
+        return {
+            "intentName": intent_name,
+            "description": description,
+            "botId": bot_id,
+            "botVersion": bot_version,
+            "localeId": locale_id,
+            "sampleUtterances": [{"utterance": u} for u in utterances],
+            **CreateBotIntent._build_intent_definition(intent_hooks or []),
+        }
+
+    @staticmethod
+    def _build_slot_params(
+        bot_id: str,
+        bot_version: str,
+        locale_id: str,
+        intent_id: str,
+        slot_name: str,
+        slot_type_id: str,
+        slot_constraint: str,
+    ) -> Dict:
+        """Build the slot request parameters"""
+        return {
+            "botId": bot_id,
+            "botVersion": bot_version,
+            "localeId": locale_id,
+            "intentId": intent_id,
+            "slotName": slot_name,
+            "slotTypeId": slot_type_id,
+            "valueElicitationSetting": {"slotConstraint": slot_constraint},
+        }
+
+    @staticmethod
+    def _build_slot_priorities(slot_priorities_list: List[Dict]) -> List[Dict]:
+        """Build slotPriorities from a list of {slotId, priority}"""
+        return [
+            {"slotId": slot_dict["slotId"], "priority": slot_dict["priority"]}
+            for slot_dict in slot_priorities_list
+        ]
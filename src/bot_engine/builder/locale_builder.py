@@ -1,8 +1,8 @@
 import logging
-import time
 
 from typing import Dict, Literal
 from bot_engine.builder.bot_base import BotBase
+from bot_engine.builder.resource_waiter import ResourceWaiter
 
 
 logger = logging.getLogger(__name__)
@@ -45,27 +45,67 @@ class CreateBuildBotLocale(BotBase):
             logger.info(f"Creating locale {self.locale_id} for bot {self.bot_id}")
 
             response = self.LEX_CLIENT.create_bot_locale(
-                botId=self.bot_id,
-                localeId=self.locale_id,
-                description=f"Bot: {self.bot_id}, Locale: {self.locale_id}",
-                botVersion="DRAFT",
-                nluIntentConfidenceThreshold=nlu_intent_confidence_threshold,
-                voiceSettings={
-                    "voiceId": voice_id,
-                    "engine": engine,
-                },
+                **self._build_locale_settings(
+                    self.bot_id,
+                    self.locale_id,
+                    nlu_intent_confidence_threshold,
+                    voice_id,
+                    engine,
+                )
             )
 
             bot_version = response.get("botVersion")
             logger.info(f"Locale created: {self.locale_id}, version: {bot_version}")
-            logger.debug("Waiting 10 seconds for AWS Lex to process...")
-            time.sleep(10)
+            ResourceWaiter().wait_for_bot_locale(
+                self.bot_id, "DRAFT", self.locale_id, ("NotBuilt",)
+            )
             return bot_version
 
         except Exception as e:
             logger.error(f"Failed to create locale {self.locale_id}: {e}")
             raise BotCreationException(f"Locale creation failed: {e}") from e
 
+    def update_bot_locale(
+        self,
+        nlu_intent_confidence_threshold: float = 0.4,
+        voice_id: str = "Joanna",
+        engine: Literal["standard", "neural"] = "neural",
+    ) -> Dict:
+        """
+        Update the settings of an existing DRAFT locale.
+
+        Args:
+            nlu_intent_confidence_threshold: NLU confidence threshold (0-1)
+            voice_id: Voice ID for text-to-speech
+            engine: Voice engine (standard or neural)
+
+        Returns:
+            API response
+
+        Raises:
+            BotCreationException: If locale update fails
+        """
+        try:
+            logger.info(f"Updating locale {self.locale_id} for bot {self.bot_id}")
+
+            response = self.LEX_CLIENT.update_bot_locale(
+                **self._build_locale_settings(
+                    self.bot_id,
+                    self.locale_id,
+                    nlu_intent_confidence_threshold,
+                    voice_id,
+                    engine,
+                )
+            )
+
+            logger.info(f"Locale updated: {self.locale_id}")
+            ResourceWaiter().wait_for_bot_locale(self.bot_id, "DRAFT", self.locale_id)
+            return response
+
+        except Exception as e:
+            logger.error(f"Failed to update locale {self.locale_id}: {e}")
+            raise BotCreationException(f"Locale update failed: {e}") from e
+
     def build_bot_locale(self, bot_version: str = "DRAFT") -> Dict:
         """
         Build a bot locale to apply all changes.
@@ -89,10 +129,36 @@ class CreateBuildBotLocale(BotBase):
             )
 
             logger.info(f"Locale build initiated: {self.locale_id}")
-            logger.debug("Waiting 10 seconds for AWS Lex to process...")
-            time.sleep(10)
+            # Only wait for the build to be accepted; it completes asynchronously
+            ResourceWaiter().wait_for_bot_locale(
+                self.bot_id,
+                bot_version,
+                self.locale_id,
+                ("Building", "Built", "ReadyExpressTesting"),
+            )
             return response
 
         except Exception as e:
             logger.error(f"Failed to build locale {self.locale_id}: {e}")
             raise BotCreationException(f"Locale build failed: {e}") from e
+
+    @staticmethod
+    def _build_locale_settings(
+        bot_id: str,
+        locale_id: str,
+        nlu_intent_confidence_threshold: float,
+        voice_id: str,
+        engine: str,
+    ) -> Dict:
+        """Build the DRAFT locale request parameters"""
+        return {
+            "botId": bot_id,
+            "localeId": locale_id,
+            "description": f"Bot: {bot_id}, Locale: {locale_id}",
+            "botVersion": "DRAFT",
+            "nluIntentConfidenceThreshold": nlu_intent_confidence_threshold,
+            "voiceSettings": {
+                "voiceId": voice_id,
+                "engine": engine,
+            },
+        }
@@ -0,0 +1,409 @@
+import logging
+import math
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+from common.client_factory import ClientFactory
+from common.telemetry import TRACER
+
+
+logger = logging.getLogger(__name__)
+
+
+class WaiterException(Exception):
+    """Base exception for resource waiter failures"""
+
+    pass
+
+
+class WaiterTimeoutException(WaiterException):
+    """Exception for resources that do not become ready in time"""
+
+    pass
+
+
+class ResourceFailedException(WaiterException):
+    """Exception for resources that reach a terminal failed status"""
+
+    pass
+
+
+# Error codes that mean "not visible yet" or "try again" rather than a hard failure
+RETRYABLE_ERROR_CODES = (
+    "ResourceNotFoundException",
+    "ThrottlingException",
+    "InternalServerException",
+    "ServiceQuotaExceededException",
+)
+
+
+def _error_code(error: Exception) -> Optional[str]:
+    """Extract the AWS error code from a botocore ClientError, if any"""
+    response = getattr(error, "response", None) or {}
+    return response.get("Error", {}).get("Code")
+
+
+class PollHandle:
+    """A resource registered with a PollingScheduler, and its outcome once done"""
+
+    def __init__(
+        self,
+        name: str,
+        describe_func: Callable[[], Dict],
+        is_ready: Callable[[Dict], bool],
+        is_failed: Optional[Callable[[Dict], bool]],
+        timeout: float,
+        initial_delay: float,
+        group: Hashable = None,
+    ):
+        self.name = name
+        self.describe_func = describe_func
+        self.is_ready = is_ready
+        self.is_failed = is_failed
+        self.timeout = timeout
+        self.group = group
+        self.registered = time.monotonic()
+        self.deadline = self.registered + timeout
+        self.next_poll = self.registered
+        self.delay = initial_delay
+        self.attempts = 0
+        self.polling = False
+        self.response: Optional[Dict] = None
+        self.error: Optional[Exception] = None
+        self.ready_after: Optional[float] = None
+        self.finished = threading.Event()
+        # Step that registered the handle, so its polls are attributed to it
+        self.step = TRACER.current_step()
+
+    def done(self) -> bool:
+        """True once the resource is ready, failed or timed out"""
+        return self.finished.is_set()
+
+
+class PollingScheduler:
+    """
+    Polls every registered resource from one loop in shared ticks.
+
+    Waiters register a describe call and readiness predicates and then
+    block on their handle. Each waiter keeps its own exponential backoff,
+    but poll times are rounded up to a TICK boundary so waiters that come
+    due together are polled together, from a small worker pool, instead of
+    every thread sleeping and polling on its own schedule. Optional overall
+    deadlines, one per group of handles (e.g. per bot), bound the total time
+    spent waiting across all resources of the group, and readiness durations
+    are kept for reporting.
+    """
+
+    TICK = 0.25
+    INITIAL_DELAY = 0.5
+    MAX_DELAY = 10.0
+    BACKOFF_FACTOR = 2.0
+    MAX_POLL_WORKERS = ClientFactory.POLL_WORKERS
+
+    def __init__(self):
+        self.deadlines: Dict[Hashable, float] = {}
+        self.ticks = 0
+        self.polls = 0
+        self._handles: List[PollHandle] = []
+        # (group, resource name) -> seconds, so bots sharing resource names
+        # keep their own readiness times
+        self._ready_after: Dict[Tuple[Hashable, str], float] = {}
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def set_deadline(self, timeout: Optional[float], group: Hashable = None) -> None:
+        """
+        Fail every waiter of a group still pending after timeout seconds from now.
+
+        Args:
+            timeout: Seconds from now, or None to remove the deadline
+            group: Group of handles the deadline applies to
+        """
+        with self._condition:
+            if timeout is None:
+                self.deadlines.pop(group, None)
+            else:
+                self.deadlines[group] = time.monotonic() + timeout
+            self._condition.notify_all()
+
+    def register(
+        self,
+        resource_name: str,
+        describe_func: Callable[[], Dict],
+        is_ready: Callable[[Dict], bool],
+        is_failed: Optional[Callable[[Dict], bool]] = None,
+        timeout: float = 60,
+        group: Hashable = None,
+    ) -> PollHandle:
+        """
+        Start polling a resource without waiting for it.
+
+        Args:
+            resource_name: Resource name for logging and readiness durations
+            describe_func: Callable returning the describe_* response
+            is_ready: Predicate on the response that is True once ready
+            is_failed: Optional predicate on the response that is True on failure
+            timeout: Maximum time to wait for this resource in seconds
+            group: Group whose overall deadline applies to the resource
+
+        Returns:
+            Handle to pass to wait_all
+        """
+        handle = PollHandle(
+            resource_name,
+            describe_func,
+            is_ready,
+            is_failed,
+            timeout,
+            self.INITIAL_DELAY,
+            group,
+        )
+        with self._condition:
+            self._handles.append(handle)
+            if self._thread is None:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        self.MAX_POLL_WORKERS, thread_name_prefix="status-poll"
+                    )
+                self._thread = threading.Thread(
+                    target=self._run, name="polling-scheduler", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify_all()
+        return handle
+
+    def wait(
+        self,
+        resource_name: str,
+        describe_func: Callable[[], Dict],
+        is_ready: Callable[[Dict], bool],
+        is_failed: Optional[Callable[[Dict], bool]] = None,
+        timeout: float = 60,
+        cancel_event: Optional[threading.Event] = None,
+        group: Hashable = None,
+    ) -> Dict:
+        """
+        Register a resource and block until it is ready.
+
+        Raises:
+            ResourceFailedException: If the resource reaches a failed status
+            WaiterTimeoutException: If the resource is not ready before timeout
+            WaiterException: If cancel_event is set
+        """
+        handle = self.register(
+            resource_name, describe_func, is_ready, is_failed, timeout, group
+        )
+        return self.wait_all([handle], cancel_event)[0]
+
+    def wait_all(
+        self,
+        handles: List[PollHandle],
+        cancel_event: Optional[threading.Event] = None,
+    ) -> List[Dict]:
+        """
+        Block until every handle is ready, failing fast on the first error.
+
+        Args:
+            handles: Handles returned by register
+            cancel_event: Optional event that stops the wait when set
+
+        Returns:
+            Last describe_* response of each handle, in order
+
+        Raises:
+            The first error of any handle; the remaining handles are cancelled
+        """
+        name = handles[0].name if len(handles) == 1 else f"{len(handles)} resources"
+        resources = [handle.name for handle in handles]
+        with TRACER.span(name, "wait", resources=resources), self._condition:
+            while True:
+                if cancel_event is not None and cancel_event.is_set():
+                    self._cancel_pending(handles, "cancelled")
+                    raise WaiterException("Status polling cancelled")
+                failed = next((h for h in handles if h.error is not None), None)
+                if failed is not None:
+                    self._cancel_pending(handles, f"abandoned, {failed.name} failed")
+                    raise failed.error
+                if all(handle.done() for handle in handles):
+                    return [handle.response for handle in handles]
+                self._condition.wait(self.TICK)
+
+    def _cancel_pending(self, handles: List[PollHandle], reason: str) -> None:
+        """Stop polling every handle that has not finished yet"""
+        for handle in handles:
+            if not handle.done():
+                self._finish(handle, error=WaiterException(f"{handle.name} {reason}"))
+
+    def _finish(
+        self,
+        handle: PollHandle,
+        error: Optional[Exception] = None,
+    ) -> None:
+        """Record the outcome of a handle and wake its waiters (lock held)"""
+        if handle in self._handles:
+            self._handles.remove(handle)
+        handle.error = error
+        if error is None:
+            handle.ready_after = time.monotonic() - handle.registered
+            self._ready_after[(handle.group, handle.name)] = handle.ready_after
+            logger.debug(
+                f"{handle.name} ready after {handle.ready_after:.1f}s "
+                f"({handle.attempts} attempt(s))"
+            )
+        handle.finished.set()
+        self._condition.notify_all()
+
+    def _run(self) -> None:
+        """Scheduler loop: poll every due handle once per tick"""
+        while True:
+            with self._condition:
+                now = time.monotonic()
+                for handle in list(self._handles):
+                    deadline = self.deadlines.get(handle.group)
+                    if deadline is not None and now >= deadline:
+                        self._finish(
+                            handle,
+                            WaiterTimeoutException(
+                                f"{handle.name} not ready before the overall "
+                                f"status polling deadline"
+                            ),
+                        )
+                if not self._handles:
+                    self._thread = None
+                    return
+
+                due = [
+                    handle
+                    for handle in self._handles
+                    if not handle.polling and handle.next_poll <= now
+                ]
+                if not due:
+                    idle = [h.next_poll for h in self._handles if not h.polling]
+                    wake = min(idle) if idle else now + self.TICK
+                    # Only groups still pending; a passed deadline of a
+                    # finished group would make this wait return at once
+                    groups = {handle.group for handle in self._handles}
+                    deadlines = [
+                        deadline
+                        for group, deadline in self.deadlines.items()
+                        if group in groups
+                    ]
+                    wake = min([wake, *deadlines])
+                    self._condition.wait(max(wake - now, 0))
+                    continue
+
+                self.ticks += 1
+                self.polls += len(due)
+                for handle in due:
+                    handle.polling = True
+                    handle.attempts += 1
+
+            for handle in due:
+                self._executor.submit(self._poll, handle)
+
+    def _poll(self, handle: PollHandle) -> None:
+        """Run one describe call for a handle and schedule its next poll"""
+        response = None
+        error = None
+        ready = False
+        try:
+            with TRACER.in_step(handle.step):
+                response = handle.describe_func()
+            if handle.is_failed and handle.is_failed(response):
+                reasons = response.get("failureReasons", [])
+                error = ResourceFailedException(
+                    f"{handle.name} reached a failed status: {reasons}"
+                )
+            elif handle.is_ready(response):
+                ready = True
+        except Exception as e:
+            if _error_code(e) not in RETRYABLE_ERROR_CODES:
+                error = e
+            else:
+                logger.debug(
+                    f"{handle.name} not ready (attempt {handle.attempts}): {e}"
+                )
+
+        with self._condition:
+            handle.polling = False
+            if handle.done():
+                return
+            if response is not None:
+                handle.response = response
+
+            now = time.monotonic()
+            if error is not None or ready:
+                self._finish(handle, error)
+            elif now >= handle.deadline:
+                self._finish(
+                    handle,
+                    WaiterTimeoutException(
+                        f"{handle.name} not ready after {handle.timeout} seconds "
+                        f"({handle.attempts} attempts)"
+                    ),
+                )
+            else:
+                # Round up to the tick grid so waiters due together poll together
+                due = now + random.uniform(handle.delay / 2, handle.delay)
+                handle.next_poll = min(
+                    math.ceil(due / self.TICK) * self.TICK, handle.deadline
+                )
+                handle.delay = min(handle.delay * self.BACKOFF_FACTOR, self.MAX_DELAY)
+                self._condition.notify_all()
+
+    def readiness(self, group: Hashable = None) -> Dict[str, float]:
+        """
+        Seconds each resource of a group took to become ready, from registration.
+
+        Args:
+            group: Group the resources were registered with (e.g. a bot)
+        """
+        with self._condition:
+            return {
+                name: round(seconds, 3)
+                for (resource_group, name), seconds in self._ready_after.items()
+                if resource_group == group
+            }
+
+    def reset_stats(self) -> None:
+        """Clear the poll counters and readiness times, e.g. before a new run"""
+        with self._condition:
+            self.ticks = 0
+            self.polls = 0
+            self._ready_after.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Return the number of ticks, polls and resources that became ready"""
+        with self._condition:
+            return {
+                "ticks": self.ticks,
+                "polls": self.polls,
+                "ready": len(self._ready_after),
+            }
+
+    def log_readiness(self, slowest: int = 5) -> None:
+        """Log poll counters and the resources that took longest to be ready"""
+        stats = self.stats()
+        if not stats["polls"]:
+            return
+        logger.info(
+            f"Status polling: {stats['polls']} polls in {stats['ticks']} ticks, "
+            f"{stats['ready']} resources ready"
+        )
+        with self._condition:
+            ranked = sorted(self._ready_after.items(), key=lambda item: -item[1])
+        # Several bots (a fleet) may have resources of the same name
+        several = len({group for (group, _), _ in ranked}) > 1
+        for (group, name), seconds in ranked[:slowest]:
+            if several:
+                name = f"{getattr(group, 'bot_name', group)}: {name}"
+            logger.info(f"  {name} ready after {seconds:.1f}s")
+
+
+# One scheduler per process, so every waiter shares the same polling loop
+POLLING_SCHEDULER = PollingScheduler()
+TRACER.on_reset(POLLING_SCHEDULER.reset_stats)
@@ -0,0 +1,230 @@
+import logging
+from typing import Callable, Dict, Iterable, Optional
+
+from bot_engine.builder.bot_base import BotBase
+
+# The waiter exceptions and error helpers live with the scheduler and are
+# re-exported here for existing callers
+from bot_engine.builder.polling_scheduler import (
+    POLLING_SCHEDULER,
+    RETRYABLE_ERROR_CODES,
+    PollingScheduler,
+    ResourceFailedException,
+    WaiterException,
+    WaiterTimeoutException,
+    _error_code,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+class ResourceWaiter(BotBase):
+    """Waits on Lex describe_* calls through the shared polling scheduler"""
+
+    INITIAL_DELAY = PollingScheduler.INITIAL_DELAY
+    MAX_DELAY = PollingScheduler.MAX_DELAY
+    BACKOFF_FACTOR = PollingScheduler.BACKOFF_FACTOR
+
+    # Per-resource timeouts in seconds
+    TIMEOUTS: Dict[str, float] = {
+        "bot": 120,
+        "bot_locale": 300,
+        "bot_locale_build": 900,
+        "bot_version": 300,
+        "bot_alias": 120,
+        "intent": 60,
+        "slot": 60,
+        "slot_type": 60,
+        "import": 900,
+    }
+
+    def wait(
+        self,
+        resource_name: str,
+        describe_func: Callable[[], Dict],
+        is_ready: Callable[[Dict], bool],
+        is_failed: Optional[Callable[[Dict], bool]] = None,
+        timeout: float = 60,
+    ) -> Dict:
+        """
+        Register a describe call with the polling scheduler and wait until ready.
+
+        Args:
+            resource_name: Resource name for logging
+            describe_func: Callable returning the describe_* response
+            is_ready: Predicate on the response that is True once ready
+            is_failed: Optional predicate on the response that is True on failure
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            The last describe_* response
+
+        Raises:
+            ResourceFailedException: If the resource reaches a failed status
+            WaiterTimeoutException: If the resource is not ready before timeout
+            WaiterException: If the bot context's cancel event is set
+        """
+        # Grouped by bot context, so each bot's overall deadline applies, and
+        # cancelled with it, so a failed plan stops its pending waits
+        return POLLING_SCHEDULER.wait(
+            resource_name,
+            describe_func,
+            is_ready,
+            is_failed,
+            timeout,
+            cancel_event=self.context.cancel_event if self.context else None,
+            group=self.context,
+        )
+
+    def _wait_for_status(
+        self,
+        resource_type: str,
+        resource_name: str,
+        describe_func: Callable[[], Dict],
+        status_key: str,
+        ready_statuses: Iterable[str],
+        failed_statuses: Iterable[str] = ("Failed",),
+    ) -> Dict:
+        """Wait for a status field of a describe_* response to reach a ready value"""
+        ready_statuses = tuple(ready_statuses)
+        failed_statuses = tuple(failed_statuses)
+        return self.wait(
+            resource_name,
+            describe_func,
+            lambda response: response.get(status_key) in ready_statuses,
+            lambda response: response.get(status_key) in failed_statuses,
+            self.TIMEOUTS[resource_type],
+        )
+
+    def wait_for_bot(self, bot_id: str) -> Dict:
+        """Wait until the bot is Available"""
+        return self._wait_for_status(
+            "bot",
+            f"Bot {bot_id}",
+            lambda: self.LEX_CLIENT.describe_bot(botId=bot_id),
+            "botStatus",
+            ("Available",),
+        )
+
+    def wait_for_bot_locale(
+        self,
+        bot_id: str,
+        bot_version: str,
+        locale_id: str,
+        ready_statuses: Iterable[str] = ("NotBuilt", "Built", "ReadyExpressTesting"),
+        resource_type: str = "bot_locale",
+    ) -> Dict:
+        """Wait until the bot locale reaches one of the given statuses"""
+        return self._wait_for_status(
+            resource_type,
+            f"Locale {locale_id}",
+            lambda: self.LEX_CLIENT.describe_bot_locale(
+                botId=bot_id, botVersion=bot_version, localeId=locale_id
+            ),
+            "botLocaleStatus",
+            ready_statuses,
+        )
+
+    def wait_for_bot_version(self, bot_id: str, bot_version: str) -> Dict:
+        """Wait until the bot version is Available"""
+        return self._wait_for_status(
+            "bot_version",
+            f"Bot version {bot_version}",
+            lambda: self.LEX_CLIENT.describe_bot_version(
+                botId=bot_id, botVersion=bot_version
+            ),
+            "botStatus",
+            ("Available",),
+        )
+
+    def wait_for_bot_alias(self, bot_id: str, bot_alias_id: str) -> Dict:
+        """Wait until the bot alias is Available"""
+        return self._wait_for_status(
+            "bot_alias",
+            f"Bot alias {bot_alias_id}",
+            lambda: self.LEX_CLIENT.describe_bot_alias(
+                botId=bot_id, botAliasId=bot_alias_id
+            ),
+            "botAliasStatus",
+            ("Available",),
+        )
+
+    def wait_for_import(self, import_id: str) -> Dict:
+        """Wait until a bot import has Completed"""
+        return self._wait_for_status(
+            "import",
+            f"Import {import_id}",
+            lambda: self.LEX_CLIENT.describe_import(importId=import_id),
+            "importStatus",
+            ("Completed",),
+        )
+
+    def wait_for_intent(
+        self,
+        bot_id: str,
+        bot_version: str,
+        locale_id: str,
+        intent_id: str,
+        updated_since=None,
+    ) -> Dict:
+        """
+        Wait until the intent is visible, and optionally reflects an update.
+
+        Args:
+            updated_since: lastUpdatedDateTime returned by an update call
+        """
+        return self.wait(
+            f"Intent {intent_id}",
+            lambda: self.LEX_CLIENT.describe_intent(
+                intentId=intent_id,
+                botId=bot_id,
+                botVersion=bot_version,
+                localeId=locale_id,
+            ),
+            lambda response: updated_since is None
+            or response.get("lastUpdatedDateTime", updated_since) >= updated_since,
+            timeout=self.TIMEOUTS["intent"],
+        )
+
+    def wait_for_slot(
+        self,
+        bot_id: str,
+        bot_version: str,
+        locale_id: str,
+        intent_id: str,
+        slot_id: str,
+    ) -> Dict:
+        """Wait until the slot is visible"""
+        return self.wait(
+            f"Slot {slot_id}",
+            lambda: self.LEX_CLIENT.describe_slot(
+                slotId=slot_id,
+                botId=bot_id,
+                botVersion=bot_version,
+                localeId=locale_id,
+                intentId=intent_id,
+            ),
+            lambda response: True,
+            timeout=self.TIMEOUTS["slot"],
+        )
+
+    def wait_for_slot_type(
+        self,
+        bot_id: str,
+        bot_version: str,
+        locale_id: str,
+        slot_type_id: str,
+    ) -> Dict:
+        """Wait until the slot type is visible"""
+        return self.wait(
+            f"Slot type {slot_type_id}",
+            lambda: self.LEX_CLIENT.describe_slot_type(
+                slotTypeId=slot_type_id,
+                botId=bot_id,
+                botVersion=bot_version,
+                localeId=locale_id,
+            ),
+            lambda response: True,
+            timeout=self.TIMEOUTS["slot_type"],
+        )
@@ -1,7 +1,7 @@
 from typing import Dict, List, Optional, Literal
 from bot_engine.builder.bot_base import BotBase
+from bot_engine.builder.resource_waiter import ResourceWaiter
 import logging
-import time
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +15,9 @@ class BotCreationException(Exception):
 class CreateBotSlotsType(BotBase):
     """Handles slot type creation and management"""
 
+    # Parent of extended slot types that do not name one
+    DEFAULT_PARENT_SLOT_TYPE = "AMAZON.AlphaNumeric"
+
     def __init__(self, bot_id: str, locale_id: str, bot_version: str):
         self.bot_id = bot_id
         self.locale_id = locale_id
@@ -24,10 +27,11 @@ class CreateBotSlotsType(BotBase):
         self,
         slot_type_name: str,
         description: str,
-        slot_type_values_list: List[Dict[str, List[str]]],
+        slot_type_values_list: Optional[List[Dict[str, List[str]]]] = None,
         resolution_strategy: Literal[
             "OriginalValue", "TopResolution", "Concatenation"
         ] = "OriginalValue",
+        slot_type_values: Optional[List[Dict]] = None,
     ) -> str:
         """
         Create a custom slot type with sample values and synonyms.
@@ -37,6 +41,8 @@ class CreateBotSlotsType(BotBase):
             description: Slot type description
             slot_type_values_list: List of {sampleValue: [synonyms]}
             resolution_strategy: How to handle multiple matches
+            slot_type_values: Values already in API format (see
+                slot_value_catalog), sent as is instead of slot_type_values_list
 
         Returns:
             Slot type ID
@@ -47,31 +53,27 @@ class CreateBotSlotsType(BotBase):
         try:
             logger.info(f"Creating custom slot type: {slot_type_name}")
 
-            # Transform input format to API format
-            slot_type_values = []
-            for slot_dict in slot_type_values_list:
-                for sample_value, synonyms in slot_dict.items():
-                    slot_type_values.append(
-                        {
-                            "sampleValue": {"value": sample_value},
-                            "synonyms": [{"value": syn} for syn in (synonyms or [])],
-                        }
-                    )
-
+            if slot_type_values is None:
+                slot_type_values = self._build_slot_type_values(
+                    slot_type_values_list or []
+                )
             response = self.LEX_CLIENT.create_slot_type(
-                slotTypeName=slot_type_name,
-                slotTypeValues=slot_type_values,
-                botId=self.bot_id,
-                botVersion=self.bot_version,
-                localeId=self.locale_id,
-                description=description,
-                valueSelectionSetting={"resolutionStrategy": resolution_strategy},
+                **self._build_slot_type_params(
+                    self.bot_id,
+                    self.bot_version,
+                    self.locale_id,
+                    slot_type_name,
+                    description,
+                    resolution_strategy,
+                    slot_type_values=slot_type_values,
+                )
             )
 
             slot_type_id = response.get("slotTypeId")
             logger.info(f"Custom slot type created: {slot_type_name} ({slot_type_id})")
-            logger.debug("Waiting 10 seconds for AWS Lex to process...")
-            time.sleep(10)
+            ResourceWaiter().wait_for_slot_type(
+                self.bot_id, self.bot_version, self.locale_id, slot_type_id
+            )
             return slot_type_id
 
         except Exception as e:
@@ -82,7 +84,7 @@ class CreateBotSlotsType(BotBase):
         self,
         slot_type_name: str,
         description: str,
-        parent_slot_type_signature: str = "AMAZON.AlphaNumeric",
+        parent_slot_type_signature: Optional[str] = None,
         regex_pattern: Optional[str] = None,
         resolution_strategy: Literal[
             "OriginalValue", "TopResolution", "Concatenation"
@@ -94,7 +96,8 @@ class CreateBotSlotsType(BotBase):
         Args:
             slot_type_name: Name of the slot type
             description: Slot type description
-            parent_slot_type_signature: Parent slot type to extend
+            parent_slot_type_signature: Parent slot type to extend, by
+                default DEFAULT_PARENT_SLOT_TYPE
             regex_pattern: Optional regex filter
             resolution_strategy: How to handle multiple matches
 
@@ -107,32 +110,28 @@ class CreateBotSlotsType(BotBase):
         try:
             logger.info(f"Creating extended slot type: {slot_type_name}")
 
-            request_params = {
-                "slotTypeName": slot_type_name,
-                "botId": self.bot_id,
-                "botVersion": self.bot_version,
-                "localeId": self.locale_id,
-                "description": description,
-            }
-
-            if parent_slot_type_signature:
-                request_params["parentSlotTypeSignature"] = parent_slot_type_signature
-
-            # Build value selection settings
-            value_selection = {"resolutionStrategy": resolution_strategy}
-            if regex_pattern:
-                value_selection["regexFilter"] = {"pattern": regex_pattern}
-
-            request_params["valueSelectionSetting"] = value_selection
-
-            response = self.LEX_CLIENT.create_slot_type(**request_params)
+            response = self.LEX_CLIENT.create_slot_type(
+                **self._build_slot_type_params(
+                    self.bot_id,
+                    self.bot_version,
+                    self.locale_id,
+                    slot_type_name,
+                    description,
+                    resolution_strategy,
+                    parent_slot_type_signature=(
+                        parent_slot_type_signature or self.DEFAULT_PARENT_SLOT_TYPE
+                    ),
+                    regex_pattern=regex_pattern,
+                )
+            )
 
             slot_type_id = response.get("slotTypeId")
             logger.info(
                 f"Extended slot type created: {slot_type_name} ({slot_type_id})"
             )
-            logger.debug("Waiting 10 seconds for AWS Lex to process...")
-            time.sleep(10)
+            ResourceWaiter().wait_for_slot_type(
+                self.bot_id, self.bot_version, self.locale_id, slot_type_id
+            )
             return slot_type_id
 
         except Exception as e:
@@ -140,3 +139,160 @@ class CreateBotSlotsType(BotBase):
             raise BotCreationException(
                 f"Extended slot type creation failed: {e}"
             ) from e
+
+    def update_bot_slot_type(
+        self,
+        slot_type_id: str,
+        slot_type_name: str,
+        description: str,
+        resolution_strategy: Literal[
+            "OriginalValue", "TopResolution", "Concatenation"
+        ] = "OriginalValue",
+        slot_type_values_list: Optional[List[Dict[str, List[str]]]] = None,
+        parent_slot_type_signature: Optional[str] = None,
+        regex_pattern: Optional[str] = None,
+        slot_type_values: Optional[List[Dict]] = None,
+    ) -> Dict:
+        """
+        Replace the definition of an existing custom or extended slot type.
+
+        UpdateSlotType replaces the whole value set, so a custom slot type's
+        values are always sent in one request, never in chunks.
+
+        Args:
+            slot_type_id: Slot type ID to update
+            slot_type_name: Name of the slot type
+            description: Slot type description
+            resolution_strategy: How to handle multiple matches
+            slot_type_values_list: List of {sampleValue: [synonyms]} (custom)
+            parent_slot_type_signature: Parent slot type to extend (extended)
+            regex_pattern: Optional regex filter (extended)
+            slot_type_values: Values already in API format (custom), sent as
+                is instead of slot_type_values_list
+
+        Returns:
+            API response
+
+        Raises:
+            BotCreationException: If update fails
+        """
+        try:
+            logger.info(f"Updating slot type: {slot_type_name} ({slot_type_id})")
+
+            if slot_type_values is None and slot_type_values_list is not None:
+                slot_type_values = self._build_slot_type_values(slot_type_values_list)
+            response = self.LEX_CLIENT.update_slot_type(
+                slotTypeId=slot_type_id,
+                **self._build_slot_type_params(
+                    self.bot_id,
+                    self.bot_version,
+                    self.locale_id,
+                    slot_type_name,
+                    description,
+                    resolution_strategy,
+                    slot_type_values,
+                    parent_slot_type_signature,
+                    regex_pattern,
+                ),
+            )
+            logger.info(f"Slot type updated: {slot_type_name}")
+            return response
+
+        except Exception as e:
+            logger.error(f"Failed to update slot type {slot_type_name}: {e}")
+            raise BotCreationException(f"Slot type update failed: {e}") from e
+
+    def delete_bot_slot_type(self, slot_type_id: str) -> None:
+        """
+        Delete a slot type that is no longer used by any slot.
+
+        Args:
+            slot_type_id: Slot type ID to delete
+
+        Raises:
+            BotCreationException: If deletion fails
+        """
+        try:
+            logger.info(f"Deleting slot type: {slot_type_id}")
+            self.LEX_CLIENT.delete_slot_type(
+                slotTypeId=slot_type_id,
+                botId=self.bot_id,
+                botVersion=self.bot_version,
+                localeId=self.locale_id,
+            )
+        except Exception as e:
+            logger.error(f"Failed to delete slot type {slot_type_id}: {e}")
+            raise BotCreationException(f"Slot type deletion failed: {e}") from e
+
+    @staticmethod
+    def _build_slot_type_params(
+        bot_id: str,
+        bot_version: str,
+        locale_id: str,
+        slot_type_name: str,
+        description: str,
+        resolution_strategy: str,
+        slot_type_values: Optional[List[Dict]] = None,
+        parent_slot_type_signature: Optional[str] = None,
+        regex_pattern: Optional[str] = None,
+    ) -> Dict:
+        """
+        Build the CreateSlotType parameters of a slot type, shared by both
+        provisioning engines; UpdateSlotType takes the same plus slotTypeId.
+
+        Args:
+            bot_id: Bot ID
+            bot_version: Bot version, normally DRAFT
+            locale_id: Locale ID
+            slot_type_name: Name of the slot type
+            description: Slot type description
+            resolution_strategy: How to handle multiple matches
+            slot_type_values: Values in API format (custom)
+            parent_slot_type_signature: Parent slot type to extend (extended)
+            regex_pattern: Optional regex filter (extended)
+
+        Returns:
+            Request parameters
+        """
+        params = {
+            "slotTypeName": slot_type_name,
+            "botId": bot_id,
+            "botVersion": bot_version,
+            "localeId": locale_id,
+            "description": description,
+            "valueSelectionSetting": CreateBotSlotsType._build_value_selection_setting(
+                resolution_strategy, regex_pattern
+            ),
+        }
+        if slot_type_values is not None:
+            params["slotTypeValues"] = slot_type_values
+        if parent_slot_type_signature:
+            params["parentSlotTypeSignature"] = parent_slot_type_signature
+        return params
+
+    @staticmethod
+    def _build_slot_type_values(
+        slot_type_values_list: List[Dict[str, List[str]]],
+    ) -> List[Dict]:
+        """Transform {sampleValue: [synonyms]} entries to API format"""
+        slot_type_values = []
+        for slot_dict in slot_type_values_list:
+            for sample_value, synonyms in slot_dict.items():
+                slot_type_values.append(
+                    {
+                        "sampleValue": {"value": sample_value},
+                        "synonyms": [{"value": syn} for syn in (synonyms or [])],
+                    }
+                )
+        return slot_type_values
+
+    @staticmethod
+    def _build_value_selection_setting(
+        resolution_strategy: str,
+        regex_pattern: Optional[str] = None,
+    ) -> Dict:
+        """Build value selection settings"""
+        value_selection = {"resolutionStrategy": resolution_strategy}
+        if regex_pattern:
+            value_selection["regexFilter"] = {"pattern": regex_pattern}
+        return value_selection
@@ -0,0 +1,257 @@
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+logger = logging.getLogger(__name__)
+
+from bot_engine.universal_bot_orchestrator import CreateUniversalBot
+from bot_engine.utils.dag_scheduler import DagScheduler
+from bot_engine.utils.run_report import critical_path_report, write_run_report
+from bot_engine.utils.yaml_loader import load_bot_config
+from bot_engine.builder.bot_base import BotContext
+from bot_engine.builder.polling_scheduler import POLLING_SCHEDULER
+from common.client_factory import CLIENT_FACTORY
+from common.rate_limiter import RATE_LIMITER
+from common.telemetry import TRACER
+
+
+class FleetDeploymentException(Exception):
+    """Exception raised when one or more bots of a fleet failed to deploy"""
+
+    def __init__(self, message: str, outcomes: List["BotOutcome"]):
+        super().__init__(message)
+        self.outcomes = outcomes
+
+
+class BotOutcome:
+    """Result of deploying one bot template of a fleet"""
+
+    def __init__(self, template: Path):
+        self.template = template
+        self.bot_name: Optional[str] = None
+        self.bot_id: Optional[str] = None
+        self.bot_version: Optional[str] = None
+        self.plan: Optional[DagScheduler] = None
+        # Bot context the bot was deployed in, its status polling group
+        self.context: Optional[BotContext] = None
+        self.seconds = 0.0
+        self.error: Optional[str] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None and self.bot_id is not None
+
+    def to_dict(self) -> Dict:
+        return {
+            "template": str(self.template),
+            "bot_name": self.bot_name,
+            "status": "deployed" if self.succeeded else "failed",
+            "bot_id": self.bot_id,
+            "bot_version": self.bot_version,
+            "seconds": round(self.seconds, 3),
+            "critical_path": critical_path_report(self.plan),
+            "ready_after_seconds": (
+                POLLING_SCHEDULER.readiness(self.context) if self.context else {}
+            ),
+            "error": self.error,
+        }
+
+
+class DeployBotFleet:
+    """
+    Deploys every bot template in a directory concurrently.
+
+    Each bot is created by its own CreateUniversalBot in its own bot
+    context, with its own deployment state and journal. Bots share the
+    process-wide rate limiter, so the fleet stays within one API rate
+    budget, and they split one worker budget: max_bots bots run at once,
+    each with an equal share of max_workers plan workers. A failing bot does
+    not stop the others; the run ends with a per-bot summary.
+    """
+
+    TEMPLATE_PATTERNS = ("*.yaml", "*.yml")
+    MAX_BOTS = 4
+
+    def __init__(
+        self,
+        template_dir: Path,
+        max_bots: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        report_path: Optional[Path] = None,
+        resync_state: bool = False,
+        resume: bool = False,
+    ):
+        """
+        Args:
+            template_dir: Directory of bot templates shaped like bot_template.yaml
+            max_bots: Bots deployed at once (MAX_BOTS if not given)
+            max_workers: Plan workers shared by all running bots
+                (CreateUniversalBot.MAX_WORKERS if not given)
+            report_path: Write a JSON timing report of the fleet run here
+            resync_state: Rebuild each bot's state from its live bot first
+            resume: Continue each bot's last interrupted deployment from its
+                journal; bots with nothing to resume are deployed afresh
+        """
+        self.template_dir = Path(template_dir)
+        self.max_bots = max_bots or self.MAX_BOTS
+        self.max_workers = max_workers or CreateUniversalBot.MAX_WORKERS
+        self.report_path = report_path
+        self.resync_state = resync_state
+        self.resume = resume
+        self.outcomes: List[BotOutcome] = []
+        self.do_operation()
+
+    def __str__(self) -> str:
+        deployed = sum(1 for outcome in self.outcomes if outcome.succeeded)
+        return f"Fleet(bots={len(self.outcomes)}, deployed={deployed})"
+
+    def _templates(self) -> List[Path]:
+        """Bot templates of the fleet, in name order"""
+        templates = sorted(
+            {
+                path
+                for pattern in self.TEMPLATE_PATTERNS
+                for path in self.template_dir.glob(pattern)
+            }
+        )
+        if not templates:
+            raise FleetDeploymentException(
+                f"No bot templates found in {self.template_dir}", []
+            )
+        return templates
+
+    def _load_configs(self) -> Dict[Path, object]:
+        """
+        Load every template, recording failures and duplicate bot names.
+
+        Locale files included by a template also match the template
+        patterns; they are dropped from the fleet rather than deployed.
+
+        Returns:
+            Mapping of template path to bot config, for the deployable ones
+        """
+        configs = {}
+        names: Dict[tuple, Path] = {}
+        for outcome in self.outcomes:
+            try:
+                config = load_bot_config(outcome.template)
+                outcome.bot_name = config.name
+            except Exception as e:
+                outcome.error = f"Invalid template: {e}"
+                continue
+            # Deployment state is kept per bot name and region
+            key = (config.name, config.region)
+            if key in names:
+                outcome.error = (
+                    f"Bot {config.name} in {config.region} is also defined "
+                    f"in {names[key].name}"
+                )
+                continue
+            names[key] = outcome.template
+            configs[outcome.template] = config
+
+        included = {
+            (template.parent / locale.include).resolve()
+            for template, config in configs.items()
+            for locale in config.locale
+            if locale.include
+        }
+        self.outcomes = [
+            outcome
+            for outcome in self.outcomes
+            if outcome.template.resolve() not in included
+        ]
+        return configs
+
+    def _deploy(self, outcome: BotOutcome, bot_config, workers: int) -> None:
+        """Create one bot and record its outcome; never raises"""
+        start = time.monotonic()
+        try:
+            # Steps of every bot are told apart in the run report
+            with TRACER.labels(bot=bot_config.name):
+                bot = CreateUniversalBot(
+                    resync_state=self.resync_state,
+                    resume=self.resume,
+                    bot_config=bot_config,
+                    max_workers=workers,
+                    shared_run=True,
+                )
+            outcome.bot_id = bot.bot_id
+            outcome.bot_version = bot.bot_version
+            outcome.plan = bot.plan
+            outcome.context = bot.context
+        except Exception as e:
+            outcome.error = str(e)
+        finally:
+            outcome.seconds = time.monotonic() - start
+
+    def _log_summary(self) -> None:
+        logger.info("=" * 60)
+        logger.info("Fleet deployment summary:")
+        for outcome in self.outcomes:
+            name = outcome.bot_name or outcome.template.name
+            if outcome.succeeded:
+                logger.info(
+                    f"  OK      {name}: bot {outcome.bot_id} version "
+                    f"{outcome.bot_version} ({outcome.seconds:.1f}s)"
+                )
+            else:
+                logger.error(
+                    f"  FAILED  {name}: {outcome.error} ({outcome.seconds:.1f}s)"
+                )
+        logger.info("=" * 60)
+
+    def do_operation(self) -> None:
+        """
+        Deploy the fleet and summarise the outcome of every bot.
+
+        Raises:
+            FleetDeploymentException: If any bot failed to deploy
+        """
+        TRACER.reset()
+        self.outcomes = [BotOutcome(path) for path in self._templates()]
+        configs = self._load_configs()
+
+        bots = max(1, min(self.max_bots, len(configs)))
+        workers = max(1, self.max_workers // bots)
+        logger.info(
+            f"Deploying {len(configs)} bot(s) from {self.template_dir}: "
+            f"{bots} at once with {workers} worker(s) each"
+        )
+        try:
+            with ThreadPoolExecutor(bots, thread_name_prefix="fleet") as pool:
+                for outcome in self.outcomes:
+                    if outcome.template in configs:
+                        pool.submit(
+                            self._deploy, outcome, configs[outcome.template], workers
+                        )
+        finally:
+            POLLING_SCHEDULER.log_readiness()
+            RATE_LIMITER.log_stats()
+            CLIENT_FACTORY.log_pool_stats()
+            self._log_summary()
+            if self.report_path:
+                # The fleet took as long as its slowest bot
+                slowest = max(
+                    self.outcomes, key=lambda outcome: outcome.seconds, default=None
+                )
+                write_run_report(
+                    self.report_path,
+                    slowest.plan if slowest else None,
+                    slowest.context if slowest else None,
+                    bots=[outcome.to_dict() for outcome in self.outcomes],
+                )
+
+        failed = [outcome for outcome in self.outcomes if not outcome.succeeded]
+        if failed:
+            names = ", ".join(
+                outcome.bot_name or outcome.template.name for outcome in failed
+            )
+            raise FleetDeploymentException(
+                f"{len(failed)} of {len(self.outcomes)} bot(s) failed to deploy: "
+                f"{names}",
+                self.outcomes,
+            )
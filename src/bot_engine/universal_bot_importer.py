@@ -0,0 +1,99 @@
+import logging
+from typing import Optional
+from bot_engine.builder.bot_base import BotBase
+
+
+logger = logging.getLogger(__name__)
+
+from bot_engine.utils.yaml_loader import load_bot_config
+from bot_engine.builder.bot_archive_compiler import BotArchiveCompiler
+from bot_engine.builder.bot_publisher import PublishBot
+from bot_engine.builder.import_builder import CreateBotImport
+from bot_engine.builder.instance_builder import create_bot_service_role_arn
+
+
+class BotCreationException(Exception):
+    """Base exception for bot creation failures"""
+
+    pass
+
+
+class ImportUniversalBot:
+    """Provisions the whole bot through a single Lex import archive"""
+
+    def __init__(self, bot_config=None, overwrite: bool = False):
+        """
+        Args:
+            bot_config: Bot template namespace (bot_template.yaml if not given)
+            overwrite: Replace an existing bot of the same name; by default
+                the import fails instead
+        """
+        self.bot_config = bot_config or load_bot_config()
+        self.overwrite = overwrite
+        self.bot_id: Optional[str] = None
+        self.bot_version: Optional[str] = None
+        self.do_operation()
+
+    def __str__(self) -> str:
+        return f"Bot(id={self.bot_id}, version={self.bot_version})"
+
+    def do_operation(self) -> None:
+        """
+        Compile the template, import it, then build and publish every locale.
+
+        Raises:
+            BotCreationException: If any step fails
+        """
+        try:
+            logger.info("=" * 60)
+            logger.info("Starting bot provisioning through archive import...")
+            logger.info("=" * 60)
+
+            BotBase.set_base(
+                self.bot_config.name,
+                self.bot_config.description,
+                self.bot_config.region,
+            )
+
+            archive = BotArchiveCompiler(self.bot_config).to_zip_bytes()
+
+            importer = CreateBotImport()
+            import_id = importer.upload_archive(archive)
+            self.bot_id = importer.start_bot_import(
+                import_id,
+                self.bot_config.roleArn
+                or create_bot_service_role_arn(self.bot_config.name),
+                self.bot_config.idleSessionTTLInSeconds,
+                self.bot_config.dataPrivacy.childDirected,
+                "Overwrite" if self.overwrite else "FailOnConflict",
+            )
+
+            publisher = PublishBot(self.bot_id)
+            publisher.build_locales(
+                [locale.localeId for locale in self.bot_config.locale]
+            )
+            self.bot_version = publisher.publish(
+                "Bot version based on imported DRAFT",
+                self.bot_config.alias.name,
+                self.bot_config.alias.description,
+                [
+                    {
+                        "Locale": locale.localeId,
+                        "Lambda_arn": locale.lambdaHooks.arn,
+                        "codeHookInterfaceVersion": locale.lambdaHooks.codeHookInterfaceVersion,
+                    }
+                    for locale in self.bot_config.locale
+                ],
+            )
+
+            logger.info("=" * 60)
+            logger.info("Bot import process completed successfully!")
+            logger.info(f"Bot ID: {self.bot_id}")
+            logger.info(f"Bot Version: {self.bot_version}")
+            logger.info("=" * 60)
+
+        except Exception as e:
+            logger.error("=" * 60)
+            logger.error(f"Bot import process failed: {e}")
+            logger.error("=" * 60)
+            raise
@@ -1,19 +1,31 @@
 import logging
-import time
-from typing import Dict, List, Optional
-from bot_engine.builder.bot_base import BotBase
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Set
+from bot_engine.builder.bot_base import BotBase, BotContext
 
 
 logger = logging.getLogger(__name__)
 
-from bot_engine.utils.yaml_loader import bot_config
+from bot_engine.utils.yaml_loader import load_bot_config
+from bot_engine.utils.dag_scheduler import DagExecutionException, DagScheduler
+from bot_engine.utils.deployment_journal import DeploymentJournal
+from bot_engine.utils.deployment_state import DeploymentState, content_hash
+from bot_engine.utils.run_report import write_run_report
+from bot_engine.utils.slot_value_catalog import slot_type_values, values_file_digest
+from bot_engine.builder.bot_inspector import BotInspector
 from bot_engine.builder.instance_builder import CreateBotInstance
 from bot_engine.builder.locale_builder import CreateBuildBotLocale
 from bot_engine.builder.intent_builder import CreateBotIntent
 from bot_engine.builder.slots_type_builder import CreateBotSlotsType
 from bot_engine.builder.alias_builder import CreateBotAlias
-from bot_engine.builder.bot_health_checker import BotHealthChecker
+from bot_engine.builder.polling_scheduler import POLLING_SCHEDULER
+from bot_engine.builder.build_monitor import BuildMonitor
 from bot_engine.builder.version_builder import CreateBotVersion
+from common.client_factory import CLIENT_FACTORY, ClientFactory
+from common.rate_limiter import RATE_LIMITER
+from common.telemetry import TRACER
 
 
 class BotCreationException(Exception):
@@ -37,50 +49,56 @@ class ConfigurationException(BotCreationException):
 class CreateUniversalBot:
     """Main orchestrator for bot creation workflow"""
 
-    MAX_STATUS_RETRIES = 24  # 2 minutes with 5-second intervals
-    RETRY_DELAY = 5
+    MAX_WORKERS = ClientFactory.PLAN_WORKERS
+    NODE_RETRIES = 2
+    # Overall bound on status polling for one deployment, in seconds
+    STATUS_POLL_DEADLINE = 3600
 
-    def __init__(self):
+    def __init__(
+        self,
+        state_path: Optional[Path] = None,
+        resync_state: bool = False,
+        resume: bool = False,
+        report_path: Optional[Path] = None,
+        bot_config=None,
+        max_workers: Optional[int] = None,
+        shared_run: bool = False,
+    ):
+        """
+        Args:
+            state_path: Deployment state file (default per bot and region)
+            resync_state: Rebuild the state from the live bot first
+            resume: Continue the last interrupted deployment from its journal
+            report_path: Write a JSON timing report of the run here
+            bot_config: Bot template namespace (bot_template.yaml if not given)
+            max_workers: Plan nodes run at once (MAX_WORKERS if not given)
+            shared_run: The bot is one of several deployed by this process,
+                so process-wide telemetry is neither reset nor logged here
+        """
+        self.bot_config = bot_config or load_bot_config()
+        self.max_workers = max_workers or self.MAX_WORKERS
+        self.shared_run = shared_run
+        self.context: Optional[BotContext] = None
         self.bot_id: Optional[str] = None
         self.bot_version: Optional[str] = None
+        self.locale_results: Dict[str, Dict[str, Dict[str, str]]] = {}
+        self.state_path = state_path
+        self.resync_state = resync_state
+        self.resume = resume
+        self.report_path = report_path
+        self.state: Optional[DeploymentState] = None
+        self.journal: Optional[DeploymentJournal] = None
+        self.built_locales: Dict[str, Optional[str]] = {}
+        self.plan: Optional[DagScheduler] = None
+        self.actions: Counter = Counter()
+        self._actions_lock = threading.Lock()
+        self._cancel_event = threading.Event()
+        self._create_attempts: Set[str] = set()
         self.do_operation()
 
     def __str__(self) -> str:
         return f"Bot(id={self.bot_id}, version={self.bot_version})"
 
-    def _wait_for_status(
-        self,
-        check_func,
-        status_name: str = "Status",
-        max_retries: int = MAX_STATUS_RETRIES,
-    ) -> None:
-        """
-        Generic method to poll for a status with timeout.
-
-        Args:
-            check_func: Callable that returns True when status is ready
-            status_name: Name of status for logging
-            max_retries: Maximum number of retry attempts
-
-        Raises:
-            BotStatusException: If status check times out
-        """
-        for attempt in range(max_retries):
-            try:
-                if check_func():
-                    logger.info(f"{status_name} check passed")
-                    return
-            except Exception as e:
-                logger.warning(f"{status_name} check attempt {attempt + 1} failed: {e}")
-
-            if attempt < max_retries - 1:
-                time.sleep(self.RETRY_DELAY)
-
-        raise BotStatusException(
-            f"{status_name} check failed after {max_retries} attempts "
-            f"({max_retries * self.RETRY_DELAY} seconds)"
-        )
-
     def _init_bot(self) -> str:
         """
         Create bot instance and return bot ID.
@@ -94,9 +112,9 @@ class CreateUniversalBot:
         try:
             logger.info("Initializing bot instance...")
             bot_id = CreateBotInstance().create_bot_instance(
-                bot_config.idleSessionTTLInSeconds,
-                bot_config.dataPrivacy.childDirected,
-                bot_config.roleArn,
+                self.bot_config.idleSessionTTLInSeconds,
+                self.bot_config.dataPrivacy.childDirected,
+                self.bot_config.roleArn,
             )
             logger.info(f"Bot instance initialized: {bot_id}")
             return bot_id
@@ -104,316 +122,738 @@ class CreateUniversalBot:
             logger.error(f"Failed to initialize bot instance: {e}")
             raise
 
-    def _check_bot_status(self) -> bool:
+    def _deploy_resource(
+        self,
+        key: str,
+        definition,
+        create: Callable[[], str],
+        update: Callable[[str], None],
+        find: Optional[Callable[[], Optional[str]]] = None,
+    ) -> str:
+        """
+        Create, update or skip a resource based on its recorded content hash.
+
+        A create that is retried, or resumed from an interrupted run, may
+        already have succeeded before it failed (e.g. while waiting for the
+        resource). Such a resource is looked up by name first and updated
+        in place rather than created twice.
+
+        Args:
+            key: Deployment state key (the plan node ID)
+            definition: Everything the deployed resource is derived from,
+                including the IDs of resources it references
+            create: Creates the resource and returns its ID
+            update: Updates the resource with the given ID in place
+            find: Returns the ID of an existing resource with the same
+                name, or None
+
+        Returns:
+            Resource ID
+        """
+        digest = content_hash(definition)
+        entry = self.state.get(key)
+        if not entry and find is not None and self._create_attempted(key):
+            found_id = find()
+            if found_id:
+                logger.info(f"{key} exists from an earlier attempt: {found_id}")
+                entry = {"hash": None, "id": found_id}
+
+        if entry and entry["hash"] == digest:
+            logger.debug(f"{key} unchanged, skipping")
+            action, resource_id = "unchanged", entry["id"]
+        elif entry:
+            logger.info(f"{key} changed, updating {entry['id']}")
+            update(entry["id"])
+            action, resource_id = "updated", entry["id"]
+        else:
+            action, resource_id = "created", create()
+
+        self.state.record(key, digest, resource_id)
+        with self._actions_lock:
+            self.actions[action] += 1
+        return resource_id
+
+    def _create_attempted(self, key: str) -> bool:
+        """Whether a create of the resource may have run before, and record it"""
+        with self._actions_lock:
+            attempted = self.resume or key in self._create_attempts
+            self._create_attempts.add(key)
+        return attempted
+
+    def _locale_digest(self, locale_id: str) -> str:
+        """Hash of the recorded definitions of every resource in a locale"""
+        return content_hash(
+            sorted(
+                (key, entry["hash"])
+                for key, entry in self.state.snapshot().items()
+                if key.split(":")[1:2] == [locale_id]
+                and not key.startswith("build:")
+            )
+        )
+
+    def _resync_state(self, bot_id: Optional[str]) -> None:
+        """
+        Rebuild the deployment state from the live bot.
+
+        Resources found on the bot are recorded with their IDs but no hash,
+        so the next plan run updates them to match the template instead of
+        trying to create them again.
+
+        Args:
+            bot_id: ID of the live bot, or None if it does not exist
+        """
+        logger.info("Re-syncing deployment state from the live bot...")
+        self.state.clear()
+        if bot_id is None:
+            self.state.save()
+            return
+
+        inspector = BotInspector()
+        self.state.record("bot", None, bot_id)
+        for locale in self.bot_config.locale:
+            locale_id = locale.localeId
+            if inspector.describe_bot_locale(bot_id, locale_id) is None:
+                continue
+            self.state.record(f"locale:{locale_id}", None, locale_id)
+            live = inspector.describe_locale_resources(bot_id, locale_id)
+
+            for intent in locale.intents:
+                live_intent = live["intents"].get(intent.name)
+                if live_intent:
+                    for kind in ("intent", "slot_priority"):
+                        self.state.record(
+                            f"{kind}:{locale_id}:{intent.name}",
+                            None,
+                            live_intent["intentId"],
+                        )
+
+            for slot in locale.slotDefinitions:
+                live_slot_type = live["slotTypes"].get(slot.name)
+                if slot.type in ("Custom", "Extended") and live_slot_type:
+                    self.state.record(
+                        f"slot_type:{locale_id}:{slot.name}",
+                        None,
+                        live_slot_type["slotTypeId"],
+                    )
+                live_intent = live["intents"].get(slot.intent) or {}
+                live_slot = live_intent.get("slots", {}).get(slot.slotPhraseName)
+                if live_slot:
+                    self.state.record(
+                        f"slot:{locale_id}:{slot.intent}:{slot.name}",
+                        None,
+                        live_slot["slotId"],
+                    )
+            locale.release()
+
+        bot_alias_id = inspector.find_alias_id(bot_id, self.bot_config.alias.name)
+        if bot_alias_id:
+            self.state.record("alias", None, bot_alias_id)
+
+        self.state.save()
+        logger.info(f"Re-synced {len(self.state.resources)} resources")
+
+    def _load_state(self) -> None:
+        """Load the deployment state, re-syncing it if it has drifted"""
+        path = self.state_path or DeploymentState.default_path(
+            self.bot_config.name, self.bot_config.region
+        )
+        self.state = (
+            DeploymentState(path) if self.resync_state else DeploymentState.load(path)
+        )
+
+        live_bot_id = BotInspector().find_bot_id(self.bot_config.name)
+        recorded_bot = self.state.get("bot") or {}
+        if self.resync_state or recorded_bot.get("id") != live_bot_id:
+            self._resync_state(live_bot_id)
+
+    def _open_journal(self) -> Dict[str, str]:
         """
-        Check if bot status is Available.
+        Start a journaled run, or continue the last one in resume mode.
 
         Returns:
-            True if available
+            Results of plan nodes completed by the interrupted run
 
         Raises:
-            BotStatusException: If status check fails
+            BotCreationException: If the journaled bot no longer exists
         """
-        bot_status = BotHealthChecker().get_bot_status(self.bot_id)
-        return bot_status == "Available"
+        self.journal = DeploymentJournal(
+            DeploymentJournal.path_for_state(self.state.path)
+        )
+        if not self.resume:
+            self.journal.begin()
+            return {}
+
+        completed = self.journal.resume()
+        live_bot_id = (self.state.get("bot") or {}).get("id")
+        if "bot" in completed and completed["bot"] != live_bot_id:
+            raise BotCreationException(
+                f"Journaled bot {completed['bot']} no longer exists; "
+                "run again without --resume"
+            )
+
+        # Steps finished before a crash may never have reached the state file
+        for node_id, result in completed.items():
+            if result is not None and node_id != "version":
+                if self.state.get(node_id) is None:
+                    self.state.record(node_id, None, result)
 
-    def _check_bot_locale_status(self, locale_id: str) -> bool:
+        # Builds started before the crash still have to be monitored; their
+        # locales were complete by then, so their digest is the recorded one
+        for node_id in completed:
+            kind, _, locale_id = node_id.partition(":")
+            if kind == "build":
+                self.built_locales[locale_id] = self._locale_digest(locale_id)
+
+        self.bot_id = completed.get("bot")
+        self.bot_version = completed.get("version")
+        return completed
+
+    def _create_locale(self, locale) -> str:
         """
-        Check if bot locale status is NotBuilt.
+        Create a locale and wait for it to be ready.
 
         Args:
-            locale_id: Locale to check
+            locale: Locale configuration from config
 
         Returns:
-            True if NotBuilt
+            Locale ID
 
         Raises:
-            BotStatusException: If status check fails
+            BotCreationException: If locale creation fails
         """
-        locale_status = BotHealthChecker().get_bot_locale_status(
-            self.bot_id, "DRAFT", locale_id
+        logger.info(f"Initializing locale: {locale.localeId}")
+        CreateBuildBotLocale(self.bot_id, locale.localeId).create_bot_locale(
+            locale.nluIntentConfidenceThreshold,
+            locale.voiceSettings.voiceId,
+            locale.voiceSettings.engine,
+        )
+        return locale.localeId
+
+    def _update_locale(self, locale) -> None:
+        """Update the NLU and voice settings of an existing locale"""
+        CreateBuildBotLocale(self.bot_id, locale.localeId).update_bot_locale(
+            locale.nluIntentConfidenceThreshold,
+            locale.voiceSettings.voiceId,
+            locale.voiceSettings.engine,
         )
-        return locale_status == "NotBuilt"
 
-    def _create_slot_types(
-        self,
-        locale_id: str,
-        slot_definitions: List,
-    ) -> Dict[str, str]:
+    def _create_slot_type(self, locale_id: str, slot) -> str:
         """
-        Create custom and extended slot types.
+        Create a single custom or extended slot type.
 
         Args:
             locale_id: Locale ID
-            slot_definitions: Slot definitions from config
+            slot: Slot definition from config
 
         Returns:
-            Mapping of slot name to slot type ID
+            Slot type ID
 
         Raises:
             BotCreationException: If slot type creation fails
         """
-        slots_type_id_set = {}
-
         try:
-            logger.info(f"Creating slot types for locale {locale_id}")
             slots_type_obj = CreateBotSlotsType(self.bot_id, locale_id, "DRAFT")
 
-            for slot in slot_definitions:
-                try:
-                    if slot.type == "Custom":
-                        logger.debug(f"Creating custom slot type: {slot.name}")
-                        slot_type_values = [
-                            {val.sampleValue: val.synonyms}
-                            for val in slot.slotType.slotTypeValues
-                        ]
-                        slot_type_id = slots_type_obj.create_bot_slot_type_custom(
-                            slot.name,
-                            slot.description,
-                            slot_type_values,
-                            slot.slotType.resolutionStrategy,
-                        )
-                        slots_type_id_set[slot.name] = slot_type_id
-
-                    elif slot.type == "Extended":
-                        logger.debug(f"Creating extended slot type: {slot.name}")
-                        slot_type_id = slots_type_obj.create_bot_slot_type_extended(
-                            slot.name,
-                            slot.description,
-                            slot.slotType.parentSlotTypeSignature,
-                            slot.slotType.regexPattern,
-                            slot.slotType.resolutionStrategy,
-                        )
-                        slots_type_id_set[slot.name] = slot_type_id
-
-                except Exception as e:
-                    logger.error(f"Failed to create slot type {slot.name}: {e}")
-                    raise
+            if slot.type == "Custom":
+                logger.debug(f"Creating custom slot type: {slot.name}")
+                return slots_type_obj.create_bot_slot_type_custom(
+                    slot.name,
+                    slot.description,
+                    resolution_strategy=slot.slotType.resolutionStrategy,
+                    slot_type_values=slot_type_values(
+                        slot.slotType, self.bot_config.template_dir
+                    ),
+                )
 
-            logger.info(f"Successfully created {len(slots_type_id_set)} slot types")
-            return slots_type_id_set
+            logger.debug(f"Creating extended slot type: {slot.name}")
+            return slots_type_obj.create_bot_slot_type_extended(
+                slot.name,
+                slot.description,
+                slot.slotType.parentSlotTypeSignature,
+                slot.slotType.regexPattern,
+                slot.slotType.resolutionStrategy,
+            )
 
         except Exception as e:
-            logger.error(f"Failed to create slot types for locale {locale_id}: {e}")
+            logger.error(f"Failed to create slot type {slot.name}: {e}")
             raise
 
-    def _create_intents(
-        self,
-        locale_id: str,
-        intents_config: List,
-    ) -> Dict[str, str]:
+    def _update_slot_type(self, locale_id: str, slot, slot_type_id: str) -> None:
+        """Update an existing custom or extended slot type in place"""
+        slots_type_obj = CreateBotSlotsType(self.bot_id, locale_id, "DRAFT")
+        if slot.type == "Custom":
+            slots_type_obj.update_bot_slot_type(
+                slot_type_id,
+                slot.name,
+                slot.description,
+                slot.slotType.resolutionStrategy,
+                slot_type_values=slot_type_values(
+                    slot.slotType, self.bot_config.template_dir
+                ),
+            )
+        else:
+            slots_type_obj.update_bot_slot_type(
+                slot_type_id,
+                slot.name,
+                slot.description,
+                slot.slotType.resolutionStrategy,
+                parent_slot_type_signature=slot.slotType.parentSlotTypeSignature,
+                regex_pattern=slot.slotType.regexPattern,
+            )
+
+    def _create_intent(self, locale_id: str, intent) -> str:
         """
-        Create intents.
+        Create a single intent.
 
         Args:
             locale_id: Locale ID
-            intents_config: Intent configurations from config
+            intent: Intent configuration from config
 
         Returns:
-            Mapping of intent name to intent ID
+            Intent ID
 
         Raises:
             BotCreationException: If intent creation fails
         """
-        intent_id_set = {}
-
         try:
-            logger.info(f"Creating intents for locale {locale_id}")
+            logger.info(f"Creating intent: {intent.name}")
             intent_obj = CreateBotIntent("DRAFT", locale_id, self.bot_id)
-
-            for intent in intents_config:
-                try:
-                    logger.info(f"Creating intent: {intent.name}")
-                    intent_id = intent_obj.create_bot_intent(
-                        intent.name,
-                        intent.description,
-                        intent.sampleUtterances,
-                        intent.codeHook,
-                    )
-                    intent_id_set[intent.name] = intent_id
-                    logger.info(
-                        f"Successfully created intent: {intent.name} (ID: {intent_id})"
-                    )
-                except Exception as e:
-                    logger.error(f"Failed to create intent {intent.name}: {e}")
-                    raise
-
-            logger.info(f"Successfully created {len(intent_id_set)} intents")
-            return intent_id_set
+            intent_id = intent_obj.create_bot_intent(
+                intent.name,
+                intent.description,
+                intent.sampleUtterances,
+                intent.codeHook,
+            )
+            logger.info(f"Successfully created intent: {intent.name} (ID: {intent_id})")
+            return intent_id
 
         except Exception as e:
-            logger.error(f"Failed to create intents for locale {locale_id}: {e}")
+            logger.error(f"Failed to create intent {intent.name}: {e}")
             raise
 
-    def _add_slots_to_intents(
+    def _create_slot(
         self,
         locale_id: str,
-        slot_definitions: List,
-        intent_id_set: Dict[str, str],
-        slots_type_id_set: Dict[str, str],
-    ) -> None:
+        slot,
+        intent_id: str,
+        slot_type_id: str,
+    ) -> str:
         """
-        Add slots to intents with proper priority ordering.
+        Create a single slot in an intent.
 
         Args:
             locale_id: Locale ID
-            slot_definitions: Slot definitions from config
-            intent_id_set: Mapping of intent names to IDs
-            slots_type_id_set: Mapping of slot names to type IDs
+            slot: Slot definition from config
+            intent_id: ID of the intent to add the slot to
+            slot_type_id: ID of the slot type (custom, extended or built-in)
+
+        Returns:
+            Slot ID
 
         Raises:
-            BotCreationException: If slot binding fails
+            BotCreationException: If slot creation fails
         """
         try:
-            logger.info(f"Adding slots to intents for locale {locale_id}")
+            logger.debug(
+                f"Adding {slot.type} slot '{slot.name}' to intent '{slot.intent}'"
+            )
             intent_obj = CreateBotIntent("DRAFT", locale_id, self.bot_id)
-            intent_slot_priorities = {}
+            return intent_obj.create_slot_in_intent(
+                slot.slotPhraseName,
+                slot_type_id,
+                intent_id,
+                slot.slotConstraint,
+            )
 
-            for slot in slot_definitions:
-                intent_name = slot.intent
-                target_intent_id = intent_id_set.get(intent_name)
+        except Exception as e:
+            logger.error(f"Failed to add slot {slot.name} to intent: {e}")
+            raise
 
-                if target_intent_id is None:
-                    logger.warning(
-                        f"Slot '{slot.name}' references non-existent intent '{intent_name}'. "
-                        "Skipping."
-                    )
-                    continue
-
-                if target_intent_id not in intent_slot_priorities:
-                    intent_slot_priorities[target_intent_id] = {
-                        "intent_name": intent_name,
-                        "slots": [],
-                    }
-
-                try:
-                    if slot.type in ("Custom", "Extended"):
-                        if slot.name not in slots_type_id_set:
-                            raise ConfigurationException(
-                                f"Slot type '{slot.name}' not found in created slot types"
-                            )
-                        logger.debug(
-                            f"Adding {slot.type} slot '{slot.name}' to intent '{intent_name}'"
-                        )
-                        slot_id = intent_obj.create_slot_in_intent(
-                            slot.slotPhraseName,
-                            slots_type_id_set[slot.name],
-                            target_intent_id,
-                            slot.slotConstraint,
-                        )
+    def _update_intent(
+        self,
+        locale_id: str,
+        intent,
+        intent_id: str,
+        slot_priorities_list: Optional[List[Dict]] = None,
+    ) -> None:
+        """
+        Update an intent, optionally with its slot priorities, in one call.
 
-                    elif slot.type == "BuiltIn":
-                        logger.debug(
-                            f"Adding BuiltIn slot '{slot.name}' to intent '{intent_name}'"
-                        )
-                        slot_id = intent_obj.create_slot_in_intent(
-                            slot.slotPhraseName,
-                            slot.slotTypeId,
-                            target_intent_id,
-                            slot.slotConstraint,
-                        )
-                    else:
-                        logger.warning(f"Unknown slot type: {slot.type}. Skipping.")
-                        continue
+        UpdateIntent replaces the whole definition, so the description,
+        utterances and hooks are always sent along with the priorities.
 
-                    intent_slot_priorities[target_intent_id]["slots"].append(
-                        {"slotId": slot_id, "priority": slot.priority}
-                    )
+        Args:
+            locale_id: Locale ID
+            intent: Intent configuration from config
+            intent_id: Intent ID
+            slot_priorities_list: Optional list of {slotId, priority}
 
-                except Exception as e:
-                    logger.error(f"Failed to add slot {slot.name} to intent: {e}")
-                    raise
-
-            # Update intent slot priorities
-            for intent_id, intent_data in intent_slot_priorities.items():
-                slot_priorities_list = intent_data["slots"]
-                intent_name = intent_data["intent_name"]
-                if slot_priorities_list:
-                    logger.debug(
-                        f"Updating slot priorities for intent {intent_id}: "
-                        f"{len(slot_priorities_list)} slots"
-                    )
-                    intent_obj.update_intent_slot_priority(
-                        intent_id, intent_name, slot_priorities_list
-                    )
+        Raises:
+            BotCreationException: If the update fails
+        """
+        if slot_priorities_list:
+            logger.debug(
+                f"Updating slot priorities for intent {intent_id}: "
+                f"{len(slot_priorities_list)} slots"
+            )
+        CreateBotIntent("DRAFT", locale_id, self.bot_id).update_intent(
+            intent_id,
+            intent.name,
+            intent.description,
+            intent.sampleUtterances,
+            intent.codeHook,
+            slot_priorities_list,
+        )
 
-            logger.info("All slots added to intents successfully")
+    def _build_bot_locale(self, locale_id: str) -> None:
+        """
+        Start the build of a bot locale.
 
-        except Exception as e:
-            logger.error(f"Failed to add slots to intents: {e}")
-            raise
+        Args:
+            locale_id: Locale ID
 
-    def _init_language_intent_slots(self) -> None:
+        Raises:
+            BotCreationException: If build fails
         """
-        Initialize locales with intents and slots.
+        logger.info(f"Building locale: {locale_id}")
+        response = CreateBuildBotLocale(self.bot_id, locale_id).build_bot_locale(
+            "DRAFT"
+        )
+        logger.debug(f"Build response for {locale_id}: {response}")
 
-        Raises:
-            BotCreationException: If initialization fails
+    def _plan_locale(
+        self, plan: DagScheduler, locale, after: Sequence[str] = ()
+    ) -> List[str]:
         """
-        try:
-            for locale in bot_config.locale:
-                logger.info(f"Initializing locale: {locale.localeId}")
-
-                # Create locale
-                locale_builder = CreateBuildBotLocale(self.bot_id, locale.localeId)
-                locale_builder.create_bot_locale(
-                    locale.nluIntentConfidenceThreshold,
-                    locale.voiceSettings.voiceId,
-                    locale.voiceSettings.engine,
-                )
+        Add the nodes that provision one locale to the plan.
+
+        Each node creates its resource, updates it in place if its
+        definition changed since the last deployment, or skips it. Nodes
+        look their intent or slot up by name when they run, so the plan
+        holds no reference to a locale's definitions and a locale loaded
+        from an include file can be released between planning and running.
+
+        Args:
+            plan: Provisioning plan
+            locale: Locale configuration from config
+            after: Nodes that must complete before the locale is created
 
-                # Wait for locale to be ready
-                logger.info(f"Waiting for locale {locale.localeId} to be ready...")
-                self._wait_for_status(
-                    lambda loc_id=locale.localeId: self._check_bot_locale_status(
-                        loc_id
+        Returns:
+            IDs of the locale's build node dependencies
+        """
+        locale_id = locale.localeId
+        locale_node = plan.add_node(
+            f"locale:{locale_id}",
+            lambda inputs: self._deploy_resource(
+                f"locale:{locale_id}",
+                {
+                    "nluIntentConfidenceThreshold": locale.nluIntentConfidenceThreshold,
+                    "voiceSettings": locale.voiceSettings,
+                },
+                lambda: self._create_locale(locale),
+                lambda _: self._update_locale(locale),
+                lambda: (
+                    locale_id
+                    if BotInspector().describe_bot_locale(self.bot_id, locale_id)
+                    else None
+                ),
+            ),
+            ["bot", *after],
+            self.NODE_RETRIES,
+        )
+        locale_nodes = [locale_node]
+
+        slot_type_nodes = {}
+        for slot in locale.slotDefinitions:
+            if slot.type not in ("Custom", "Extended"):
+                continue
+            slot_type_node = f"slot_type:{locale_id}:{slot.name}"
+
+            def deploy_slot_type(inputs, name=slot.name, key=slot_type_node) -> str:
+                slot = locale.get_slot(name)
+                definition = {
+                    "type": slot.type,
+                    "description": slot.description,
+                    "slotType": slot.slotType,
+                }
+                # A catalog edit must redeploy the slot type like a template edit
+                if slot.slotType.valuesFile:
+                    definition["valuesFileDigest"] = values_file_digest(
+                        slot.slotType, self.bot_config.template_dir
+                    )
+                return self._deploy_resource(
+                    key,
+                    definition,
+                    lambda: self._create_slot_type(locale_id, slot),
+                    lambda slot_type_id: self._update_slot_type(
+                        locale_id, slot, slot_type_id
+                    ),
+                    lambda: BotInspector().find_slot_type_id(
+                        self.bot_id, locale_id, name
                     ),
-                    f"Locale {locale.localeId}",
                 )
 
-                # Create slot types
-                slots_type_id_set = self._create_slot_types(
-                    locale.localeId, locale.slotDefinitions
+            slot_type_nodes[slot.name] = plan.add_node(
+                slot_type_node, deploy_slot_type, [locale_node], self.NODE_RETRIES
+            )
+        locale_nodes.extend(slot_type_nodes.values())
+
+        intent_nodes = {}
+        for intent in locale.intents:
+            intent_node = f"intent:{locale_id}:{intent.name}"
+
+            def deploy_intent(inputs, name=intent.name, key=intent_node) -> str:
+                intent = locale.get_intent(name)
+                return self._deploy_resource(
+                    key,
+                    intent,
+                    lambda: self._create_intent(locale_id, intent),
+                    lambda intent_id: self._update_intent(locale_id, intent, intent_id),
+                    lambda: BotInspector().find_intent_id(self.bot_id, locale_id, name),
                 )
 
-                # Create intents
-                intent_id_set = self._create_intents(locale.localeId, locale.intents)
+            intent_nodes[intent.name] = plan.add_node(
+                intent_node, deploy_intent, [locale_node], self.NODE_RETRIES
+            )
+        locale_nodes.extend(intent_nodes.values())
+
+        intent_slot_nodes = {name: [] for name in intent_nodes}
+        for slot in locale.slotDefinitions:
+            intent_node = intent_nodes.get(slot.intent)
+            if intent_node is None:
+                logger.warning(
+                    f"Slot '{slot.name}' references non-existent intent '{slot.intent}'. "
+                    "Skipping."
+                )
+                continue
+            if slot.type not in ("Custom", "Extended", "BuiltIn"):
+                logger.warning(f"Unknown slot type: {slot.type}. Skipping.")
+                continue
+
+            slot_type_node = slot_type_nodes.get(slot.name)
+            slot_node = f"slot:{locale_id}:{slot.intent}:{slot.name}"
+
+            def deploy_slot(
+                inputs,
+                name=slot.name,
+                intent_node=intent_node,
+                slot_type_node=slot_type_node,
+                key=slot_node,
+            ) -> str:
+                slot = locale.get_slot(name)
+                intent_id = inputs[intent_node]
+                slot_type_id = (
+                    inputs[slot_type_node] if slot_type_node else slot.slotTypeId
+                )
+                return self._deploy_resource(
+                    key,
+                    {
+                        "slotPhraseName": slot.slotPhraseName,
+                        "slotConstraint": slot.slotConstraint,
+                        "slotTypeId": slot_type_id,
+                        "intentId": intent_id,
+                    },
+                    lambda: self._create_slot(locale_id, slot, intent_id, slot_type_id),
+                    lambda slot_id: CreateBotIntent(
+                        "DRAFT", locale_id, self.bot_id
+                    ).update_slot_in_intent(
+                        slot_id,
+                        slot.slotPhraseName,
+                        slot_type_id,
+                        intent_id,
+                        slot.slotConstraint,
+                    ),
+                    lambda: BotInspector().find_slot_id(
+                        self.bot_id, locale_id, intent_id, slot.slotPhraseName
+                    ),
+                )
 
-                # Add slots to intents
-                self._add_slots_to_intents(
-                    locale.localeId,
-                    locale.slotDefinitions,
-                    intent_id_set,
-                    slots_type_id_set,
+            plan.add_node(
+                slot_node,
+                deploy_slot,
+                [intent_node] + ([slot_type_node] if slot_type_node else []),
+                self.NODE_RETRIES,
+            )
+            intent_slot_nodes[slot.intent].append((slot_node, slot.priority))
+
+        for intent in locale.intents:
+            slot_nodes = intent_slot_nodes[intent.name]
+            if not slot_nodes:
+                continue
+            intent_node = intent_nodes[intent.name]
+            priority_node = f"slot_priority:{locale_id}:{intent.name}"
+
+            def deploy_slot_priorities(
+                inputs,
+                name=intent.name,
+                intent_node=intent_node,
+                slot_nodes=slot_nodes,
+                key=priority_node,
+            ) -> str:
+                intent = locale.get_intent(name)
+                intent_id = inputs[intent_node]
+                slot_priorities_list = [
+                    {"slotId": inputs[slot_node], "priority": priority}
+                    for slot_node, priority in slot_nodes
+                ]
+
+                def apply(_=None) -> str:
+                    self._update_intent(
+                        locale_id, intent, intent_id, slot_priorities_list
+                    )
+                    return intent_id
+
+                # The intent definition is part of the hash because an
+                # intent update without priorities clears them
+                return self._deploy_resource(
+                    key,
+                    {"intent": intent, "slotPriorities": slot_priorities_list},
+                    apply,
+                    apply,
                 )
 
-                logger.info(f"Locale {locale.localeId} initialization complete")
+            locale_nodes.append(
+                plan.add_node(
+                    priority_node,
+                    deploy_slot_priorities,
+                    [intent_node] + [slot_node for slot_node, _ in slot_nodes],
+                    self.NODE_RETRIES,
+                )
+            )
 
-        except Exception as e:
-            logger.error(f"Failed to initialize language, intents, and slots: {e}")
-            raise
+        return locale_nodes
 
-    def _build_bot_locales(self) -> None:
+    def _build_provisioning_plan(self) -> DagScheduler:
         """
-        Build all bot locales.
+        Model bot provisioning as a DAG of resource nodes.
+
+        bot -> locale -> {slot types, intents} -> slots -> slot priorities
+        -> locale build -> build monitor -> version -> alias, with each node
+        started as soon as the nodes it depends on have completed. Each
+        locale build is started as soon as that locale is provisioned, and
+        one monitor node then waits for all of them to reach Built.
+        Resources, builds and the version are skipped when nothing they
+        derive from has changed. Locales kept in include files are
+        provisioned one after another, each starting once the previous
+        one's build has started, so peak memory is that of the largest
+        locale.
 
-        Raises:
-            BotCreationException: If build fails
+        Returns:
+            Scheduler holding the provisioning plan
         """
-        try:
-            logger.info("Building bot locales...")
-            for locale in bot_config.locale:
-                logger.info(f"Building locale: {locale.localeId}")
-                response = CreateBuildBotLocale(
-                    self.bot_id, locale.localeId
-                ).build_bot_locale("DRAFT")
-                logger.debug(f"Build response for {locale.localeId}: {response}")
+        plan = DagScheduler(
+            self.max_workers, self._cancel_event, self.journal.record_node
+        )
 
-            logger.info("All locales built successfully")
+        def init_bot(inputs: Dict) -> str:
+            # Creating and updating the bot wait for it to be Available
+            self.bot_id = self._deploy_resource(
+                "bot",
+                {
+                    "description": self.bot_config.description,
+                    "idleSessionTTLInSeconds": self.bot_config.idleSessionTTLInSeconds,
+                    "dataPrivacy": self.bot_config.dataPrivacy,
+                    "roleArn": self.bot_config.roleArn,
+                },
+                self._init_bot,
+                lambda bot_id: CreateBotInstance().update_bot_instance(
+                    bot_id,
+                    self.bot_config.idleSessionTTLInSeconds,
+                    self.bot_config.description,
+                ),
+            )
+            return self.bot_id
+
+        plan.add_node("bot", init_bot)
+
+        build_nodes = []
+        # Included locales are provisioned one after another and released
+        # once their build starts, so only one of them is in memory
+        previous_included: List[str] = []
+        for locale in self.bot_config.locale:
+            after = previous_included if locale.include else []
+            locale_nodes = self._plan_locale(plan, locale, after)
+            locale.release()
+
+            def build_locale(inputs, locale=locale) -> None:
+                locale_id = locale.localeId
+                locale.release()
+                digest = self._locale_digest(locale_id)
+                entry = self.state.get(f"build:{locale_id}")
+                if entry and entry["hash"] == digest:
+                    logger.info(f"Locale {locale_id} unchanged since last build")
+                    return
+                self._build_bot_locale(locale_id)
+                self.built_locales[locale_id] = digest
+
+            build_node = plan.add_node(
+                f"build:{locale.localeId}",
+                build_locale,
+                locale_nodes,
+                self.NODE_RETRIES,
+            )
+            build_nodes.append(build_node)
+            if locale.include:
+                previous_included = [build_node]
 
-        except Exception as e:
-            logger.error(f"Failed to build bot locales: {e}")
-            raise
+        def init_version(inputs: Dict) -> str:
+            digest = content_hash(
+                {
+                    locale.localeId: self._locale_digest(locale.localeId)
+                    for locale in self.bot_config.locale
+                }
+            )
+            entry = self.state.get("version")
+            if entry and entry["hash"] == digest:
+                logger.info(f"No locale changed, keeping version {entry['id']}")
+                self.bot_version = entry["id"]
+            else:
+                self.bot_version = self._init_version()
+                self.state.record("version", digest, self.bot_version)
+            # Builds are only recorded once a version was cut from them, so a
+            # failed build is retried on the next run; a rebuild of unchanged
+            # locales is recorded too, or every later run would rebuild them
+            for locale_id, locale_digest in self.built_locales.items():
+                self.state.record(f"build:{locale_id}", locale_digest, locale_id)
+            return self.bot_version
+
+        def init_alias(inputs: Dict) -> str:
+            return self._deploy_resource(
+                "alias",
+                {
+                    "name": self.bot_config.alias.name,
+                    "description": self.bot_config.alias.description,
+                    "botVersion": self.bot_version,
+                    "localeSettings": self._alias_locale_settings(),
+                },
+                self._init_alias,
+                self._init_alias,
+            )
+
+        def monitor_builds(inputs: Dict) -> None:
+            if self.built_locales:
+                BuildMonitor().wait_for_builds(
+                    self.bot_id, list(self.built_locales), "DRAFT", self._cancel_event
+                )
+
+        plan.add_node("build_monitor", monitor_builds, build_nodes)
+        plan.add_node("version", init_version, ["build_monitor"])
+        plan.add_node("alias", init_alias, ["version"])
+        return plan
+
+    def _collect_locale_results(self, results: Dict[str, str]) -> None:
+        """Collect per-locale slot type and intent IDs from plan results"""
+        self.locale_results = {}
+        for node_id, result in results.items():
+            kind, _, rest = node_id.partition(":")
+            if kind not in ("slot_type", "intent"):
+                continue
+            locale_id, _, name = rest.partition(":")
+            locale_result = self.locale_results.setdefault(
+                locale_id, {"slotTypes": {}, "intents": {}}
+            )
+            key = "slotTypes" if kind == "slot_type" else "intents"
+            locale_result[key][name] = result
 
     def _init_version(self) -> str:
         """
@@ -428,7 +868,7 @@ class CreateUniversalBot:
         try:
             logger.info("Creating bot version...")
             bot_version_locale_spec = [
-                {locale.localeId: "DRAFT"} for locale in bot_config.locale
+                {locale.localeId: "DRAFT"} for locale in self.bot_config.locale
             ]
 
             version_builder = CreateBotVersion(self.bot_id)
@@ -443,10 +883,27 @@ class CreateUniversalBot:
             logger.error(f"Failed to create bot version: {e}")
             raise
 
-    def _init_alias(self) -> None:
+    def _alias_locale_settings(self) -> List[Dict[str, str]]:
+        """Alias locale settings from config"""
+        return [
+            {
+                "Locale": locale.localeId,
+                "Lambda_arn": locale.lambdaHooks.arn,
+                "codeHookInterfaceVersion": locale.lambdaHooks.codeHookInterfaceVersion,
+            }
+            for locale in self.bot_config.locale
+        ]
+
+    def _init_alias(self, bot_alias_id: Optional[str] = None) -> str:
         """
         Create and configure bot alias.
 
+        Args:
+            bot_alias_id: Existing alias to repoint instead of creating one
+
+        Returns:
+            Alias ID
+
         Raises:
             BotCreationException: If alias creation/config fails
         """
@@ -454,29 +911,22 @@ class CreateUniversalBot:
             logger.info("Creating and configuring bot alias...")
             alias_builder = CreateBotAlias(
                 self.bot_id,
-                bot_config.alias.name,
-                bot_config.alias.description,
+                self.bot_config.alias.name,
+                self.bot_config.alias.description,
             )
-            bot_alias_id = alias_builder.create_bot_alias()
-            logger.info(f"Bot alias created: {bot_alias_id}")
-
-            # Configure alias with locale settings
-            alias_locale_settings = [
-                {
-                    "Locale": locale.localeId,
-                    "Lambda_arn": locale.lambdaHooks.arn,
-                    "codeHookInterfaceVersion": locale.lambdaHooks.codeHookInterfaceVersion,
-                }
-                for locale in bot_config.locale
-            ]
+            if bot_alias_id is None:
+                bot_alias_id = alias_builder.create_bot_alias()
+                logger.info(f"Bot alias created: {bot_alias_id}")
 
             if self.bot_version is None:
                 raise ValueError("Bot version not set before alias configuration")
 
+            # Configure alias with locale settings
             alias_builder.update_bot_alias(
-                bot_alias_id, self.bot_version, alias_locale_settings
+                bot_alias_id, self.bot_version, self._alias_locale_settings()
             )
             logger.info("Bot alias configuration complete")
+            return bot_alias_id
 
         except Exception as e:
             logger.error(f"Failed to create/configure bot alias: {e}")
@@ -486,42 +936,35 @@ class CreateUniversalBot:
         """
         Main orchestration method for complete bot creation workflow.
 
+        Every builder runs in this bot's own BotContext, so several bots can
+        be created concurrently in one process.
+
         Raises:
             BotCreationException: If any step fails
         """
+        if not self.shared_run:
+            TRACER.reset()
+        plan = None
         try:
             logger.info("=" * 60)
-            logger.info("Starting universal bot creation process...")
+            logger.info(f"Starting universal bot creation: {self.bot_config.name}")
             logger.info("=" * 60)
 
-            # Set base configuration
-            BotBase.set_base(
-                bot_config.name,
-                bot_config.description,
-                bot_config.region,
-            )
+            with TRACER.span("set_base"):
+                self.context = BotContext(
+                    self.bot_config.name,
+                    self.bot_config.description,
+                    self.bot_config.region,
+                    cancel_event=self._cancel_event,
+                )
 
-            # Create bot instance
-            self.bot_id = self._init_bot()
+            with BotBase.use_context(self.context):
+                plan = self._provision()
 
-            # Wait for bot to be available
-            logger.info("Waiting for bot to be available...")
-            self._wait_for_status(
-                self._check_bot_status,
-                "Bot availability",
+            summary = ", ".join(
+                f"{count} {action}" for action, count in sorted(self.actions.items())
             )
-
-            # Initialize locales, intents, and slots
-            self._init_language_intent_slots()
-
-            # Build bot locales
-            self._build_bot_locales()
-
-            # Create version
-            self.bot_version = self._init_version()
-
-            # Setup alias
-            self._init_alias()
+            logger.info(f"Resources: {summary}")
 
             logger.info("=" * 60)
             logger.info("Bot creation process completed successfully!")
@@ -534,6 +977,47 @@ class CreateUniversalBot:
             logger.error(f"Bot creation process failed: {e}")
             logger.error("=" * 60)
             raise
+        finally:
+            if self.report_path:
+                write_run_report(self.report_path, plan, self.context)
+
+    def _provision(self) -> DagScheduler:
+        """
+        Load the deployment state and run the provisioning plan.
+
+        Returns:
+            The plan that ran
+        """
+        with TRACER.span("load_state"):
+            self._load_state()
+        with TRACER.span("open_journal"):
+            completed = self._open_journal()
+        POLLING_SCHEDULER.set_deadline(self.STATUS_POLL_DEADLINE, self.context)
+
+        # Run the provisioning plan: bot, locales, slot types, intents,
+        # slots, priorities, builds, version and alias
+        plan = self.plan = self._build_provisioning_plan()
+        logger.info(
+            f"Provisioning plan has {len(plan.nodes)} nodes, "
+            f"{len(completed)} already completed"
+        )
+        try:
+            with TRACER.span("provisioning_plan", nodes=len(plan.nodes)):
+                results = plan.run(completed)
+            self._collect_locale_results(results)
+            self.journal.complete()
+        except DagExecutionException as e:
+            raise BotCreationException(str(e)) from e
+        finally:
+            with TRACER.span("save_state"):
+                self.state.save()
+            POLLING_SCHEDULER.set_deadline(None, self.context)
+            plan.log_critical_path()
+            if not self.shared_run:
+                POLLING_SCHEDULER.log_readiness()
+                RATE_LIMITER.log_stats()
+                CLIENT_FACTORY.log_pool_stats()
+        return plan
 
 
 if __name__ == "__main__":
@@ -0,0 +1,489 @@
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+from bot_engine.builder.bot_base import BotBase
+
+
+logger = logging.getLogger(__name__)
+
+from bot_engine.utils.yaml_loader import load_bot_config
+from bot_engine.utils.concurrency import ConcurrentTaskException, run_concurrently
+from bot_engine.utils.run_report import write_run_report
+from bot_engine.utils.slot_value_catalog import slot_type_values
+from bot_engine.builder.bot_inspector import BotInspector
+from bot_engine.builder.instance_builder import CreateBotInstance
+from bot_engine.builder.locale_builder import CreateBuildBotLocale
+from bot_engine.builder.intent_builder import CreateBotIntent
+from bot_engine.builder.slots_type_builder import CreateBotSlotsType
+from bot_engine.builder.bot_publisher import PublishBot
+from bot_engine.builder.polling_scheduler import POLLING_SCHEDULER
+from common.client_factory import CLIENT_FACTORY
+from common.rate_limiter import RATE_LIMITER
+from common.telemetry import TRACER
+
+
+class BotCreationException(Exception):
+    """Base exception for bot creation failures"""
+
+    pass
+
+
+class BotUpdateException(BotCreationException):
+    """Exception for incremental update failures"""
+
+    pass
+
+
+def _slot_type_signature(
+    description: Optional[str],
+    parent_slot_type_signature: Optional[str],
+    value_selection_setting: Dict,
+    slot_type_values: List[Dict],
+) -> Tuple:
+    """Comparable form of a slot type definition in API format"""
+    return (
+        description or "",
+        parent_slot_type_signature or None,
+        value_selection_setting.get("resolutionStrategy"),
+        value_selection_setting.get("regexFilter", {}).get("pattern"),
+        tuple(
+            (
+                value["sampleValue"]["value"],
+                tuple(synonym["value"] for synonym in value.get("synonyms") or []),
+            )
+            for value in slot_type_values
+        ),
+    )
+
+
+def _intent_signature(
+    description: Optional[str],
+    utterances: List[str],
+    intent_hooks: List[str],
+    slot_priorities: Dict[str, int],
+) -> Tuple:
+    """Comparable form of an intent definition"""
+    return (
+        description or "",
+        tuple(utterances),
+        frozenset(intent_hooks),
+        frozenset(slot_priorities.items()),
+    )
+
+
+class UpdateUniversalBot:
+    """Applies only the differences between the template and the live bot"""
+
+    MAX_LOCALE_WORKERS = 4
+
+    def __init__(self, report_path: Optional[Path] = None, bot_config=None):
+        self.bot_config = bot_config or load_bot_config()
+        self.bot_id: Optional[str] = None
+        self.bot_version: Optional[str] = None
+        self.report_path = report_path
+        self.changes: List[str] = []
+        self.changed_locales: Set[str] = set()
+        self._changes_lock = threading.Lock()
+        self.do_operation()
+
+    def __str__(self) -> str:
+        return (
+            f"Bot(id={self.bot_id}, version={self.bot_version}, "
+            f"changes={len(self.changes)})"
+        )
+
+    def _record(self, change: str, locale_id: Optional[str] = None) -> None:
+        """Record an applied change for the run summary"""
+        logger.info(f"Change: {change}")
+        with self._changes_lock:
+            self.changes.append(change)
+            if locale_id:
+                self.changed_locales.add(locale_id)
+
+    def _update_bot_settings(self) -> None:
+        """Update bot-level settings if they differ from the template"""
+        current_bot = BotInspector().LEX_CLIENT.describe_bot(botId=self.bot_id)
+        if (
+            current_bot.get("description") != self.bot_config.description
+            or current_bot.get("idleSessionTTLInSeconds")
+            != self.bot_config.idleSessionTTLInSeconds
+        ):
+            CreateBotInstance().update_bot_instance(
+                self.bot_id,
+                self.bot_config.idleSessionTTLInSeconds,
+                self.bot_config.description,
+            )
+            self._record("update bot settings")
+
+    def _sync_locale_settings(self, locale) -> None:
+        """Create the locale, or update its settings if they changed"""
+        locale_builder = CreateBuildBotLocale(self.bot_id, locale.localeId)
+        live_locale = BotInspector().describe_bot_locale(self.bot_id, locale.localeId)
+
+        if live_locale is None:
+            locale_builder.create_bot_locale(
+                locale.nluIntentConfidenceThreshold,
+                locale.voiceSettings.voiceId,
+                locale.voiceSettings.engine,
+            )
+            self._record(f"create locale {locale.localeId}", locale.localeId)
+            return
+
+        voice_settings = live_locale.get("voiceSettings", {})
+        if (
+            live_locale.get("nluIntentConfidenceThreshold")
+            != locale.nluIntentConfidenceThreshold
+            or voice_settings.get("voiceId") != locale.voiceSettings.voiceId
+            or voice_settings.get("engine") != locale.voiceSettings.engine
+        ):
+            locale_builder.update_bot_locale(
+                locale.nluIntentConfidenceThreshold,
+                locale.voiceSettings.voiceId,
+                locale.voiceSettings.engine,
+            )
+            self._record(f"update locale {locale.localeId}", locale.localeId)
+
+    def _sync_slot_types(
+        self,
+        locale_id: str,
+        slot_definitions: List,
+        live_slot_types: Dict[str, Dict],
+    ) -> Dict[str, str]:
+        """
+        Create new and update changed custom/extended slot types.
+
+        Returns:
+            Mapping of slot name to slot type ID
+        """
+        slots_type_obj = CreateBotSlotsType(self.bot_id, locale_id, "DRAFT")
+        slots_type_id_set = {}
+
+        for slot in slot_definitions:
+            if slot.type not in ("Custom", "Extended"):
+                continue
+
+            if slot.type == "Custom":
+                values = slot_type_values(slot.slotType, self.bot_config.template_dir)
+                parent_signature, regex_pattern = None, None
+            else:
+                values = []
+                parent_signature = slot.slotType.parentSlotTypeSignature
+                regex_pattern = slot.slotType.regexPattern
+
+            live = live_slot_types.get(slot.name)
+            if live is None:
+                if slot.type == "Custom":
+                    slot_type_id = slots_type_obj.create_bot_slot_type_custom(
+                        slot.name,
+                        slot.description,
+                        resolution_strategy=slot.slotType.resolutionStrategy,
+                        slot_type_values=values,
+                    )
+                else:
+                    slot_type_id = slots_type_obj.create_bot_slot_type_extended(
+                        slot.name,
+                        slot.description,
+                        parent_signature,
+                        regex_pattern,
+                        slot.slotType.resolutionStrategy,
+                    )
+                self._record(f"create slot type {locale_id}/{slot.name}", locale_id)
+                slots_type_id_set[slot.name] = slot_type_id
+                continue
+
+            slots_type_id_set[slot.name] = live["slotTypeId"]
+            desired = _slot_type_signature(
+                slot.description,
+                parent_signature,
+                CreateBotSlotsType._build_value_selection_setting(
+                    slot.slotType.resolutionStrategy, regex_pattern
+                ),
+                values,
+            )
+            current = _slot_type_signature(
+                live.get("description"),
+                live.get("parentSlotTypeSignature"),
+                live.get("valueSelectionSetting", {}),
+                live.get("slotTypeValues", []),
+            )
+            if desired != current:
+                slots_type_obj.update_bot_slot_type(
+                    live["slotTypeId"],
+                    slot.name,
+                    slot.description,
+                    slot.slotType.resolutionStrategy,
+                    parent_slot_type_signature=parent_signature,
+                    regex_pattern=regex_pattern,
+                    slot_type_values=values if slot.type == "Custom" else None,
+                )
+                self._record(f"update slot type {locale_id}/{slot.name}", locale_id)
+
+        return slots_type_id_set
+
+    def _sync_intent(
+        self,
+        locale_id: str,
+        intent,
+        slots: List,
+        live_intent: Optional[Dict],
+        slots_type_id_set: Dict[str, str],
+    ) -> None:
+        """Create or update an intent and its slots, then its definition"""
+        intent_obj = CreateBotIntent("DRAFT", locale_id, self.bot_id)
+        changed = False
+
+        if live_intent is None:
+            intent_id = intent_obj.create_bot_intent(
+                intent.name,
+                intent.description,
+                intent.sampleUtterances,
+                intent.codeHook,
+            )
+            self._record(f"create intent {locale_id}/{intent.name}", locale_id)
+            live_slots = {}
+            changed = True
+        else:
+            intent_id = live_intent["intentId"]
+            live_slots = live_intent.get("slots", {})
+
+        slot_ids = {}
+        for slot in slots:
+            if slot.type in ("Custom", "Extended"):
+                slot_type_id = slots_type_id_set[slot.name]
+            else:
+                slot_type_id = slot.slotTypeId
+            live_slot = live_slots.get(slot.slotPhraseName)
+
+            if live_slot is None:
+                slot_ids[slot.slotPhraseName] = intent_obj.create_slot_in_intent(
+                    slot.slotPhraseName, slot_type_id, intent_id, slot.slotConstraint
+                )
+                self._record(
+                    f"create slot {locale_id}/{intent.name}/{slot.name}",
+                    locale_id,
+                )
+                changed = True
+                continue
+
+            slot_ids[slot.slotPhraseName] = live_slot["slotId"]
+            live_constraint = live_slot.get("valueElicitationSetting", {}).get(
+                "slotConstraint"
+            )
+            if (
+                live_slot.get("slotTypeId") != slot_type_id
+                or live_constraint != slot.slotConstraint
+            ):
+                intent_obj.update_slot_in_intent(
+                    live_slot["slotId"],
+                    slot.slotPhraseName,
+                    slot_type_id,
+                    intent_id,
+                    slot.slotConstraint,
+                )
+                self._record(
+                    f"update slot {locale_id}/{intent.name}/{slot.name}",
+                    locale_id,
+                )
+                changed = True
+
+        for slot_name, live_slot in live_slots.items():
+            if slot_name not in slot_ids:
+                intent_obj.delete_slot_in_intent(live_slot["slotId"], intent_id)
+                self._record(
+                    f"delete slot {locale_id}/{intent.name}/{slot_name}",
+                    locale_id,
+                )
+                changed = True
+
+        desired_priorities = {slot.slotPhraseName: slot.priority for slot in slots}
+        if not changed:
+            live_slot_names = {
+                live_slot["slotId"]: name for name, live_slot in live_slots.items()
+            }
+            live_priorities = {
+                live_slot_names.get(entry["slotId"], entry["slotId"]): entry["priority"]
+                for entry in live_intent.get("slotPriorities", [])
+            }
+            live_hooks = []
+            if live_intent.get("fulfillmentCodeHook", {}).get("enabled"):
+                live_hooks.append("fulfillmentCodeHook")
+            if live_intent.get("intentConfirmationSetting", {}).get("active"):
+                live_hooks.append("intentConfirmationSetting")
+            changed = _intent_signature(
+                intent.description,
+                intent.sampleUtterances,
+                intent.codeHook or [],
+                desired_priorities,
+            ) != _intent_signature(
+                live_intent.get("description"),
+                [u["utterance"] for u in live_intent.get("sampleUtterances", [])],
+                live_hooks,
+                live_priorities,
+            )
+
+        if changed:
+            # UpdateIntent replaces the whole definition, so send all of it
+            intent_obj.update_intent(
+                intent_id,
+                intent.name,
+                intent.description,
+                intent.sampleUtterances,
+                intent.codeHook,
+                [
+                    {"slotId": slot_ids[name], "priority": priority}
+                    for name, priority in desired_priorities.items()
+                ],
+            )
+            self._record(f"update intent {locale_id}/{intent.name}", locale_id)
+
+    def _update_locale(self, locale) -> bool:
+        """
+        Bring one locale in line with the template.
+
+        Args:
+            locale: Locale configuration from config
+
+        Returns:
+            True if anything in the locale changed
+
+        Raises:
+            BotUpdateException: If any change fails
+        """
+        locale_id = locale.localeId
+        try:
+            self._sync_locale_settings(locale)
+            live = BotInspector().describe_locale_resources(self.bot_id, locale_id)
+
+            slots_type_id_set = self._sync_slot_types(
+                locale_id, locale.slotDefinitions, live["slotTypes"]
+            )
+
+            intent_names = {intent.name for intent in locale.intents}
+            intent_slots = {name: [] for name in intent_names}
+            for slot in locale.slotDefinitions:
+                if slot.intent not in intent_names:
+                    logger.warning(
+                        f"Slot '{slot.name}' references non-existent intent "
+                        f"'{slot.intent}'. Skipping."
+                    )
+                    continue
+                intent_slots[slot.intent].append(slot)
+
+            for intent in locale.intents:
+                self._sync_intent(
+                    locale_id,
+                    intent,
+                    intent_slots[intent.name],
+                    live["intents"].get(intent.name),
+                    slots_type_id_set,
+                )
+
+            intent_obj = CreateBotIntent("DRAFT", locale_id, self.bot_id)
+            for name, live_intent in live["intents"].items():
+                if name not in intent_names:
+                    intent_obj.delete_intent(live_intent["intentId"])
+                    self._record(f"delete intent {locale_id}/{name}", locale_id)
+
+            slots_type_obj = CreateBotSlotsType(self.bot_id, locale_id, "DRAFT")
+            for name, live_slot_type in live["slotTypes"].items():
+                if name not in slots_type_id_set:
+                    slots_type_obj.delete_bot_slot_type(live_slot_type["slotTypeId"])
+                    self._record(f"delete slot type {locale_id}/{name}", locale_id)
+
+        except Exception as e:
+            logger.error(f"Failed to update locale {locale_id}: {e}")
+            raise BotUpdateException(f"Locale {locale_id} update failed: {e}") from e
+        finally:
+            # Locales from include files are only held while they are synced
+            locale.release()
+
+        return locale_id in self.changed_locales
+
+    def do_operation(self) -> None:
+        """
+        Main orchestration method for an incremental redeploy.
+
+        Locales that exist on the bot but not in the template are left alone.
+
+        Raises:
+            BotCreationException: If the bot does not exist or any change fails
+        """
+        TRACER.reset()
+        try:
+            logger.info("=" * 60)
+            logger.info("Starting incremental bot update...")
+            logger.info("=" * 60)
+
+            BotBase.set_base(
+                self.bot_config.name,
+                self.bot_config.description,
+                self.bot_config.region,
+            )
+
+            self.bot_id = BotInspector().find_bot_id(self.bot_config.name)
+            if self.bot_id is None:
+                raise BotUpdateException(
+                    f"Bot {self.bot_config.name} not found; create it first"
+                )
+            logger.info(f"Updating existing bot: {self.bot_id}")
+
+            with TRACER.span("update_bot_settings"):
+                self._update_bot_settings()
+
+            try:
+                with TRACER.span("update_locales"):
+                    locale_changed = run_concurrently(
+                        {
+                            locale.localeId: (
+                                lambda locale=locale: self._update_locale(locale)
+                            )
+                            for locale in self.bot_config.locale
+                        },
+                        self.MAX_LOCALE_WORKERS,
+                    )
+            except ConcurrentTaskException as e:
+                raise BotUpdateException(str(e)) from e
+
+            changed_locales = [
+                locale_id for locale_id, changed in locale_changed.items() if changed
+            ]
+            if not changed_locales:
+                logger.info("Bot is up to date, nothing to deploy")
+                return
+
+            publisher = PublishBot(self.bot_id)
+            with TRACER.span("build_locales", locales=len(changed_locales)):
+                publisher.build_locales(changed_locales)
+            with TRACER.span("publish"):
+                self.bot_version = publisher.publish(
+                    "Incremental update based on DRAFT",
+                    self.bot_config.alias.name,
+                    self.bot_config.alias.description,
+                    [
+                        {
+                            "Locale": locale.localeId,
+                            "Lambda_arn": locale.lambdaHooks.arn,
+                            "codeHookInterfaceVersion": locale.lambdaHooks.codeHookInterfaceVersion,
+                        }
+                        for locale in self.bot_config.locale
+                    ],
+                )
+
+            logger.info("=" * 60)
+            logger.info(f"Bot update completed with {len(self.changes)} changes")
+            logger.info(f"Bot ID: {self.bot_id}")
+            logger.info(f"Bot Version: {self.bot_version}")
+            logger.info("=" * 60)
+
+        except Exception as e:
+            logger.error("=" * 60)
+            logger.error(f"Bot update process failed: {e}")
+            logger.error("=" * 60)
+            raise
+        finally:
+            POLLING_SCHEDULER.log_readiness()
+            RATE_LIMITER.log_stats()
+            CLIENT_FACTORY.log_pool_stats()
+            if self.report_path:
+                write_run_report(self.report_path, group=BotBase.current_context())
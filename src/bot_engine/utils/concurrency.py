@@ -0,0 +1,100 @@
+import contextvars
+import logging
+import threading
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Optional
+
+from common.telemetry import TRACER
+
+
+logger = logging.getLogger(__name__)
+
+
+class TaskCancelledException(Exception):
+    """Exception for tasks skipped because their group was cancelled"""
+
+    pass
+
+
+class ConcurrentTaskException(Exception):
+    """Exception for failures in a group of concurrent tasks"""
+
+    def __init__(self, message: str, errors: Dict[str, Exception]):
+        super().__init__(message)
+        self.errors = errors
+
+
+def run_concurrently(
+    tasks: Dict[str, Callable[[], Any]],
+    max_workers: int,
+    cancel_event: Optional[threading.Event] = None,
+) -> Dict[str, Any]:
+    """
+    Run independent tasks on a bounded worker pool, failing fast.
+
+    On the first failure, tasks that have not started are cancelled and
+    cancel_event is set so running tasks can stop at their next checkpoint.
+    Sharing one cancel_event between nested groups cancels all of them.
+
+    Args:
+        tasks: Mapping of task key to zero-argument callable
+        max_workers: Maximum number of tasks running at once
+        cancel_event: Optional event set when the group is cancelled
+
+    Returns:
+        Mapping of task key to result, in the order tasks were given
+
+    Raises:
+        ConcurrentTaskException: If any task fails, with every collected error
+        TaskCancelledException: If every task was cancelled from outside
+    """
+    if not tasks:
+        return {}
+
+    cancel_event = cancel_event or threading.Event()
+    errors: Dict[str, Exception] = {}
+    # Calls made by the workers count towards the caller's step
+    step = TRACER.current_step()
+
+    def guarded(key: str, func: Callable[[], Any]) -> Any:
+        if cancel_event.is_set():
+            raise TaskCancelledException(f"Task {key} cancelled")
+        with TRACER.in_step(step):
+            return func()
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(tasks)))) as pool:
+        # Each task runs in a copy of the caller's context (e.g. its bot context)
+        futures = {
+            pool.submit(contextvars.copy_context().run, guarded, key, func): key
+            for key, func in tasks.items()
+        }
+        done, pending = wait(futures, return_when=FIRST_EXCEPTION)
+
+        if any(future.exception() for future in done):
+            cancel_event.set()
+            for future in pending:
+                future.cancel()
+            # Let already running tasks finish before collecting their outcome
+            wait(pending)
+
+        for future, key in futures.items():
+            if future.cancelled():
+                errors[key] = TaskCancelledException(f"Task {key} cancelled")
+            elif future.exception() is not None:
+                errors[key] = future.exception()
+
+    if errors:
+        failed = [
+            key
+            for key, error in errors.items()
+            if not isinstance(error, TaskCancelledException)
+        ]
+        if not failed:
+            # The whole group was cancelled from outside, not failed itself
+            raise TaskCancelledException(f"{len(errors)} tasks cancelled")
+        logger.error(f"{len(failed)} of {len(tasks)} tasks failed")
+        raise ConcurrentTaskException(
+            f"Task {failed[0]} failed: {errors[failed[0]]}", errors
+        )
+
+    return {key: future.result() for future, key in futures.items()}
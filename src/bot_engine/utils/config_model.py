@@ -0,0 +1,455 @@
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+
+class ConfigModelException(Exception):
+    """Exception for templates that do not fit the config model"""
+
+    pass
+
+
+class ConfigNode:
+    """
+    Base of the typed bot config model.
+
+    Each subclass declares its fields in __slots__, so nodes carry no
+    per-instance __dict__. A node is built in a single pass over its YAML
+    mapping: nested mappings become nodes, lists of mappings become tuples
+    of nodes and STRING_LISTS fields become tuples of strings, sharing the
+    parsed strings rather than copying them. Missing required fields and
+    unknown keys are reported when the template is loaded, with their
+    path. Optional fields that the template leaves out read as their
+    DEFAULTS value but are not set, so to_dict() returns exactly the
+    mapping the node was built from and content hashes do not change.
+    Slots with a leading underscore hold bookkeeping, not fields.
+    """
+
+    __slots__ = ()
+
+    REQUIRED: Tuple[str, ...] = ()
+    DEFAULTS: Dict[str, Any] = {}
+    # Field -> node class, for nested mappings
+    NODES: Dict[str, type] = {}
+    # Field -> node class, for lists of mappings
+    NODE_LISTS: Dict[str, type] = {}
+    STRING_LISTS: Tuple[str, ...] = ()
+
+    def __init__(self, data: Dict[str, Any], path: str):
+        """
+        Args:
+            data: Parsed YAML mapping
+            path: Location of the mapping in the template, for error messages
+
+        Raises:
+            ConfigModelException: If data is not a mapping, misses a required
+                field or has a key that is not a field of the node
+        """
+        if not isinstance(data, dict):
+            raise ConfigModelException(
+                f"{path}: expected a mapping, got {type(data).__name__}"
+            )
+        fields = self.__slots__
+        for key, value in data.items():
+            if key not in fields or key.startswith("_"):
+                raise ConfigModelException(
+                    f"{path}: unknown field '{key}' (expected one of "
+                    f"{', '.join(f for f in fields if not f.startswith('_'))})"
+                )
+            if value is None:
+                pass
+            elif key in self.NODES:
+                value = self.NODES[key](value, f"{path}.{key}")
+            elif key in self.NODE_LISTS:
+                node_class = self.NODE_LISTS[key]
+                value = tuple(
+                    node_class(item, f"{path}.{key}[{index}]")
+                    for index, item in enumerate(_as_list(value, path, key))
+                )
+            elif key in self.STRING_LISTS and isinstance(value, list):
+                value = tuple(value)
+            setattr(self, key, value)
+
+        missing = [field for field in self.REQUIRED if field not in data]
+        if missing:
+            raise ConfigModelException(
+                f"{path}: missing required field(s) {', '.join(missing)}"
+            )
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for unset slots and unknown names
+        defaults = type(self).DEFAULTS
+        if name in defaults:
+            return defaults[name]
+        raise AttributeError(f"{type(self).__name__} has no field '{name}'")
+
+    def _get_private(self, name: str) -> Any:
+        try:
+            return object.__getattribute__(self, name)
+        except AttributeError:
+            return None
+
+    def _set_fields(self) -> Iterator[Tuple[str, Any]]:
+        for name in self.__slots__:
+            if name.startswith("_"):
+                continue
+            try:
+                yield name, object.__getattribute__(self, name)
+            except AttributeError:
+                continue
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The mapping the node was built from, as plain dicts and lists"""
+        return {name: _plain(value) for name, value in self._set_fields()}
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return dict(self._set_fields()) == dict(other._set_fields())
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={value!r}" for name, value in self._set_fields())
+        return f"{type(self).__name__}({fields})"
+
+
+# Serialises loading of included locale files across plan worker threads
+_LOAD_LOCK = threading.RLock()
+
+
+def _as_list(value: Any, path: str, key: str) -> list:
+    if not isinstance(value, list):
+        raise ConfigModelException(
+            f"{path}.{key}: expected a list, got {type(value).__name__}"
+        )
+    return value
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, ConfigNode):
+        return value.to_dict()
+    if isinstance(value, tuple):
+        return [_plain(item) for item in value]
+    return value
+
+
+class DataPrivacyConfig(ConfigNode):
+    __slots__ = ("childDirected",)
+    REQUIRED = ("childDirected",)
+
+    childDirected: bool
+
+
+class AliasConfig(ConfigNode):
+    __slots__ = ("name", "description")
+    REQUIRED = ("name",)
+    DEFAULTS = {"description": None}
+
+    name: str
+    description: Optional[str]
+
+
+class LambdaHooksConfig(ConfigNode):
+    __slots__ = ("arn", "codeHookInterfaceVersion")
+    REQUIRED = ("arn",)
+    DEFAULTS = {"codeHookInterfaceVersion": "1.0"}
+
+    arn: str
+    codeHookInterfaceVersion: str
+
+
+class VoiceSettingsConfig(ConfigNode):
+    __slots__ = ("voiceId", "engine")
+    REQUIRED = ("voiceId",)
+    DEFAULTS = {"engine": None}
+
+    voiceId: str
+    engine: Optional[str]
+
+
+class SlotTypeValueConfig(ConfigNode):
+    __slots__ = ("sampleValue", "synonyms")
+    REQUIRED = ("sampleValue",)
+    DEFAULTS = {"synonyms": ()}
+    STRING_LISTS = ("synonyms",)
+
+    sampleValue: str
+    synonyms: Tuple[str, ...]
+
+
+class SlotTypeConfig(ConfigNode):
+    """
+    Typed model of a custom or extended slot type.
+
+    Custom slot types may read further values from a CSV or JSONL catalog
+    named by valuesFile, relative to the template (see slot_value_catalog).
+    The catalog is read when the slot type is deployed, not held here.
+    """
+
+    __slots__ = (
+        "resolutionStrategy",
+        "slotTypeValues",
+        "valuesFile",
+        "parentSlotTypeSignature",
+        "regexPattern",
+    )
+    DEFAULTS = {
+        "resolutionStrategy": "OriginalValue",
+        "slotTypeValues": (),
+        "valuesFile": None,
+        "parentSlotTypeSignature": None,
+        "regexPattern": None,
+    }
+    NODE_LISTS = {"slotTypeValues": SlotTypeValueConfig}
+
+    resolutionStrategy: str
+    slotTypeValues: Tuple[SlotTypeValueConfig, ...]
+    valuesFile: Optional[str]
+    parentSlotTypeSignature: Optional[str]
+    regexPattern: Optional[str]
+
+
+class SlotDefinitionConfig(ConfigNode):
+    __slots__ = (
+        "name",
+        "intent",
+        "slotPhraseName",
+        "type",
+        "description",
+        "slotConstraint",
+        "priority",
+        "slotTypeId",
+        "slotType",
+    )
+    REQUIRED = ("name", "intent", "slotPhraseName", "type")
+    DEFAULTS = {
+        "description": None,
+        "slotConstraint": "Optional",
+        "priority": None,
+        "slotTypeId": None,
+        "slotType": None,
+    }
+    NODES = {"slotType": SlotTypeConfig}
+
+    name: str
+    intent: str
+    slotPhraseName: str
+    type: str
+    description: Optional[str]
+    slotConstraint: str
+    priority: Optional[int]
+    slotTypeId: Optional[str]
+    slotType: Optional[SlotTypeConfig]
+
+
+class IntentConfig(ConfigNode):
+    __slots__ = ("name", "description", "codeHook", "sampleUtterances")
+    REQUIRED = ("name",)
+    DEFAULTS = {"description": None, "codeHook": (), "sampleUtterances": ()}
+    STRING_LISTS = ("codeHook", "sampleUtterances")
+
+    name: str
+    description: Optional[str]
+    codeHook: Tuple[str, ...]
+    sampleUtterances: Tuple[str, ...]
+
+
+class LocaleConfig(ConfigNode):
+    """
+    Typed model of one bot locale.
+
+    A locale may keep its intents and slot definitions in a separate file
+    named by its include field. Those fields are then loaded from the file
+    on first access and dropped again by release(), so a large bot is held
+    in memory one locale at a time. The file is read through a loader set
+    with set_source() when the template is loaded.
+    """
+
+    __slots__ = (
+        "localeId",
+        "nluIntentConfidenceThreshold",
+        "lambdaHooks",
+        "voiceSettings",
+        "include",
+        "intents",
+        "slotDefinitions",
+        "_source",
+        "_index",
+    )
+    REQUIRED = (
+        "localeId",
+        "nluIntentConfidenceThreshold",
+        "lambdaHooks",
+        "voiceSettings",
+    )
+    DEFAULTS = {"include": None, "intents": (), "slotDefinitions": ()}
+    NODES = {"lambdaHooks": LambdaHooksConfig, "voiceSettings": VoiceSettingsConfig}
+    NODE_LISTS = {"intents": IntentConfig, "slotDefinitions": SlotDefinitionConfig}
+    # Fields an included file provides
+    INCLUDED_FIELDS = ("intents", "slotDefinitions")
+
+    localeId: str
+    nluIntentConfidenceThreshold: float
+    lambdaHooks: LambdaHooksConfig
+    voiceSettings: VoiceSettingsConfig
+    include: Optional[str]
+    intents: Tuple[IntentConfig, ...]
+    slotDefinitions: Tuple[SlotDefinitionConfig, ...]
+
+    def __getattr__(self, name: str) -> Any:
+        if name in self.INCLUDED_FIELDS and self._get_private("_source"):
+            self.load()
+            return object.__getattribute__(self, name)
+        return super().__getattr__(name)
+
+    def _set_fields(self) -> Iterator[Tuple[str, Any]]:
+        # Included fields are not part of the mapping the locale came from
+        for name, value in super()._set_fields():
+            if not (self.include and name in self.INCLUDED_FIELDS):
+                yield name, value
+
+    def set_source(self, loader: Callable[[], Dict[str, Any]]) -> None:
+        """
+        Args:
+            loader: Returns the parsed mapping of the include file
+        """
+        self._source = loader
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the included fields are in memory (always for inline locales)"""
+        if not self._get_private("_source"):
+            return True
+        return all(
+            self._get_private(name) is not None for name in self.INCLUDED_FIELDS
+        )
+
+    def load(self) -> None:
+        """
+        Load the included fields, if they are not loaded yet.
+
+        Raises:
+            ConfigModelException: If the include file does not fit the model;
+                errors reading the file propagate from the loader
+        """
+        with _LOAD_LOCK:
+            if self.loaded:
+                return
+            path = self.include
+            data = self._source()
+            if not isinstance(data, dict):
+                raise ConfigModelException(
+                    f"{path}: expected a mapping, got {type(data).__name__}"
+                )
+            unknown = [key for key in data if key not in self.INCLUDED_FIELDS]
+            if unknown:
+                raise ConfigModelException(
+                    f"{path}: unknown field(s) {', '.join(map(str, unknown))} "
+                    f"(expected {' or '.join(self.INCLUDED_FIELDS)})"
+                )
+            for name in self.INCLUDED_FIELDS:
+                node_class = self.NODE_LISTS[name]
+                items = data.get(name) or []
+                setattr(
+                    self,
+                    name,
+                    tuple(
+                        node_class(item, f"{path}.{name}[{index}]")
+                        for index, item in enumerate(_as_list(items, path, name))
+                    ),
+                )
+
+    def release(self) -> None:
+        """Drop the included fields from memory; the next access reloads them"""
+        with _LOAD_LOCK:
+            if not self._get_private("_source"):
+                return
+            self._index = None
+            for name in self.INCLUDED_FIELDS:
+                try:
+                    delattr(self, name)
+                except AttributeError:
+                    pass
+
+    def _lookup(self) -> Dict[Tuple[str, str], Any]:
+        """Intents and slot definitions by kind and name"""
+        intents, slots = self.intents, self.slotDefinitions
+        index = self._get_private("_index")
+        # Rebuilt whenever either tuple is replaced
+        if index is None or index[0] is not intents or index[1] is not slots:
+            lookup = {("intent", intent.name): intent for intent in intents}
+            lookup.update((("slot", slot.name), slot) for slot in slots)
+            index = self._index = (intents, slots, lookup)
+        return index[2]
+
+    def get_intent(self, name: str) -> Optional[IntentConfig]:
+        """The intent with the given name, if the locale defines it"""
+        return self._lookup().get(("intent", name))
+
+    def get_slot(self, name: str) -> Optional[SlotDefinitionConfig]:
+        """The slot definition with the given name, if the locale defines it"""
+        return self._lookup().get(("slot", name))
+
+    def slots_for_intent(self, name: str) -> Tuple[SlotDefinitionConfig, ...]:
+        """Slot definitions that belong to an intent, in template order"""
+        return tuple(slot for slot in self.slotDefinitions if slot.intent == name)
+
+
+class BotConfig(ConfigNode):
+    """Typed model of the bot section of a bot template"""
+
+    __slots__ = (
+        "name",
+        "description",
+        "region",
+        "roleArn",
+        "dataPrivacy",
+        "idleSessionTTLInSeconds",
+        "alias",
+        "locale",
+        "_template_dir",
+    )
+    REQUIRED = ("name", "region", "dataPrivacy", "alias", "locale")
+    DEFAULTS = {
+        "description": None,
+        "roleArn": None,
+        "idleSessionTTLInSeconds": 300,
+    }
+    NODES = {"dataPrivacy": DataPrivacyConfig, "alias": AliasConfig}
+    NODE_LISTS = {"locale": LocaleConfig}
+
+    name: str
+    description: Optional[str]
+    region: str
+    roleArn: Optional[str]
+    dataPrivacy: DataPrivacyConfig
+    idleSessionTTLInSeconds: int
+    alias: AliasConfig
+    locale: Tuple[LocaleConfig, ...]
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BotConfig":
+        """
+        Build the model from the parsed bot section of a template.
+
+        Raises:
+            ConfigModelException: If the section does not fit the model
+        """
+        return cls(data, "bot")
+
+    @property
+    def template_dir(self) -> Path:
+        """Directory that paths in the template are relative to"""
+        return self._get_private("_template_dir") or Path(".")
+
+    def set_template_dir(self, template_dir: Path) -> None:
+        """
+        Args:
+            template_dir: Directory of the template file the bot came from
+        """
+        self._template_dir = Path(template_dir)
+
+    def get_locale(self, locale_id: str) -> Optional[LocaleConfig]:
+        """The locale with the given ID, if the bot defines it"""
+        return next(
+            (locale for locale in self.locale if locale.localeId == locale_id), None
+        )
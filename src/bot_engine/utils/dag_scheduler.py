@@ -0,0 +1,294 @@
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from common.rate_limiter import is_transient_error
+from common.telemetry import TRACER
+
+
+logger = logging.getLogger(__name__)
+
+
+class DagException(Exception):
+    """Base exception for DAG planning and execution failures"""
+
+    pass
+
+
+class DagCycleException(DagException):
+    """Exception for plans with missing or circular dependencies"""
+
+    pass
+
+
+class DagExecutionException(DagException):
+    """Exception for nodes that failed during execution"""
+
+    def __init__(self, message: str, errors: Dict[str, Exception], skipped: List[str]):
+        super().__init__(message)
+        self.errors = errors
+        self.skipped = skipped
+
+
+class DagNode:
+    """A unit of work with explicit dependencies on other nodes"""
+
+    def __init__(
+        self,
+        node_id: str,
+        func: Callable[[Dict[str, Any]], Any],
+        dependencies: Iterable[str] = (),
+        retries: int = 0,
+    ):
+        """
+        Args:
+            node_id: Unique node ID
+            func: Callable receiving a mapping of dependency ID to result
+            dependencies: IDs of nodes that must complete first
+            retries: Number of extra attempts after a transient failure
+        """
+        self.node_id = node_id
+        self.func = func
+        self.dependencies = tuple(dependencies)
+        self.retries = retries
+
+
+class DagScheduler:
+    """Runs DAG nodes as soon as their dependencies complete"""
+
+    RETRY_DELAY = 1.0
+    RETRY_BACKOFF = 2.0
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        cancel_event: Optional[threading.Event] = None,
+        on_node_complete: Optional[Callable[[str, Any], None]] = None,
+        is_retryable: Callable[[Exception], bool] = is_transient_error,
+    ):
+        """
+        Args:
+            max_workers: Maximum number of nodes running at once
+            cancel_event: Optional event shared with other cancellable work
+            on_node_complete: Optional callback receiving (node ID, result)
+                for each node that succeeds, called from the scheduling thread
+            is_retryable: Whether a node failure may be retried; by default
+                only transient API errors are, since nodes that create
+                resources are not idempotent
+        """
+        self.max_workers = max_workers
+        self.cancel_event = cancel_event or threading.Event()
+        self.on_node_complete = on_node_complete
+        self.is_retryable = is_retryable
+        self.nodes: Dict[str, DagNode] = {}
+        self.timings: Dict[str, Tuple[float, float]] = {}
+
+    def add_node(
+        self,
+        node_id: str,
+        func: Callable[[Dict[str, Any]], Any],
+        dependencies: Iterable[str] = (),
+        retries: int = 0,
+    ) -> str:
+        """Add a node to the plan and return its ID"""
+        if node_id in self.nodes:
+            raise DagException(f"Duplicate node: {node_id}")
+        self.nodes[node_id] = DagNode(node_id, func, dependencies, retries)
+        return node_id
+
+    def topological_order(self) -> List[str]:
+        """
+        Return node IDs in a valid execution order.
+
+        Raises:
+            DagCycleException: If a dependency is missing or circular
+        """
+        remaining = {}
+        dependents: Dict[str, List[str]] = {node_id: [] for node_id in self.nodes}
+        for node in self.nodes.values():
+            for dependency in node.dependencies:
+                if dependency not in self.nodes:
+                    raise DagCycleException(
+                        f"Node {node.node_id} depends on unknown node {dependency}"
+                    )
+                dependents[dependency].append(node.node_id)
+            remaining[node.node_id] = len(node.dependencies)
+
+        order = [node_id for node_id, count in remaining.items() if count == 0]
+        for node_id in order:
+            for dependent in dependents[node_id]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    order.append(dependent)
+
+        if len(order) != len(self.nodes):
+            cyclic = sorted(set(self.nodes) - set(order))
+            raise DagCycleException(f"Circular dependencies between nodes: {cyclic}")
+        return order
+
+    def _run_node(self, node: DagNode, inputs: Dict[str, Any]) -> Any:
+        """
+        Run a node, retrying transient failures with backoff until it
+        succeeds, runs out of retries or is cancelled.
+        """
+        delay = self.RETRY_DELAY
+        for attempt in range(node.retries + 1):
+            if self.cancel_event.is_set():
+                raise DagException(f"Node {node.node_id} cancelled")
+            try:
+                return node.func(inputs)
+            except Exception as e:
+                if attempt == node.retries or not self.is_retryable(e):
+                    raise
+                logger.warning(
+                    f"Node {node.node_id} attempt {attempt + 1} failed, retrying: {e}"
+                )
+                with TRACER.span(f"{node.node_id} retry backoff", "sleep"):
+                    if self.cancel_event.wait(delay):
+                        raise
+                delay *= self.RETRY_BACKOFF
+
+    def _timed_run(self, node: DagNode, inputs: Dict[str, Any]) -> Any:
+        start = time.monotonic()
+        with TRACER.in_step(node.node_id) as step:
+            try:
+                return self._run_node(node, inputs)
+            finally:
+                end = time.monotonic()
+                self.timings[node.node_id] = (start, end)
+                TRACER.record(node.node_id, "step", start, end, step=None, id=step[1])
+
+    def run(self, completed: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Execute the plan with at most max_workers nodes running at once.
+
+        On the first node failure the plan is cancelled: no new nodes start,
+        running nodes are allowed to finish, and the rest are reported skipped.
+
+        Args:
+            completed: Results of nodes that already ran, e.g. in an earlier
+                attempt; these nodes are not run again
+
+        Returns:
+            Mapping of node ID to result
+
+        Raises:
+            DagCycleException: If the plan is not a DAG
+            DagExecutionException: If any node fails
+        """
+        self.topological_order()
+
+        results: Dict[str, Any] = {
+            node_id: result
+            for node_id, result in (completed or {}).items()
+            if node_id in self.nodes
+        }
+        errors: Dict[str, Exception] = {}
+
+        dependents: Dict[str, List[str]] = {node_id: [] for node_id in self.nodes}
+        waiting = {}
+        for node in self.nodes.values():
+            if node.node_id in results:
+                continue
+            waiting[node.node_id] = sum(
+                1 for dependency in node.dependencies if dependency not in results
+            )
+            for dependency in node.dependencies:
+                dependents[dependency].append(node.node_id)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            running = {}
+
+            def submit(node_id: str) -> None:
+                node = self.nodes[node_id]
+                inputs = {dep: results[dep] for dep in node.dependencies}
+                # Nodes run in a copy of the caller's context (e.g. its bot context)
+                context = contextvars.copy_context()
+                running[pool.submit(context.run, self._timed_run, node, inputs)] = (
+                    node_id
+                )
+
+            for node_id, count in waiting.items():
+                if count == 0:
+                    submit(node_id)
+
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    node_id = running.pop(future)
+                    error = future.exception()
+                    if error is not None:
+                        logger.error(f"Node {node_id} failed: {error}")
+                        errors[node_id] = error
+                        self.cancel_event.set()
+                        continue
+
+                    results[node_id] = future.result()
+                    if self.on_node_complete:
+                        self.on_node_complete(node_id, results[node_id])
+                    if self.cancel_event.is_set():
+                        continue
+                    for dependent in dependents[node_id]:
+                        waiting[dependent] -= 1
+                        if waiting[dependent] == 0:
+                            submit(dependent)
+
+        if errors or len(results) != len(self.nodes):
+            skipped = [
+                node_id
+                for node_id in self.nodes
+                if node_id not in results and node_id not in errors
+            ]
+            if not errors:
+                raise DagException(f"Plan cancelled, {len(skipped)} nodes skipped")
+            first_failed = next(iter(errors))
+            raise DagExecutionException(
+                f"Node {first_failed} failed: {errors[first_failed]} "
+                f"({len(skipped)} nodes skipped)",
+                errors,
+                skipped,
+            )
+
+        return results
+
+    def critical_path(self) -> Tuple[List[str], float]:
+        """
+        Compute the chain of nodes that determined the total wall time.
+
+        Walks back from the last node to finish, following at each step the
+        dependency that finished last.
+
+        Returns:
+            Tuple of (node IDs from first to last, wall time in seconds)
+        """
+        if not self.timings:
+            return [], 0.0
+
+        node_id = max(self.timings, key=lambda n: self.timings[n][1])
+        end = self.timings[node_id][1]
+        path = [node_id]
+        while True:
+            dependencies = [
+                dep for dep in self.nodes[node_id].dependencies if dep in self.timings
+            ]
+            if not dependencies:
+                break
+            node_id = max(dependencies, key=lambda n: self.timings[n][1])
+            path.append(node_id)
+
+        path.reverse()
+        return path, end - self.timings[path[0]][0]
+
+    def log_critical_path(self) -> None:
+        """Log the critical path with per-node durations"""
+        path, total = self.critical_path()
+        if not path:
+            return
+        steps = " -> ".join(
+            f"{node_id} ({self.timings[node_id][1] - self.timings[node_id][0]:.1f}s)"
+            for node_id in path
+        )
+        logger.info(f"Critical path ({total:.1f}s): {steps}")
@@ -0,0 +1,271 @@
+import heapq
+import json
+import logging
+import re
+import tempfile
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from bot_engine.universal_bot_orchestrator import CreateUniversalBot
+from bot_engine.utils.dag_scheduler import DagScheduler
+from common.client_factory import CLIENT_FACTORY
+from common.fake_lex_client import FakeLexModelsClient, install_fake_clients
+from common.rate_limiter import RATE_LIMITER, api_family
+from common.telemetry import TRACER
+
+
+logger = logging.getLogger(__name__)
+
+
+# Waiter resource names (see ResourceWaiter and BuildMonitor) by resource type
+RESOURCE_TYPE_PATTERNS: List[Tuple[str, str]] = [
+    (r"^Locale \S+ build$", "bot_locale_build"),
+    (r"^Locale ", "bot_locale"),
+    (r"^Bot version ", "bot_version"),
+    (r"^Bot alias ", "bot_alias"),
+    (r"^Bot ", "bot"),
+    (r"^Intent ", "intent"),
+    (r"^Slot type ", "slot_type"),
+    (r"^Slot ", "slot"),
+    (r"^Import ", "import"),
+]
+
+
+def resource_type(resource_name: str) -> Optional[str]:
+    """Map a waiter resource name such as "Locale en_US build" to its type"""
+    for pattern, name in RESOURCE_TYPE_PATTERNS:
+        if re.match(pattern, resource_name):
+            return name
+    return None
+
+
+class LatencyModel:
+    """
+    Expected API latency and resource readiness times for a deployment.
+
+    The defaults are rough figures for Lex V2; from_reports() replaces them
+    with the medians observed in earlier --report runs.
+    """
+
+    DEFAULT_API_SECONDS = 0.15
+    DEFAULT_READY_SECONDS: Dict[str, float] = {
+        "bot": 5.0,
+        "bot_locale": 10.0,
+        "bot_locale_build": 90.0,
+        "bot_version": 20.0,
+        "bot_alias": 2.0,
+        "intent": 1.0,
+        "slot": 1.0,
+        "slot_type": 1.0,
+        "import": 60.0,
+    }
+
+    def __init__(
+        self,
+        api_seconds: Optional[Dict[str, float]] = None,
+        ready_seconds: Optional[Dict[str, float]] = None,
+    ):
+        """
+        Args:
+            api_seconds: Latency per API operation, e.g. {"create_slot": 0.2}
+            ready_seconds: Time for a resource type to become ready after
+                its create or update call
+        """
+        self.api_seconds = api_seconds or {}
+        self.ready_seconds = {
+            **self.DEFAULT_READY_SECONDS,
+            **(ready_seconds or {}),
+        }
+
+    @classmethod
+    def from_reports(cls, report_paths: Iterable[Path]) -> "LatencyModel":
+        """
+        Calibrate the model from JSON reports written by run_bot.py --report.
+
+        API latency is the call-weighted mean of each operation's p50, and
+        readiness is the mean time per resource type.
+        """
+        latency_sums: Counter = Counter()
+        latency_calls: Counter = Counter()
+        ready_sums: Counter = Counter()
+        ready_counts: Counter = Counter()
+
+        for report_path in report_paths:
+            report = json.loads(Path(report_path).read_text())
+            for operation, stats in report.get("api_calls", {}).items():
+                latency_sums[operation] += stats["p50"] * stats["calls"]
+                latency_calls[operation] += stats["calls"]
+            polling = report.get("status_polling", {})
+            for name, seconds in polling.get("ready_after_seconds", {}).items():
+                kind = resource_type(name)
+                if kind:
+                    ready_sums[kind] += seconds
+                    ready_counts[kind] += 1
+
+        return cls(
+            {op: latency_sums[op] / latency_calls[op] for op in latency_calls},
+            {kind: ready_sums[kind] / ready_counts[kind] for kind in ready_counts},
+        )
+
+    def api(self, operation_name: str) -> float:
+        return self.api_seconds.get(operation_name, self.DEFAULT_API_SECONDS)
+
+    def ready(self, kind: Optional[str]) -> float:
+        return self.ready_seconds.get(kind, 0.0)
+
+
+class DeploymentPlanner:
+    """
+    Dry run of CreateUniversalBot that lists its API calls and estimates time.
+
+    The real orchestrator is run against an in-process fake Lex client with
+    no delays and no client-side rate limits, so the recorded calls are
+    exactly the ones a fresh deployment of the current template makes,
+    attributed to the plan node that made them. Wall time is then estimated
+    by replaying the plan's DAG with durations from a LatencyModel.
+    """
+
+    # Effectively unlimited client-side rates for the dry run
+    DRY_RUN_LIMITS = {
+        family: (1e6, 1e6, 1e6, 1e6) for family in RATE_LIMITER.DEFAULT_LIMITS
+    }
+
+    def __init__(self, latency_model: Optional[LatencyModel] = None):
+        self.latency_model = latency_model or LatencyModel()
+        self.plan: Optional[DagScheduler] = None
+        # (step, operation) in call order
+        self.calls: List[Tuple[str, str]] = []
+        # step -> waits, each a list of resource names polled together
+        self.waits: Dict[str, List[List[str]]] = {}
+
+    def dry_run(self) -> None:
+        """Run the orchestrator against the fake client and record its calls"""
+        previous_limits = RATE_LIMITER.limits
+        RATE_LIMITER.reset(self.DRY_RUN_LIMITS)
+        # The orchestrator's progress log would read like a real deployment
+        logging.disable(logging.INFO)
+        install_fake_clients(
+            FakeLexModelsClient(build_seconds=0.0, version_seconds=0.0)
+        )
+        try:
+            with tempfile.TemporaryDirectory() as work_dir:
+                bot = CreateUniversalBot(Path(work_dir) / "state.json")
+        finally:
+            logging.disable(logging.NOTSET)
+            CLIENT_FACTORY.override("lexv2-models", None)
+            CLIENT_FACTORY.override("iam", None)
+            RATE_LIMITER.reset(previous_limits)
+
+        self.plan = bot.plan
+        logger.info(f"Dry run recorded {len(TRACER.spans('api'))} API calls")
+        self.calls = [
+            (span.attributes.get("step") or "setup", span.name)
+            for span in sorted(TRACER.spans("api"), key=lambda span: span.start)
+        ]
+        self.waits = {}
+        for span in TRACER.spans("wait"):
+            step = span.attributes.get("step") or "setup"
+            self.waits.setdefault(step, []).append(span.attributes["resources"])
+
+    def step_seconds(self, step: str) -> float:
+        """Estimated duration of one plan node or step outside the plan"""
+        model = self.latency_model
+        seconds = sum(
+            model.api(operation) for node, operation in self.calls if node == step
+        )
+        for resources in self.waits.get(step, []):
+            seconds += max(model.ready(resource_type(name)) for name in resources)
+        return seconds
+
+    def estimate(
+        self, max_workers: int = CreateUniversalBot.MAX_WORKERS
+    ) -> Dict[str, float]:
+        """
+        Estimate wall time by list-scheduling the DAG on max_workers workers.
+
+        Returns:
+            Dict with the estimate for max_workers, for unlimited workers
+            and for running every node one after the other, plus the
+            lower bound set by the client-side rate limits
+        """
+        # Steps outside the plan (load_state and the like) run before it
+        outside_plan = {step for step, _ in self.calls} | set(self.waits)
+        setup = sum(
+            self.step_seconds(step) for step in outside_plan - set(self.plan.nodes)
+        )
+        durations = {
+            node_id: self.step_seconds(node_id) for node_id in self.plan.nodes
+        }
+
+        family_calls = Counter(api_family(operation) for _, operation in self.calls)
+        rate_floor = max(
+            (
+                calls / RATE_LIMITER.limits[family][0]
+                for family, calls in family_calls.items()
+            ),
+            default=0.0,
+        )
+        return {
+            "workers": max_workers,
+            "estimated_seconds": round(
+                setup + self._simulate(durations, max_workers), 1
+            ),
+            "unlimited_workers_seconds": round(
+                setup + self._simulate(durations, len(durations) or 1), 1
+            ),
+            "serial_seconds": round(setup + sum(durations.values()), 1),
+            "rate_limit_floor_seconds": round(rate_floor, 1),
+        }
+
+    def _simulate(self, durations: Dict[str, float], workers: int) -> float:
+        """Finish time of the DAG when each node starts as early as it can"""
+        finish: Dict[str, float] = {}
+        free_workers = [0.0] * workers
+        for node_id in self.plan.topological_order():
+            ready = max(
+                (finish[dep] for dep in self.plan.nodes[node_id].dependencies),
+                default=0.0,
+            )
+            start = max(ready, heapq.heappop(free_workers))
+            finish[node_id] = start + durations[node_id]
+            heapq.heappush(free_workers, finish[node_id])
+        return max(finish.values(), default=0.0)
+
+    def render(self, max_workers: int = CreateUniversalBot.MAX_WORKERS) -> str:
+        """Format the recorded calls by stage, with the time estimate"""
+        lines = []
+        stages: Dict[str, Dict[str, List[str]]] = {}
+        for step, operation in self.calls:
+            stage = step.partition(":")[0]
+            stages.setdefault(stage, {}).setdefault(step, []).append(operation)
+
+        for stage, steps in stages.items():
+            stage_calls = sum(len(operations) for operations in steps.values())
+            lines.append(
+                f"Stage {stage}: {len(steps)} step(s), {stage_calls} calls"
+            )
+            for step, operations in steps.items():
+                lines.append(f"  {step}: {', '.join(operations)}")
+
+        totals = Counter(operation for _, operation in self.calls)
+        lines.append("")
+        lines.append(f"{len(self.calls)} API calls:")
+        for operation, count in sorted(totals.items(), key=lambda item: -item[1]):
+            lines.append(
+                f"  {operation:<24} {count:5d}  "
+                f"~{self.latency_model.api(operation):.2f}s each"
+            )
+
+        estimate = self.estimate(max_workers)
+        lines.append("")
+        lines.append(
+            f"Estimated wall time: {estimate['estimated_seconds']:.0f}s with "
+            f"{max_workers} workers ({estimate['unlimited_workers_seconds']:.0f}s "
+            f"with unlimited workers, {estimate['serial_seconds']:.0f}s serial)"
+        )
+        lines.append(
+            f"Client-side rate limits alone need at least "
+            f"{estimate['rate_limit_floor_seconds']:.0f}s"
+        )
+        return "\n".join(lines)
@@ -0,0 +1,121 @@
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+class DeploymentJournalException(Exception):
+    """Exception for unreadable deployment journals"""
+
+    pass
+
+
+class DeploymentJournal:
+    """
+    Append-only JSON Lines record of completed provisioning steps.
+
+    Each run appends a "start" event, one "node" event per completed plan
+    node with its result (bot ID, slot type ID, intent ID, version, ...),
+    and a "complete" event when it succeeds. A run without a "complete"
+    event can be resumed from the results it recorded.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.run_id: Optional[str] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def path_for_state(cls, state_path: Path) -> Path:
+        """Journal location next to a deployment state file"""
+        return Path(state_path).with_suffix(".journal.jsonl")
+
+    def _append(self, event: str, **fields: Any) -> None:
+        """Append one event and flush it to disk before returning"""
+        entry = {"run": self.run_id, "event": event, "time": time.time(), **fields}
+        line = json.dumps(entry, sort_keys=True) + "\n"
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as journal_file:
+                journal_file.write(line)
+                journal_file.flush()
+                os.fsync(journal_file.fileno())
+
+    def _read_last_run(self) -> Tuple[Optional[str], Dict[str, Any], bool]:
+        """
+        Read the events of the most recent run.
+
+        Returns:
+            Tuple of (run ID, node results, completed flag)
+
+        Raises:
+            DeploymentJournalException: If a line other than the last is corrupt
+        """
+        if not self.path.exists():
+            return None, {}, False
+
+        lines = self.path.read_text(encoding="utf-8").splitlines()
+        run_id, results, completed = None, {}, False
+        for number, line in enumerate(lines, 1):
+            try:
+                entry = json.loads(line)
+            except ValueError as e:
+                if number == len(lines):
+                    # A crash mid-append can only truncate the final line
+                    logger.warning(f"Ignoring truncated journal line {number}")
+                    break
+                raise DeploymentJournalException(
+                    f"Corrupt journal {self.path} at line {number}: {e}"
+                ) from e
+
+            if entry["event"] == "start":
+                run_id, results, completed = entry["run"], {}, False
+            elif entry["run"] != run_id:
+                continue
+            elif entry["event"] == "node":
+                results[entry["node"]] = entry["result"]
+            elif entry["event"] == "complete":
+                completed = True
+
+        return run_id, results, completed
+
+    def begin(self) -> None:
+        """Start a new run"""
+        self.run_id = uuid.uuid4().hex
+        self._append("start")
+        logger.info(f"Journaling run {self.run_id} to {self.path}")
+
+    def resume(self) -> Dict[str, Any]:
+        """
+        Continue the most recent run if it did not complete.
+
+        Starts a new run if there is nothing to resume.
+
+        Returns:
+            Results of the nodes the interrupted run completed
+        """
+        run_id, results, completed = self._read_last_run()
+        if run_id is None or completed:
+            logger.info("No interrupted run to resume, starting a new one")
+            self.begin()
+            return {}
+
+        self.run_id = run_id
+        self._append("resume")
+        logger.info(f"Resuming run {run_id} with {len(results)} completed steps")
+        return results
+
+    def record_node(self, node_id: str, result: Any) -> None:
+        """Record a completed plan node and its result"""
+        self._append("node", node=node_id, result=result)
+
+    def complete(self) -> None:
+        """Mark the current run as finished"""
+        self._append("complete")
@@ -0,0 +1,157 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, Optional
+
+from bot_engine.utils.config_model import ConfigNode
+
+
+logger = logging.getLogger(__name__)
+
+
+class DeploymentStateException(Exception):
+    """Exception for unreadable or invalid deployment state files"""
+
+    pass
+
+
+def _plain(value: Any) -> Any:
+    """Convert config namespaces into plain JSON-serialisable values"""
+    if isinstance(value, ConfigNode):
+        return value.to_dict()
+    if isinstance(value, SimpleNamespace):
+        return {key: _plain(item) for key, item in vars(value).items()}
+    if isinstance(value, dict):
+        return {str(key): _plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+    return value
+
+
+def content_hash(definition: Any) -> str:
+    """
+    Stable hash of a resource definition.
+
+    Key order does not matter; list order does, since Lex keeps it.
+
+    Args:
+        definition: Config namespace, dict, list or scalar
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    encoded = json.dumps(_plain(definition), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class DeploymentState:
+    """
+    Local record of what a previous deployment produced.
+
+    Maps each resource key (the provisioning plan node ID, e.g.
+    "intent:en_US:OrderPizza") to the content hash of the definition it
+    was deployed from and the Lex resource ID it produced. An entry with
+    a hash of None has a known ID but unknown content, so the resource is
+    updated on the next run.
+    """
+
+    FORMAT_VERSION = 1
+    DEFAULT_DIR = ".lex_state"
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.resources: Dict[str, Dict[str, Optional[str]]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def default_path(cls, bot_name: str, region: str) -> Path:
+        """State file location for a bot in a region"""
+        return Path(cls.DEFAULT_DIR) / f"{bot_name}-{region}.json"
+
+    @classmethod
+    def load(cls, path: Path) -> "DeploymentState":
+        """
+        Load a state file, or start empty if it does not exist.
+
+        Raises:
+            DeploymentStateException: If the file is unreadable or from
+                another format version
+        """
+        state = cls(path)
+        if not state.path.exists():
+            logger.info(f"No deployment state at {state.path}, starting fresh")
+            return state
+
+        try:
+            data = json.loads(state.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            raise DeploymentStateException(
+                f"Cannot read deployment state {state.path}: {e}. "
+                "Re-sync it from the live bot."
+            ) from e
+
+        if data.get("formatVersion") != cls.FORMAT_VERSION:
+            raise DeploymentStateException(
+                f"Deployment state {state.path} has format version "
+                f"{data.get('formatVersion')}, expected {cls.FORMAT_VERSION}. "
+                "Re-sync it from the live bot."
+            )
+
+        state.resources = data.get("resources", {})
+        logger.info(f"Loaded {len(state.resources)} resources from {state.path}")
+        return state
+
+    def get(self, key: str) -> Optional[Dict[str, Optional[str]]]:
+        """Return the {hash, id} entry for a resource key, if any"""
+        with self._lock:
+            entry = self.resources.get(key)
+            return dict(entry) if entry else None
+
+    def record(self, key: str, digest: Optional[str], resource_id: str) -> None:
+        """Record the definition hash and Lex ID a resource was deployed with"""
+        with self._lock:
+            self.resources[key] = {"hash": digest, "id": resource_id}
+
+    def snapshot(self) -> Dict[str, Dict[str, Optional[str]]]:
+        """Return a copy of every resource entry"""
+        with self._lock:
+            return {key: dict(entry) for key, entry in self.resources.items()}
+
+    def clear(self) -> None:
+        """Drop every resource entry"""
+        with self._lock:
+            self.resources = {}
+
+    def save(self) -> None:
+        """
+        Write the state file atomically.
+
+        The file is written to a temporary file in the same directory and
+        renamed over the old one, so a crash never leaves a partial file.
+        """
+        with self._lock:
+            data = {
+                "formatVersion": self.FORMAT_VERSION,
+                "resources": dict(sorted(self.resources.items())),
+            }
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+                json.dump(data, tmp_file, indent=2)
+                tmp_file.write("\n")
+                tmp_file.flush()
+                os.fsync(tmp_file.fileno())
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        logger.debug(f"Saved {len(data['resources'])} resources to {self.path}")
@@ -0,0 +1,231 @@
+import hashlib
+import logging
+import re
+import struct
+from collections import defaultdict
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+# Words, plus slot references, which all count as the same token: two
+# carrier phrases overlap whatever slots they capture
+TOKEN_PATTERN = re.compile(r"\{[^{}]*\}|[\w']+")
+SLOT_TOKEN = "{slot}"
+
+
+class UtteranceOverlap:
+    """A pair of near-duplicate sample utterances in different intents"""
+
+    __slots__ = (
+        "locale_id",
+        "intent_a",
+        "utterance_a",
+        "intent_b",
+        "utterance_b",
+        "similarity",
+    )
+
+    def __init__(
+        self,
+        locale_id: str,
+        intent_a: str,
+        utterance_a: str,
+        intent_b: str,
+        utterance_b: str,
+        similarity: float,
+    ):
+        self.locale_id = locale_id
+        self.intent_a = intent_a
+        self.utterance_a = utterance_a
+        self.intent_b = intent_b
+        self.utterance_b = utterance_b
+        self.similarity = similarity
+
+    def to_dict(self) -> Dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __str__(self) -> str:
+        return (
+            f"{self.similarity:.2f}  {self.intent_a}: '{self.utterance_a}'  <->  "
+            f"{self.intent_b}: '{self.utterance_b}'"
+        )
+
+
+class OverlapAnalyzer:
+    """
+    Finds near-duplicate sample utterances across the intents of a locale.
+
+    Each utterance becomes the set of its words and word pairs (with slot
+    references reduced to one token) and a MinHash signature of that set.
+    Locality-sensitive hashing splits each signature into bands and
+    buckets utterances by band, so only utterances sharing a bucket are
+    compared: the work grows with the number of utterances, not with the
+    number of pairs. Candidate pairs from different intents are then
+    scored by the exact Jaccard similarity of their sets.
+
+    With BANDS bands of ROWS rows, pairs are found with probability
+    1 - (1 - s^ROWS)^BANDS for similarity s: about 95% at 0.6 and 99% at
+    0.7 with the defaults.
+    """
+
+    BANDS = 12
+    ROWS = 3
+    MIN_SIMILARITY = 0.6
+    # Utterances compared within one bucket; keeps templates made of many
+    # near-identical utterances from turning quadratic
+    MAX_BUCKET = 500
+
+    def __init__(
+        self,
+        min_similarity: float = MIN_SIMILARITY,
+        bands: int = BANDS,
+        rows: int = ROWS,
+    ):
+        """
+        Args:
+            min_similarity: Lowest Jaccard similarity reported
+            bands: LSH bands per signature
+            rows: Signature values per band
+        """
+        self.min_similarity = min_similarity
+        self.bands = bands
+        self.rows = rows
+        # One 32-bit hash function per signature value, all cut from a single
+        # SHAKE-128 digest of the shingle, so reports are reproducible
+        self._unpack = struct.Struct(f"<{bands * rows}I")
+
+    @staticmethod
+    def shingles(utterance: str) -> FrozenSet[str]:
+        """Words and adjacent word pairs of a normalised utterance"""
+        tokens = [
+            SLOT_TOKEN if token.startswith("{") else token
+            for token in TOKEN_PATTERN.findall(utterance.casefold())
+        ]
+        return frozenset(tokens).union(
+            f"{first} {second}" for first, second in zip(tokens, tokens[1:])
+        )
+
+    def _shingle_values(self, shingle: str) -> Tuple[int, ...]:
+        """The shingle's value under every hash function"""
+        digest = hashlib.shake_128(shingle.encode()).digest(self._unpack.size)
+        return self._unpack.unpack(digest)
+
+    def signature(self, shingles: Iterable[str]) -> List[int]:
+        """MinHash signature of a shingle set"""
+        return list(map(min, zip(*map(self._shingle_values, shingles))))
+
+    def analyze_locale(self, locale) -> List[UtteranceOverlap]:
+        """
+        Find near-duplicate utterances across the intents of one locale.
+
+        Args:
+            locale: Locale configuration from config
+
+        Returns:
+            Overlapping pairs, most similar first
+        """
+        entries: List[Tuple[str, str, FrozenSet[str]]] = []
+        buckets: Dict[Tuple, List[int]] = defaultdict(list)
+        for intent in locale.intents:
+            for utterance in intent.sampleUtterances:
+                shingles = self.shingles(utterance)
+                if not shingles:
+                    continue
+                index = len(entries)
+                entries.append((intent.name, utterance, shingles))
+                bands = zip(*[iter(self.signature(shingles))] * self.rows)
+                for band, rows in enumerate(bands):
+                    buckets[(band, rows)].append(index)
+
+        candidates: Set[Tuple[int, int]] = set()
+        oversized = 0
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+            if len(members) > self.MAX_BUCKET:
+                oversized += 1
+                members = members[: self.MAX_BUCKET]
+            for position, first in enumerate(members):
+                first_intent = entries[first][0]
+                for second in members[position + 1 :]:
+                    if entries[second][0] != first_intent:
+                        candidates.add((first, second))
+        if oversized:
+            logger.warning(
+                f"{locale.localeId}: {oversized} LSH buckets had more than "
+                f"{self.MAX_BUCKET} utterances and were only partly compared"
+            )
+
+        overlaps = []
+        for first, second in candidates:
+            intent_a, utterance_a, shingles_a = entries[first]
+            intent_b, utterance_b, shingles_b = entries[second]
+            similarity = len(shingles_a & shingles_b) / len(shingles_a | shingles_b)
+            if similarity >= self.min_similarity:
+                overlaps.append(
+                    UtteranceOverlap(
+                        locale.localeId,
+                        intent_a,
+                        utterance_a,
+                        intent_b,
+                        utterance_b,
+                        similarity,
+                    )
+                )
+        overlaps.sort(
+            key=lambda o: (-o.similarity, o.intent_a, o.intent_b, o.utterance_a)
+        )
+        logger.info(
+            f"{locale.localeId}: {len(entries)} utterances, "
+            f"{len(candidates)} candidate pairs, {len(overlaps)} overlaps"
+        )
+        return overlaps
+
+    def analyze(self, bot_config) -> Dict[str, List[UtteranceOverlap]]:
+        """
+        Find near-duplicate utterances across intents, locale by locale.
+
+        Args:
+            bot_config: Bot template configuration
+
+        Returns:
+            Overlapping pairs by locale ID
+        """
+        report = {}
+        for locale in bot_config.locale:
+            try:
+                report[locale.localeId] = self.analyze_locale(locale)
+            finally:
+                locale.release()
+        return report
+
+    @staticmethod
+    def render(
+        report: Dict[str, List[UtteranceOverlap]], limit: Optional[int] = 20
+    ) -> str:
+        """
+        Human-readable summary: overlap counts per intent pair, then the
+        most similar pairs of each locale.
+
+        Args:
+            report: Result of analyze()
+            limit: Pairs listed per locale, or None for all
+        """
+        lines = []
+        for locale_id, overlaps in report.items():
+            lines.append(f"{locale_id}: {len(overlaps)} overlapping utterance pairs")
+            by_intents: Dict[Tuple[str, str], List[float]] = defaultdict(list)
+            for overlap in overlaps:
+                pair = tuple(sorted((overlap.intent_a, overlap.intent_b)))
+                by_intents[pair].append(overlap.similarity)
+            for (intent_a, intent_b), scores in sorted(
+                by_intents.items(), key=lambda item: -len(item[1])
+            ):
+                lines.append(
+                    f"  {intent_a} <-> {intent_b}: {len(scores)} pairs, "
+                    f"max {max(scores):.2f}"
+                )
+            for overlap in overlaps[:limit]:
+                lines.append(f"    {overlap}")
+        return "\n".join(lines)
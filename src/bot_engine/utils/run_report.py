@@ -0,0 +1,63 @@
+import json
+import logging
+from pathlib import Path
+from typing import Dict, Hashable, Optional
+
+from bot_engine.builder.polling_scheduler import POLLING_SCHEDULER
+from bot_engine.utils.dag_scheduler import DagScheduler
+from common.client_factory import CLIENT_FACTORY
+from common.rate_limiter import RATE_LIMITER
+from common.telemetry import TRACER
+
+
+logger = logging.getLogger(__name__)
+
+
+def critical_path_report(plan: Optional[DagScheduler]) -> Dict:
+    """Critical path of a plan that ran, with the time of each node on it"""
+    path, seconds = plan.critical_path() if plan else ([], 0.0)
+    nodes = []
+    for node_id in path:
+        start, end = plan.timings[node_id]
+        nodes.append({"node": node_id, "seconds": round(end - start, 3)})
+    return {"seconds": round(seconds, 3), "nodes": nodes}
+
+
+def build_run_report(
+    plan: Optional[DagScheduler] = None, group: Hashable = None
+) -> Dict:
+    """
+    Assemble the timing report of the current run.
+
+    Args:
+        plan: Provisioning plan that ran, for its critical path
+        group: Polling group (bot context) whose readiness times to report
+
+    Returns:
+        JSON-serialisable report: wall time per step, per-API call counts
+        and latency percentiles, working versus waiting and sleeping time,
+        throttles per API family, status polling and the critical path
+    """
+    report = TRACER.summary()
+    report["critical_path"] = critical_path_report(plan)
+    report["throttles"] = RATE_LIMITER.stats()
+    report["status_polling"] = {
+        **POLLING_SCHEDULER.stats(),
+        "ready_after_seconds": POLLING_SCHEDULER.readiness(group),
+    }
+    report["connection_pools"] = CLIENT_FACTORY.pool_stats()
+    return report
+
+
+def write_run_report(
+    path: Path,
+    plan: Optional[DagScheduler] = None,
+    group: Hashable = None,
+    **sections,
+) -> None:
+    """Write the timing report of the current run, plus any extra sections, as JSON"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    report = {**build_run_report(plan, group), **sections}
+    path.write_text(json.dumps(report, indent=2) + "\n")
+    logger.info(f"Run report written to {path}")
@@ -0,0 +1,278 @@
+import csv
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from bot_engine.utils.validators import LEX_LIMITS
+
+
+logger = logging.getLogger(__name__)
+
+# A row of a catalog or an inline value: (location, value, synonyms)
+ValueRow = Tuple[str, str, Sequence[str]]
+
+
+class SlotValueCatalogException(Exception):
+    """Exception for slot value catalogs that cannot be read or exceed Lex limits"""
+
+    def __init__(self, message: str, problems: Sequence[str] = ()):
+        self.problems = list(problems)
+        super().__init__(
+            "\n".join([message, *(f"  {problem}" for problem in self.problems)])
+        )
+
+
+class SlotValueCatalog:
+    """
+    A file of slot type values and their synonyms.
+
+    CSV rows hold a value followed by its synonyms; a header row whose first
+    cell is "value" or "sampleValue" is skipped, as are blank rows and rows
+    starting with "#". JSONL lines hold objects such as
+    {"sampleValue": "laptop", "synonyms": ["notebook"]}. Rows are streamed,
+    so reading a catalog never holds the file in memory.
+    """
+
+    FORMATS = (".csv", ".jsonl", ".ndjson")
+    HEADER_CELLS = ("value", "samplevalue")
+    CHUNK_SIZE = 1 << 20
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: Catalog file; its suffix selects the format
+
+        Raises:
+            SlotValueCatalogException: If the suffix is not a known format
+        """
+        self.path = Path(path)
+        self.format = self.path.suffix.lower()
+        if self.format not in self.FORMATS:
+            raise SlotValueCatalogException(
+                f"{self.path}: unknown slot value catalog format "
+                f"(expected {', '.join(self.FORMATS)})"
+            )
+
+    def rows(self, problems: List[str]) -> Iterator[ValueRow]:
+        """
+        Stream the catalog rows.
+
+        Args:
+            problems: Malformed rows are described here and skipped
+
+        Raises:
+            SlotValueCatalogException: If the file cannot be read
+        """
+        try:
+            with open(self.path, encoding="utf-8-sig", newline="") as f:
+                if self.format == ".csv":
+                    yield from self._csv_rows(f, problems)
+                else:
+                    yield from self._jsonl_rows(f, problems)
+        except (OSError, UnicodeDecodeError, csv.Error) as e:
+            raise SlotValueCatalogException(f"{self.path}: cannot read: {e}") from e
+
+    def _csv_rows(self, f, problems: List[str]) -> Iterator[ValueRow]:
+        reader = csv.reader(f)
+        for cells in reader:
+            if not cells or not any(cells) or cells[0].lstrip().startswith("#"):
+                continue
+            if reader.line_num == 1 and cells[0].strip().lower() in self.HEADER_CELLS:
+                continue
+            yield f"{self.path.name}:{reader.line_num}", cells[0], cells[1:]
+
+    def _jsonl_rows(self, f, problems: List[str]) -> Iterator[ValueRow]:
+        for number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            location = f"{self.path.name}:{number}"
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as e:
+                problems.append(f"{location}: invalid JSON: {e.msg}")
+                continue
+            if not isinstance(row, dict):
+                row = {}
+            value = row.get("sampleValue", row.get("value"))
+            synonyms = row.get("synonyms") or []
+            if (
+                not isinstance(value, str)
+                or not isinstance(synonyms, list)
+                or not all(isinstance(synonym, str) for synonym in synonyms)
+            ):
+                problems.append(
+                    f"{location}: expected an object with a string sampleValue "
+                    f"and a list of string synonyms"
+                )
+                continue
+            yield location, value, synonyms
+
+    def digest(self) -> str:
+        """SHA-256 of the file contents, read in chunks"""
+        digest = hashlib.sha256()
+        try:
+            with open(self.path, "rb") as f:
+                for chunk in iter(lambda: f.read(self.CHUNK_SIZE), b""):
+                    digest.update(chunk)
+        except OSError as e:
+            raise SlotValueCatalogException(f"{self.path}: cannot read: {e}") from e
+        return digest.hexdigest()
+
+
+def build_slot_type_values(
+    values: Iterable[ValueRow] = (),
+    catalog: Optional[SlotValueCatalog] = None,
+    max_entries: int = LEX_LIMITS["slot_type_values_per_slot_type"],
+    max_length: int = LEX_LIMITS["slot_value_length"],
+) -> List[Dict]:
+    """
+    Build the slotTypeValues payload of a custom slot type in one pass.
+
+    Values and synonyms have their whitespace collapsed and are
+    deduplicated case-insensitively: rows repeating a value merge their
+    synonyms into the first, and synonyms repeating their value are dropped.
+    Entries are created directly in API format, so besides the payload only
+    the casefolded forms used for deduplication are held.
+
+    Args:
+        values: Inline (location, value, synonyms) rows, taken first
+        catalog: Catalog whose rows follow the inline ones
+        max_entries: Most values plus synonyms a slot type may have
+        max_length: Longest value or synonym
+
+    Returns:
+        Entries of the form {"sampleValue": {"value": ...}, "synonyms": [...]}
+
+    Raises:
+        SlotValueCatalogException: Listing every malformed row and limit
+            exceeded
+    """
+    problems: List[str] = []
+    entries: Dict[str, Dict] = {}
+    synonym_keys: Dict[str, Set[str]] = {}
+    count = 0
+
+    sources = [values]
+    if catalog is not None:
+        sources.append(catalog.rows(problems))
+    for rows in sources:
+        for location, value, synonyms in rows:
+            value = " ".join(value.split())
+            if not value:
+                problems.append(f"{location}: empty value")
+                continue
+            if len(value) > max_length:
+                problems.append(
+                    f"{location}: value longer than {max_length} characters"
+                )
+                continue
+            key = value.casefold()
+            entry = entries.get(key)
+            if entry is None:
+                entry = {"sampleValue": {"value": value}, "synonyms": []}
+                entries[key] = entry
+                seen = synonym_keys[key] = {key}
+                count += 1
+            else:
+                seen = synonym_keys[key]
+            for synonym in synonyms:
+                synonym = " ".join(synonym.split())
+                if not synonym:
+                    continue
+                if len(synonym) > max_length:
+                    problems.append(
+                        f"{location}: synonym '{synonym[:20]}...' longer than "
+                        f"{max_length} characters"
+                    )
+                    continue
+                synonym_key = synonym.casefold()
+                if synonym_key not in seen:
+                    seen.add(synonym_key)
+                    entry["synonyms"].append({"value": synonym})
+                    count += 1
+
+    if count > max_entries:
+        problems.append(
+            f"{count} values and synonyms, Lex allows {max_entries} per slot type"
+        )
+    if problems:
+        source = catalog.path if catalog is not None else "slotTypeValues"
+        raise SlotValueCatalogException(
+            f"{source}: {len(problems)} problem(s) in slot type values", problems
+        )
+    logger.debug(f"Built {len(entries)} slot type values ({count} with synonyms)")
+    return list(entries.values())
+
+
+def slot_type_values(slot_type, template_dir: Optional[Path] = None) -> List[Dict]:
+    """
+    The slotTypeValues payload of a custom slot type from config.
+
+    Args:
+        slot_type: Slot type configuration from config
+        template_dir: Directory a valuesFile is relative to
+
+    Returns:
+        Inline values followed by those of the slot type's valuesFile
+
+    Raises:
+        SlotValueCatalogException: If the values are malformed or exceed
+            Lex limits
+    """
+    catalog = None
+    if slot_type.valuesFile:
+        catalog = SlotValueCatalog(Path(template_dir or ".") / slot_type.valuesFile)
+    return build_slot_type_values(
+        (
+            (f"slotTypeValues[{index}]", value.sampleValue, value.synonyms)
+            for index, value in enumerate(slot_type.slotTypeValues)
+        ),
+        catalog,
+    )
+
+
+def values_file_digest(slot_type, template_dir: Optional[Path] = None) -> Optional[str]:
+    """SHA-256 of a slot type's valuesFile, or None if it has none"""
+    if not slot_type.valuesFile:
+        return None
+    return SlotValueCatalog(Path(template_dir or ".") / slot_type.valuesFile).digest()
+
+
+def values_file_problems(
+    slot_type: Dict[str, Any], limits: Dict[str, int], template_dir: Path
+) -> List[str]:
+    """
+    Problems with the complete value set of a parsed slotType mapping that
+    names a valuesFile, for TemplateValidator.
+
+    Args:
+        slot_type: slotType mapping of a parsed template
+        limits: Lex limits to check against
+        template_dir: Directory the valuesFile is relative to
+
+    Returns:
+        Every problem found; empty if the values fit
+    """
+    inline = slot_type.get("slotTypeValues")
+    rows = (
+        (
+            f"slotTypeValues[{index}]",
+            value["sampleValue"],
+            [s for s in value.get("synonyms") or [] if isinstance(s, str)],
+        )
+        for index, value in enumerate(inline if isinstance(inline, list) else [])
+        # Mistyped entries are reported by the validator's structure check
+        if isinstance(value, dict) and isinstance(value.get("sampleValue"), str)
+    )
+    try:
+        build_slot_type_values(
+            rows,
+            SlotValueCatalog(Path(template_dir) / slot_type["valuesFile"]),
+            limits["slot_type_values_per_slot_type"],
+            limits["slot_value_length"],
+        )
+    except SlotValueCatalogException as e:
+        return e.problems or [str(e)]
+    return []
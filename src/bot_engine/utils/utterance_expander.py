@@ -0,0 +1,277 @@
+import logging
+import math
+import re
+from bisect import bisect_right
+from itertools import accumulate, product
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set
+
+from bot_engine.utils.validators import LEX_LIMITS
+
+
+logger = logging.getLogger(__name__)
+
+# Characters that make a sample utterance a pattern; {SLOT} references are
+# plain text to the grammar
+GRAMMAR_PATTERN = re.compile(r"[()\[\]<>|]")
+TOKEN_PATTERN = re.compile(r"[()\[\]<>|]|[^()\[\]<>|]+")
+SYNONYMS_FIELD = "utteranceSynonyms"
+
+
+class UtteranceGrammarException(Exception):
+    """Exception for sample utterance patterns that cannot be expanded"""
+
+    pass
+
+
+class _PatternParser:
+    """Recursive-descent parser of one utterance pattern"""
+
+    def __init__(self, pattern: str, synonyms: Dict[str, Sequence[str]]):
+        self.pattern = pattern
+        self.synonyms = synonyms
+        self.tokens = TOKEN_PATTERN.findall(pattern)
+        self.position = 0
+
+    def parse(self) -> List[List[List[str]]]:
+        """
+        Returns:
+            Top-level alternatives, each a sequence of choice lists whose
+            product gives the alternative's expansions
+        """
+        return self._alternatives(None)
+
+    def _alternatives(self, closing: Optional[str]) -> List[List[List[str]]]:
+        alternatives: List[List[List[str]]] = [[]]
+        while self.position < len(self.tokens):
+            token = self.tokens[self.position]
+            self.position += 1
+            if token in ("(", "["):
+                group = _expand(self._alternatives(")" if token == "(" else "]"))
+                alternatives[-1].append(group + [""] if token == "[" else group)
+            elif token == "<":
+                alternatives[-1].append(self._synonyms())
+            elif token == "|":
+                alternatives.append([])
+            elif token in (")", "]"):
+                if token != closing:
+                    raise self._error(f"unexpected '{token}'")
+                return alternatives
+            elif token == ">":
+                raise self._error("unexpected '>'")
+            else:
+                alternatives[-1].append([token])
+        if closing is not None:
+            raise self._error(f"missing '{closing}'")
+        return alternatives
+
+    def _synonyms(self) -> List[str]:
+        tokens = self.tokens[self.position : self.position + 2]
+        if len(tokens) != 2 or tokens[1] != ">":
+            raise self._error("synonym reference needs the form <name>")
+        self.position += 2
+        name = tokens[0].strip()
+        if name not in self.synonyms:
+            raise self._error(f"unknown synonym list <{name}>")
+        return list(self.synonyms[name])
+
+    def _error(self, message: str) -> UtteranceGrammarException:
+        return UtteranceGrammarException(f"{message} in '{self.pattern}'")
+
+
+def _expand(alternatives: List[List[List[str]]]) -> List[str]:
+    return [
+        "".join(parts)
+        for sequence in alternatives
+        for parts in product(*sequence)
+    ]
+
+
+def _nth_expansion(sequence: List[List[str]], index: int) -> str:
+    """The index-th expansion of a sequence, in product() order"""
+    parts = []
+    for choices in reversed(sequence):
+        index, choice = divmod(index, len(choices))
+        parts.append(choices[choice])
+    return "".join(reversed(parts))
+
+
+class UtteranceExpander:
+    """
+    Expands sample utterance patterns into plain sample utterances.
+
+    The grammar adds three constructs to an utterance:
+
+        (a|b|c)   one of the alternatives
+        [a|b]     optionally one of the alternatives
+        <name>    one of the phrases of a named synonym list
+
+    Groups nest, and {SLOT} references pass through unchanged, e.g.
+    "[please] (help|assist) me with <product> {CUSTOM_PHRASE}".
+
+    Utterances without grammar are kept verbatim. Expanded ones have their
+    whitespace collapsed. Both are deduplicated on their case-folded,
+    whitespace-normalised text. When the patterns have more expansions
+    than the per-intent limit allows, expansions are picked at even
+    intervals by their index, so every part of a pattern stays represented
+    and the rest are never generated; hand-written utterances are always
+    kept.
+    """
+
+    def __init__(
+        self,
+        synonyms: Optional[Dict[str, Sequence[str]]] = None,
+        max_utterances: int = LEX_LIMITS["utterances_per_intent"],
+    ):
+        """
+        Args:
+            synonyms: Phrase lists that patterns reference as <name>
+            max_utterances: Most utterances to produce for one intent
+        """
+        self.synonyms = synonyms or {}
+        self.max_utterances = max_utterances
+
+    def candidates(self, pattern: str) -> Iterator[str]:
+        """
+        Every expansion of one pattern, in order.
+
+        Raises:
+            UtteranceGrammarException: If the pattern is malformed
+        """
+        for sequence in _PatternParser(pattern, self.synonyms).parse():
+            yield from map("".join, product(*sequence))
+
+    def expand(self, utterances: Sequence[str]) -> List[str]:
+        """
+        Expand the sample utterances of one intent.
+
+        Args:
+            utterances: Plain utterances and patterns, in template order
+
+        Returns:
+            Hand-written utterances, then expanded ones, without duplicates
+
+        Raises:
+            UtteranceGrammarException: Naming every malformed pattern
+        """
+        seen: Set[str] = set()
+        kept: List[str] = []
+        sequences: List[List[List[str]]] = []
+        errors: List[str] = []
+        for utterance in utterances:
+            if GRAMMAR_PATTERN.search(utterance):
+                try:
+                    sequences.extend(_PatternParser(utterance, self.synonyms).parse())
+                except UtteranceGrammarException as e:
+                    errors.append(str(e))
+                continue
+            key = " ".join(utterance.casefold().split())
+            if key not in seen:
+                seen.add(key)
+                kept.append(utterance)
+        if errors:
+            raise UtteranceGrammarException("; ".join(errors))
+
+        # Expansions are numbered across all patterns in template order;
+        # ends[i] is one past the last number of sequences[i]
+        ends = list(
+            accumulate(
+                math.prod(len(choices) for choices in sequence)
+                for sequence in sequences
+            )
+        )
+        total = ends[-1] if ends else 0
+        budget = max(self.max_utterances - len(kept), 0)
+        step = 1.0
+        if total > budget:
+            logger.info(
+                f"Sampling {budget} of {total} expansions to stay within "
+                f"{self.max_utterances} utterances per intent"
+            )
+            step = total / budget if budget else 0
+
+        expanded: List[str] = []
+        for interval in range(min(budget, total)):
+            # The first new expansion of each interval, skipping duplicates
+            for index in range(int(interval * step), int((interval + 1) * step)):
+                position = bisect_right(ends, index)
+                start = ends[position - 1] if position else 0
+                text = " ".join(
+                    _nth_expansion(sequences[position], index - start).split()
+                )
+                key = text.casefold()
+                if text and key not in seen:
+                    seen.add(key)
+                    expanded.append(text)
+                    break
+        return kept + expanded
+
+
+def expand_template_utterances(data: Any) -> Any:
+    """
+    Expand the utterance patterns of a parsed template in place.
+
+    Handles both a bot template and a locale include file. A locale's
+    utteranceSynonyms mapping sits beside its intents and is consumed by
+    the expansion, so the result is a plain template.
+
+    Args:
+        data: Parsed YAML document
+
+    Returns:
+        The same document
+
+    Raises:
+        UtteranceGrammarException: Naming every malformed pattern
+    """
+    if not isinstance(data, dict):
+        return data
+    if isinstance(data.get("bot"), dict):
+        locales = data["bot"].get("locale")
+        if not isinstance(locales, list):
+            return data
+        paths = [f"bot.locale[{index}]" for index in range(len(locales))]
+    else:
+        locales, paths = [data], ["locale"]
+
+    errors = []
+    for locale, path in zip(locales, paths):
+        if isinstance(locale, dict):
+            errors.extend(_expand_locale(locale, path))
+    if errors:
+        raise UtteranceGrammarException(
+            f"Malformed utterance patterns in {len(errors)} intent(s):\n"
+            + "\n".join(f"  {error}" for error in errors)
+        )
+    return data
+
+
+def _expand_locale(locale: Dict[str, Any], path: str) -> List[str]:
+    """Expand every intent of one locale; returns error messages"""
+    synonyms = locale.pop(SYNONYMS_FIELD, None) or {}
+    if locale.get("include") is not None and synonyms:
+        return [f"{path}.{SYNONYMS_FIELD}: must be in the include file"]
+    if not isinstance(synonyms, dict) or not all(
+        isinstance(phrases, list) and all(isinstance(p, str) for p in phrases)
+        for phrases in synonyms.values()
+    ):
+        return [f"{path}.{SYNONYMS_FIELD}: expected lists of phrases by name"]
+
+    expander = UtteranceExpander({str(name): p for name, p in synonyms.items()})
+    errors = []
+    intents = locale.get("intents")
+    for index, intent in enumerate(intents if isinstance(intents, list) else []):
+        if not isinstance(intent, dict):
+            continue
+        utterances = intent.get("sampleUtterances")
+        # Malformed lists are left for the template validator to report
+        if not isinstance(utterances, list) or not all(
+            isinstance(utterance, str) for utterance in utterances
+        ):
+            continue
+        if not any(GRAMMAR_PATTERN.search(utterance) for utterance in utterances):
+            continue
+        try:
+            intent["sampleUtterances"] = expander.expand(utterances)
+        except UtteranceGrammarException as e:
+            errors.append(f"{path}.intents[{index}].sampleUtterances: {e}")
+    return errors
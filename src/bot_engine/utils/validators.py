@@ -0,0 +1,568 @@
+import logging
+import re
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from bot_engine.utils.config_model import BotConfig, LocaleConfig
+
+
+logger = logging.getLogger(__name__)
+
+
+# Amazon Lex V2 default service quotas and API constraints checked before
+# deploying; raise an entry if the account has a quota increase
+LEX_LIMITS: Dict[str, int] = {
+    "name_length": 100,
+    "description_length": 200,
+    "intents_per_locale": 1000,
+    "slot_types_per_locale": 250,
+    "slots_per_intent": 100,
+    "utterances_per_intent": 1500,
+    "utterance_length": 200,
+    "slot_type_values_per_slot_type": 10000,
+    "slot_value_length": 140,
+    "min_idle_session_ttl": 60,
+    "max_idle_session_ttl": 86400,
+}
+
+# Bot, intent, slot and slot type names
+NAME_PATTERN = re.compile(r"^([0-9a-zA-Z][_-]?)+$")
+SLOT_REFERENCE_PATTERN = re.compile(r"\{([^{}]*)\}")
+
+SLOT_KINDS = ("Custom", "Extended", "BuiltIn")
+SLOT_CONSTRAINTS = ("Required", "Optional")
+RESOLUTION_STRATEGIES = ("OriginalValue", "TopResolution", "Concatenation")
+CODE_HOOKS = ("fulfillmentCodeHook", "intentConfirmationSetting")
+
+# Expected type of each scalar field, by field name
+SCALAR_TYPES: Dict[str, Tuple[type, ...]] = {
+    "name": (str,),
+    "description": (str,),
+    "region": (str,),
+    "roleArn": (str,),
+    "childDirected": (bool,),
+    "idleSessionTTLInSeconds": (int,),
+    "localeId": (str,),
+    "include": (str,),
+    "nluIntentConfidenceThreshold": (int, float),
+    "arn": (str,),
+    "codeHookInterfaceVersion": (str,),
+    "voiceId": (str,),
+    "engine": (str,),
+    "intent": (str,),
+    "slotPhraseName": (str,),
+    "type": (str,),
+    "slotConstraint": (str,),
+    "priority": (int,),
+    "slotTypeId": (str,),
+    "resolutionStrategy": (str,),
+    "parentSlotTypeSignature": (str,),
+    "regexPattern": (str,),
+    "sampleValue": (str,),
+    "valuesFile": (str,),
+}
+
+
+class ValidationIssue:
+    """One problem found in a bot template"""
+
+    __slots__ = ("path", "message")
+
+    def __init__(self, path: str, message: str):
+        self.path = path
+        self.message = message
+
+    def __str__(self) -> str:
+        return f"{self.path}: {self.message}"
+
+    def __repr__(self) -> str:
+        return f"ValidationIssue({self.path!r}, {self.message!r})"
+
+
+class TemplateValidationException(Exception):
+    """Exception listing every problem found in a bot template"""
+
+    def __init__(self, issues: List[ValidationIssue]):
+        super().__init__(
+            f"{len(issues)} problem(s) in bot template:\n"
+            + "\n".join(f"  {issue}" for issue in issues)
+        )
+        self.issues = issues
+
+
+class TemplateValidator:
+    """
+    Checks a parsed bot template before any API call is made.
+
+    One pass over the template checks its structure against the config
+    model (required fields, unknown keys and field types), the Lex naming
+    rules and service quotas in LEX_LIMITS, and the cross-references Lex
+    would otherwise reject minutes into a deployment: slots that name a
+    missing intent, {SLOT} references in sample utterances without a
+    matching slotPhraseName on the intent, duplicate names, utterances and
+    slot priorities. Every problem is collected instead of stopping at the
+    first one.
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, int]] = None,
+        allow_duplicate_utterances: bool = False,
+    ):
+        """
+        Args:
+            limits: Overrides of LEX_LIMITS entries
+            allow_duplicate_utterances: Report duplicate utterances as
+                warnings rather than issues, for tools that analyse them
+                instead of deploying the template
+        """
+        self.limits = {**LEX_LIMITS, **(limits or {})}
+        self.allow_duplicate_utterances = allow_duplicate_utterances
+        self.issues: List[ValidationIssue] = []
+        self.warnings: List[ValidationIssue] = []
+        self._check_values_file: Optional[Callable[..., List[str]]] = None
+
+    def validate(
+        self,
+        bot: Dict[str, Any],
+        load_include: Optional[Callable[[str], Any]] = None,
+        check_values_file: Optional[Callable[..., List[str]]] = None,
+    ) -> List[ValidationIssue]:
+        """
+        Validate the bot section of a parsed template.
+
+        Included locale files are read and checked one at a time, so only
+        one of them is held in memory.
+
+        Args:
+            bot: Mapping under the template's top-level "bot" key
+            load_include: Returns the parsed content of a locale include
+                path; without it only the locale headers are checked
+            check_values_file: Called with a slotType mapping that names a
+                valuesFile and the limits; returns the problems of its
+                complete value set. Without it value files are not read
+
+        Returns:
+            Every problem found, in template order; empty if the template
+            is valid. Allowed duplicate utterances are left in warnings
+        """
+        self.issues = []
+        self.warnings = []
+        self._check_values_file = check_values_file
+        if not self._check_node(bot, BotConfig, "bot"):
+            return self.issues
+
+        self._check_name(bot.get("name"), "bot.name")
+        ttl = bot.get("idleSessionTTLInSeconds")
+        if _is_int(ttl) and not (
+            self.limits["min_idle_session_ttl"]
+            <= ttl
+            <= self.limits["max_idle_session_ttl"]
+        ):
+            self._issue(
+                "bot.idleSessionTTLInSeconds",
+                f"must be between {self.limits['min_idle_session_ttl']} and "
+                f"{self.limits['max_idle_session_ttl']} seconds",
+            )
+
+        locale_ids: Set[str] = set()
+        for index, locale in enumerate(_list(bot.get("locale"))):
+            path = f"bot.locale[{index}]"
+            if not isinstance(locale, dict):
+                continue
+            locale_id = locale.get("localeId")
+            if locale_id in locale_ids:
+                self._issue(f"{path}.localeId", f"duplicate locale {locale_id}")
+            locale_ids.add(locale_id)
+            if locale.get("include") is not None and load_include is not None:
+                locale = self._include_locale(locale, path, load_include)
+                if locale is None:
+                    continue
+            self._check_locale(locale, path)
+
+        if not locale_ids:
+            self._issue("bot.locale", "the bot needs at least one locale")
+        return self.issues
+
+    def check(
+        self,
+        bot: Dict[str, Any],
+        load_include: Optional[Callable[[str], Any]] = None,
+        check_values_file: Optional[Callable[..., List[str]]] = None,
+    ) -> None:
+        """
+        Validate the bot section of a parsed template; see validate().
+
+        Raises:
+            TemplateValidationException: With every problem found
+        """
+        issues = self.validate(bot, load_include, check_values_file)
+        if issues:
+            raise TemplateValidationException(issues)
+
+    def _issue(self, path: str, message: str) -> None:
+        self.issues.append(ValidationIssue(path, message))
+
+    def _check_node(self, data: Any, node_class: type, path: str) -> bool:
+        """
+        Check a mapping and everything nested in it against a model class.
+
+        Returns:
+            True if data is a mapping (whatever its contents)
+        """
+        if not isinstance(data, dict):
+            self._issue(path, f"expected a mapping, got {type(data).__name__}")
+            return False
+
+        fields = node_class.__slots__
+        for field in node_class.REQUIRED:
+            if data.get(field) is None:
+                self._issue(path, f"missing required field '{field}'")
+
+        for key, value in data.items():
+            field_path = f"{path}.{key}"
+            if key not in fields or key.startswith("_"):
+                self._issue(path, f"unknown field '{key}'")
+            elif value is None:
+                continue
+            elif key in node_class.NODES:
+                self._check_node(value, node_class.NODES[key], field_path)
+            elif key in node_class.NODE_LISTS:
+                if not isinstance(value, list):
+                    self._issue(field_path, "expected a list")
+                    continue
+                item_class = node_class.NODE_LISTS[key]
+                for index, item in enumerate(value):
+                    self._check_node(item, item_class, f"{field_path}[{index}]")
+            elif key in node_class.STRING_LISTS:
+                self._check_strings(value, field_path)
+            else:
+                self._check_scalar(key, value, field_path)
+        return True
+
+    def _check_scalar(self, key: str, value: Any, path: str) -> None:
+        expected = SCALAR_TYPES.get(key)
+        if expected is None:
+            return
+        # bool is an int subclass, but True is not a valid priority or TTL
+        if not isinstance(value, expected) or (
+            isinstance(value, bool) and bool not in expected
+        ):
+            names = " or ".join(kind.__name__ for kind in expected)
+            self._issue(path, f"expected {names}, got {type(value).__name__}")
+        elif key == "description" and len(value) > self.limits["description_length"]:
+            self._issue(
+                path,
+                f"longer than {self.limits['description_length']} characters",
+            )
+
+    def _check_strings(self, value: Any, path: str) -> None:
+        if isinstance(value, str):
+            return
+        if not isinstance(value, list):
+            self._issue(path, f"expected a list of strings, got {type(value).__name__}")
+            return
+        for index, item in enumerate(value):
+            if not isinstance(item, str):
+                self._issue(f"{path}[{index}]", "expected a string")
+
+    def _check_name(self, name: Any, path: str) -> None:
+        if not isinstance(name, str):
+            return
+        if len(name) > self.limits["name_length"]:
+            self._issue(path, f"longer than {self.limits['name_length']} characters")
+        if not NAME_PATTERN.match(name):
+            self._issue(
+                path,
+                f"'{name}' may only contain letters, digits and single '_' or '-' "
+                f"separators",
+            )
+
+    def _include_locale(
+        self,
+        locale: Dict[str, Any],
+        path: str,
+        load_include: Callable[[str], Any],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Check a locale's include file against the model.
+
+        Returns:
+            The locale header merged with the included fields, or None if
+            the file cannot be read
+        """
+        include = locale["include"]
+        include_path = f"{path}.include"
+        inline = [name for name in LocaleConfig.INCLUDED_FIELDS if name in locale]
+        if inline:
+            self._issue(
+                include_path,
+                f"{', '.join(inline)} must be in {include} or inline, not both",
+            )
+        try:
+            included = load_include(include)
+        except Exception as e:
+            self._issue(include_path, f"cannot load {include}: {e}")
+            return None
+        if not isinstance(included, dict):
+            self._issue(include_path, f"{include} must contain a mapping")
+            return None
+
+        for key, value in included.items():
+            if key not in LocaleConfig.INCLUDED_FIELDS:
+                self._issue(include_path, f"unknown field '{key}' in {include}")
+            elif value is not None and not isinstance(value, list):
+                self._issue(f"{path}.{key}", "expected a list")
+            else:
+                item_class = LocaleConfig.NODE_LISTS[key]
+                for index, item in enumerate(value or []):
+                    self._check_node(item, item_class, f"{path}.{key}[{index}]")
+        return {**locale, **included}
+
+    def _check_locale(self, locale: Dict[str, Any], path: str) -> None:
+        """Limits and cross-references within one locale"""
+        threshold = locale.get("nluIntentConfidenceThreshold")
+        if isinstance(threshold, (int, float)) and not 0 <= threshold <= 1:
+            self._issue(
+                f"{path}.nluIntentConfidenceThreshold", "must be between 0 and 1"
+            )
+
+        intents = [i for i in _list(locale.get("intents")) if isinstance(i, dict)]
+        if len(intents) > self.limits["intents_per_locale"]:
+            self._issue(
+                f"{path}.intents",
+                f"{len(intents)} intents, Lex allows "
+                f"{self.limits['intents_per_locale']} per locale",
+            )
+
+        # Slot definitions first: utterances are checked against their slots
+        slots_by_intent: Dict[str, Set[str]] = {}
+        priorities: Dict[Tuple[str, int], str] = {}
+        slot_names: Set[str] = set()
+        slot_types = 0
+        intent_names = {intent.get("name") for intent in intents}
+        for index, slot in enumerate(_list(locale.get("slotDefinitions"))):
+            slot_path = f"{path}.slotDefinitions[{index}]"
+            if not isinstance(slot, dict):
+                continue
+            name = slot.get("name")
+            if name in slot_names:
+                self._issue(f"{slot_path}.name", f"duplicate slot definition {name}")
+            slot_names.add(name)
+
+            intent = slot.get("intent")
+            if intent is not None and intent not in intent_names:
+                self._issue(
+                    f"{slot_path}.intent",
+                    f"slot {name} references intent '{intent}', which this "
+                    f"locale does not define",
+                )
+            phrase = slot.get("slotPhraseName")
+            self._check_name(phrase, f"{slot_path}.slotPhraseName")
+            phrases = slots_by_intent.setdefault(intent, set())
+            if phrase in phrases:
+                self._issue(
+                    f"{slot_path}.slotPhraseName",
+                    f"intent {intent} already has a slot named {phrase}",
+                )
+            phrases.add(phrase)
+
+            priority = slot.get("priority")
+            if _is_int(priority):
+                if priority < 1:
+                    self._issue(f"{slot_path}.priority", "must be 1 or more")
+                elif (intent, priority) in priorities:
+                    self._issue(
+                        f"{slot_path}.priority",
+                        f"priority {priority} is also used by slot "
+                        f"{priorities[(intent, priority)]} of intent {intent}",
+                    )
+                else:
+                    priorities[(intent, priority)] = name
+
+            if slot.get("type") in ("Custom", "Extended"):
+                slot_types += 1
+            self._check_slot(slot, slot_path)
+
+        if slot_types > self.limits["slot_types_per_locale"]:
+            self._issue(
+                f"{path}.slotDefinitions",
+                f"{slot_types} slot types, Lex allows "
+                f"{self.limits['slot_types_per_locale']} per locale",
+            )
+
+        seen_intents: Set[str] = set()
+        # Normalised utterance -> (intent index, intent name), since Lex
+        # rejects duplicates within and across intents
+        utterances: Dict[str, Tuple[int, str]] = {}
+        for index, intent in enumerate(_list(locale.get("intents"))):
+            if not isinstance(intent, dict):
+                continue
+            intent_path = f"{path}.intents[{index}]"
+            name = intent.get("name")
+            self._check_name(name, f"{intent_path}.name")
+            if name in seen_intents:
+                self._issue(f"{intent_path}.name", f"duplicate intent {name}")
+            seen_intents.add(name)
+            self._check_intent(
+                intent,
+                intent_path,
+                slots_by_intent.get(name, set()),
+                utterances,
+                index,
+            )
+
+    def _check_slot(self, slot: Dict[str, Any], path: str) -> None:
+        kind = slot.get("type")
+        if kind is not None and kind not in SLOT_KINDS:
+            self._issue(f"{path}.type", f"must be one of {', '.join(SLOT_KINDS)}")
+        constraint = slot.get("slotConstraint")
+        if constraint is not None and constraint not in SLOT_CONSTRAINTS:
+            self._issue(
+                f"{path}.slotConstraint",
+                f"must be one of {', '.join(SLOT_CONSTRAINTS)}",
+            )
+
+        slot_type = slot.get("slotType")
+        if kind == "BuiltIn":
+            if not slot.get("slotTypeId"):
+                self._issue(path, "built-in slot needs a slotTypeId, e.g. AMAZON.City")
+            return
+        if kind in ("Custom", "Extended"):
+            self._check_name(slot.get("name"), f"{path}.name")
+            if not isinstance(slot_type, dict):
+                self._issue(path, f"{kind.lower()} slot needs a slotType")
+                return
+        if not isinstance(slot_type, dict):
+            return
+
+        strategy = slot_type.get("resolutionStrategy")
+        if strategy is not None and strategy not in RESOLUTION_STRATEGIES:
+            self._issue(
+                f"{path}.slotType.resolutionStrategy",
+                f"must be one of {', '.join(RESOLUTION_STRATEGIES)}",
+            )
+        if kind == "Extended" and not slot_type.get("parentSlotTypeSignature"):
+            self._issue(
+                f"{path}.slotType",
+                "extended slot needs a parentSlotTypeSignature",
+            )
+
+        values_file = slot_type.get("valuesFile")
+        if values_file is not None and kind != "Custom":
+            self._issue(
+                f"{path}.slotType.valuesFile", "only custom slot types take values"
+            )
+        elif isinstance(values_file, str) and self._check_values_file is not None:
+            # The catalog and inline values are checked together, deduplicated
+            for problem in self._check_values_file(slot_type, self.limits):
+                self._issue(f"{path}.slotType.valuesFile", problem)
+            return
+
+        values = _list(slot_type.get("slotTypeValues"))
+        total = 0
+        max_length = self.limits["slot_value_length"]
+        for index, value in enumerate(values):
+            if not isinstance(value, dict):
+                continue
+            synonyms = _list(value.get("synonyms"))
+            total += 1 + len(synonyms)
+            for text in (value.get("sampleValue"), *synonyms):
+                if isinstance(text, str) and len(text) > max_length:
+                    self._issue(
+                        f"{path}.slotType.slotTypeValues[{index}]",
+                        f"value '{text[:40]}...' is longer than {max_length} "
+                        f"characters",
+                    )
+        if total > self.limits["slot_type_values_per_slot_type"]:
+            self._issue(
+                f"{path}.slotType.slotTypeValues",
+                f"{total} values and synonyms, Lex allows "
+                f"{self.limits['slot_type_values_per_slot_type']} per slot type",
+            )
+
+    def _check_intent(
+        self,
+        intent: Dict[str, Any],
+        path: str,
+        slot_phrases: Set[str],
+        utterances: Dict[str, Tuple[int, str]],
+        intent_index: int,
+    ) -> None:
+        """Hooks, utterance limits, slot references and duplicate utterances"""
+        name = intent.get("name")
+        hooks = intent.get("codeHook") or []
+        for hook in [hooks] if isinstance(hooks, str) else _list(hooks):
+            if hook not in CODE_HOOKS:
+                self._issue(
+                    f"{path}.codeHook",
+                    f"unknown hook '{hook}', expected {' or '.join(CODE_HOOKS)}",
+                )
+
+        if len(slot_phrases) > self.limits["slots_per_intent"]:
+            self._issue(
+                path,
+                f"{len(slot_phrases)} slots, Lex allows "
+                f"{self.limits['slots_per_intent']} per intent",
+            )
+
+        samples = _list(intent.get("sampleUtterances"))
+        if len(samples) > self.limits["utterances_per_intent"]:
+            self._issue(
+                f"{path}.sampleUtterances",
+                f"{len(samples)} utterances, Lex allows "
+                f"{self.limits['utterances_per_intent']} per intent",
+            )
+
+        max_length = self.limits["utterance_length"]
+        seen: Set[str] = set()
+        for index, utterance in enumerate(samples):
+            if not isinstance(utterance, str):
+                continue
+            utterance_path = f"{path}.sampleUtterances[{index}]"
+            if len(utterance) > max_length:
+                self._issue(utterance_path, f"longer than {max_length} characters")
+            if "{" in utterance or "}" in utterance:
+                references = SLOT_REFERENCE_PATTERN.findall(utterance)
+                if utterance.count("{") != len(references) or utterance.count(
+                    "}"
+                ) != len(references):
+                    self._issue(utterance_path, f"unbalanced braces in '{utterance}'")
+                for reference in references:
+                    if reference not in slot_phrases:
+                        self._issue(
+                            utterance_path,
+                            f"{{{reference}}} does not match a slotPhraseName "
+                            f"of intent {name}",
+                        )
+
+            normalised = " ".join(utterance.lower().split())
+            owner = utterances.setdefault(normalised, (intent_index, name))
+            if owner != (intent_index, name) or normalised in seen:
+                where = "earlier" if owner[0] == intent_index else f"in {owner[1]}"
+                issue = ValidationIssue(
+                    utterance_path, f"duplicate of an utterance {where}: '{utterance}'"
+                )
+                if self.allow_duplicate_utterances:
+                    self.warnings.append(issue)
+                else:
+                    self.issues.append(issue)
+            seen.add(normalised)
+
+
+def _list(value: Any) -> list:
+    """A list field, or an empty list if it is missing or not a list"""
+    return value if isinstance(value, list) else []
+
+
+def _is_int(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def validate_bot_template(
+    bot: Dict[str, Any],
+    limits: Optional[Dict[str, int]] = None,
+    load_include: Optional[Callable[[str], Any]] = None,
+    check_values_file: Optional[Callable[..., List[str]]] = None,
+) -> List[ValidationIssue]:
+    """Validate the bot section of a parsed template; see TemplateValidator"""
+    return TemplateValidator(limits).validate(bot, load_include, check_values_file)
@@ -1,23 +1,283 @@
-import yaml
+import functools
+import hashlib
+import hmac
+import logging
+import os
+import pickle
+import secrets
+import time
 from pathlib import Path
-from types import SimpleNamespace
+from typing import Any, Optional
+
+import yaml
+
+from bot_engine.utils.config_model import BotConfig, ConfigModelException
+from bot_engine.utils.slot_value_catalog import values_file_problems
+from bot_engine.utils.utterance_expander import (
+    UtteranceGrammarException,
+    expand_template_utterances,
+)
+from bot_engine.utils.validators import (
+    TemplateValidationException,
+    TemplateValidator,
+)
+
+try:
+    # LibYAML bindings parse several times faster than the pure-Python loader
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+logger = logging.getLogger(__name__)
 
 # Get the path relative to this file's location
 bot_template_path = Path(__file__).parent.parent.parent / "bot_template.yaml"
 
+# Parsed templates, keyed by content hash, in the user's cache directory so
+# a checkout cannot supply its own entries
+CONFIG_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "lex-universal-bot"
+    / "config_cache"
+)
+# Bump when the cached representation changes
+CACHE_FORMAT = 3
+# Entries start with this header and an HMAC of the pickle, keyed by a
+# secret created in the cache directory; only authenticated pickles load
+CACHE_HEADER = f"lex-config-cache/{CACHE_FORMAT}\n".encode()
+CACHE_KEY_FILE = "key"
+# Entries unused for this long, beyond the most recent ones, are removed
+CACHE_MAX_ENTRIES = 64
+CACHE_MAX_AGE = 30 * 24 * 3600
+
+
+class BotConfigException(Exception):
+    """Exception for bot templates that cannot be loaded"""
+
+    pass
+
+
+def _cache_key(cache_dir: Path) -> bytes:
+    """
+    Return the secret that authenticates cache entries, creating it once.
+
+    Raises:
+        OSError: If the key can be neither read nor created
+    """
+    key_file = cache_dir / CACHE_KEY_FILE
+    try:
+        return key_file.read_bytes()
+    except FileNotFoundError:
+        pass
+    cache_dir.mkdir(parents=True, exist_ok=True, mode=0o700)
+    temp_file = key_file.with_suffix(f".{os.getpid()}.tmp")
+    fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(secrets.token_bytes(32))
+    try:
+        # Linking never replaces a key a concurrent run created first
+        os.link(temp_file, key_file)
+    except FileExistsError:
+        pass
+    finally:
+        temp_file.unlink()
+    return key_file.read_bytes()
+
+
+def _read_cache_entry(cache_file: Path, key: bytes) -> Any:
+    """
+    Load a cache entry written by _write_cache_entry.
+
+    Raises:
+        FileNotFoundError: If there is no entry
+        ValueError: If the entry is not authenticated by the key
+    """
+    entry = cache_file.read_bytes()
+    mac_end = len(CACHE_HEADER) + hashlib.sha256().digest_size
+    mac, payload = entry[len(CACHE_HEADER) : mac_end], entry[mac_end:]
+    expected = hmac.new(key, payload, hashlib.sha256).digest()
+    if not entry.startswith(CACHE_HEADER) or not hmac.compare_digest(mac, expected):
+        raise ValueError("not a signed config cache entry")
+    data = pickle.loads(payload)
+    # Refresh the modification time, which eviction treats as last use
+    os.utime(cache_file)
+    return data
+
+
+def _write_cache_entry(cache_file: Path, key: bytes, data: Any) -> None:
+    """Write a signed cache entry, then evict stale ones"""
+    payload = pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+    mac = hmac.new(key, payload, hashlib.sha256).digest()
+    # Write then rename, so concurrent runs never read a partial entry
+    temp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    temp_file.write_bytes(CACHE_HEADER + mac + payload)
+    os.replace(temp_file, cache_file)
+    _evict_cache_entries(cache_file.parent)
+
+
+def _evict_cache_entries(cache_dir: Path) -> None:
+    """
+    Remove entries of other cache formats, and entries beyond the
+    CACHE_MAX_ENTRIES most recently used that are older than CACHE_MAX_AGE.
+    """
+    current = []
+    for entry in cache_dir.glob("*.pickle"):
+        try:
+            if not entry.name.endswith(f".v{CACHE_FORMAT}.pickle"):
+                entry.unlink()
+            else:
+                current.append((entry.stat().st_mtime, entry))
+        except OSError:
+            # Removed or replaced by a concurrent run
+            continue
+    current.sort(reverse=True)
+    cutoff = time.time() - CACHE_MAX_AGE
+    for mtime, entry in current[CACHE_MAX_ENTRIES:]:
+        if mtime < cutoff:
+            entry.unlink(missing_ok=True)
+
+
+def load_template_data(
+    path: Path, cache_dir: Optional[Path] = CONFIG_CACHE_DIR
+) -> Any:
+    """
+    Parse a YAML template, reusing the cached result for identical content.
+
+    Sample utterance patterns are expanded as part of parsing (see
+    utterance_expander), so the cache holds plain utterances. The cache is
+    keyed by the SHA-256 of the file content, so an edited template is
+    parsed again and renames or copies hit the same entry. Entries are
+    pickles signed with a per-user key, and one that fails the check is
+    never unpickled. The cache is best effort: unreadable, unsigned or
+    unwritable entries only cost a parse.
+
+    Args:
+        path: Template file
+        cache_dir: Cache directory, or None to always parse
+
+    Returns:
+        The parsed YAML document
+
+    Raises:
+        BotConfigException: If the file is missing, is not valid YAML or
+            has malformed utterance patterns
+    """
+    path = Path(path)
+    try:
+        content = path.read_bytes()
+    except OSError as e:
+        raise BotConfigException(f"Cannot read bot template {path}: {e}") from e
+
+    cache_file = cache_key = None
+    if cache_dir is not None:
+        digest = hashlib.sha256(content).hexdigest()
+        cache_file = Path(cache_dir) / f"{digest}.v{CACHE_FORMAT}.pickle"
+        try:
+            cache_key = _cache_key(Path(cache_dir))
+        except OSError as e:
+            logger.debug(f"Config cache disabled, no key in {cache_dir}: {e}")
+    if cache_key is not None:
+        try:
+            return _read_cache_entry(cache_file, cache_key)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable config cache {cache_file}: {e}")
+
+    try:
+        data = expand_template_utterances(yaml.load(content, Loader=SafeLoader))
+    except (yaml.YAMLError, UtteranceGrammarException) as e:
+        raise BotConfigException(f"Invalid bot template {path}: {e}") from e
+
+    if cache_key is not None:
+        try:
+            _write_cache_entry(cache_file, cache_key, data)
+        except OSError as e:
+            logger.debug(f"Could not write config cache {cache_file}: {e}")
+    return data
+
+
+def load_bot_config(
+    path: Path = bot_template_path,
+    cache_dir: Optional[Path] = CONFIG_CACHE_DIR,
+    allow_duplicate_utterances: bool = False,
+) -> BotConfig:
+    """
+    Load the bot section of a bot template as a typed BotConfig.
+
+    The template is validated first, so every structural, cross-reference
+    and Lex quota problem is reported together before any API call.
+
+    A locale may move its intents and slotDefinitions to a separate YAML
+    file, named by an include path relative to the template:
+
+        locale:
+          - localeId: "fr_FR"
+            nluIntentConfidenceThreshold: 0.40
+            lambdaHooks: ...
+            voiceSettings: ...
+            include: "locales/fr_FR.yaml"
+
+    Included files are validated one at a time and then loaded only when
+    the locale is used, so memory depends on the largest locale rather
+    than the whole bot.
+
+    A custom slot type may likewise take its values from a CSV or JSONL
+    catalog named by a valuesFile path relative to the template:
+
+        slotType:
+          resolutionStrategy: "TopResolution"
+          valuesFile: "catalogs/products.csv"
+
+    The catalog is streamed and checked against the Lex limits here, and
+    read again when the slot type is deployed (see slot_value_catalog).
+
+    Args:
+        path: Template file (bot_template.yaml if not given)
+        cache_dir: Parsed-template cache directory, or None to always parse
+        allow_duplicate_utterances: Log duplicate utterances as warnings
+            instead of failing, to analyse a template that has them
 
-def to_ns(d):
-    if isinstance(d, dict):
-        return SimpleNamespace(**{k: to_ns(v) for k, v in d.items()})
-    elif isinstance(d, list):
-        return [to_ns(i) for i in d]
-    return d
+    Raises:
+        BotConfigException: If the template cannot be read or fails
+            validation; the message lists every problem found
+    """
+    data = load_template_data(path, cache_dir)
+    if not isinstance(data, dict) or not isinstance(data.get("bot"), dict):
+        raise BotConfigException(f"Bot template {path} has no 'bot' section")
 
+    def load_include(include: str) -> Any:
+        return load_template_data(Path(path).parent / include, cache_dir)
 
-with bot_template_path.open("r") as f:
-    data = yaml.safe_load(f)
+    validator = TemplateValidator(
+        allow_duplicate_utterances=allow_duplicate_utterances
+    )
+    try:
+        validator.check(
+            data["bot"],
+            load_include,
+            functools.partial(values_file_problems, template_dir=Path(path).parent),
+        )
+    except TemplateValidationException as e:
+        raise BotConfigException(f"Invalid bot template {path}: {e}") from e
+    for warning in validator.warnings:
+        logger.warning(f"{path}: {warning}")
+    try:
+        config = BotConfig.from_dict(data["bot"])
+    except ConfigModelException as e:
+        raise BotConfigException(f"Invalid bot template {path}: {e}") from e
 
-bot_config = to_ns(data["bot"])
+    config.set_template_dir(Path(path).parent)
+    for locale in config.locale:
+        if locale.include:
+            locale.set_source(functools.partial(load_include, locale.include))
+    return config
 
 
-# print(bot_config)
+def __getattr__(name: str):
+    # bot_config is loaded on first access rather than at import time
+    if name == "bot_config":
+        globals()["bot_config"] = load_bot_config()
+        return globals()["bot_config"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
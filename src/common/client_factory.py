@@ -0,0 +1,167 @@
+import logging
+import threading
+from typing import Dict, Optional, Tuple
+
+import boto3
+from botocore.config import Config
+
+
+logger = logging.getLogger(__name__)
+
+
+class ClientFactory:
+    """
+    Creates and caches boto3 clients on shared sessions.
+
+    Clients are thread-safe and hold their own connection pool, so one
+    client per (service, region, credentials) is reused for the whole
+    process instead of building a new one on every call. Each client also
+    tracks how many of its API calls are in flight, to show whether
+    max_pool_connections is large enough for the worker count.
+
+    Throttling is owned by RateLimiter, which slows the API family down and
+    retries the call itself. botocore therefore runs in standard retry mode,
+    without its own client-side rate limiter, and makes a single retry so
+    connection errors and 5xx responses are absorbed without stacking on
+    RateLimiter's throttle retries.
+    """
+
+    # Plan nodes and status polls call the API at the same time; the pool
+    # holds a connection for each so neither waits for one
+    PLAN_WORKERS = 16
+    POLL_WORKERS = 8
+    MAX_POOL_CONNECTIONS = PLAN_WORKERS + POLL_WORKERS
+    MAX_RETRY_ATTEMPTS = 2
+    CONNECT_TIMEOUT = 5
+    READ_TIMEOUT = 60
+
+    def __init__(self):
+        self._sessions: Dict[Optional[str], boto3.session.Session] = {}
+        self._clients: Dict[Tuple, object] = {}
+        self._pool_stats: Dict[Tuple, Dict[str, int]] = {}
+        self._overrides: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def config(self, max_pool_connections: Optional[int] = None) -> Config:
+        """Tuned botocore client configuration"""
+        return Config(
+            max_pool_connections=max_pool_connections or self.MAX_POOL_CONNECTIONS,
+            retries={"max_attempts": self.MAX_RETRY_ATTEMPTS, "mode": "standard"},
+            connect_timeout=self.CONNECT_TIMEOUT,
+            read_timeout=self.READ_TIMEOUT,
+        )
+
+    def _session(self, profile_name: Optional[str]) -> boto3.session.Session:
+        """Return the shared session for a profile, creating it once"""
+        if profile_name not in self._sessions:
+            self._sessions[profile_name] = boto3.session.Session(
+                profile_name=profile_name
+            )
+        return self._sessions[profile_name]
+
+    def client(
+        self,
+        service_name: str,
+        region_name: Optional[str] = None,
+        profile_name: Optional[str] = None,
+        max_pool_connections: Optional[int] = None,
+    ):
+        """
+        Return the cached client for a service, region and credentials.
+
+        Args:
+            service_name: AWS service name, e.g. "lexv2-models"
+            region_name: AWS region (session default if not given)
+            profile_name: Optional named profile for the credentials
+            max_pool_connections: Optional override of the pool size
+
+        Returns:
+            boto3 client
+        """
+        with self._lock:
+            if service_name in self._overrides:
+                return self._overrides[service_name]
+
+            session = self._session(profile_name)
+            credentials = session.get_credentials()
+            access_key = credentials.access_key if credentials else None
+            key = (service_name, region_name, profile_name, access_key)
+
+            client = self._clients.get(key)
+            if client is None:
+                pool_size = max_pool_connections or self.MAX_POOL_CONNECTIONS
+                logger.debug(
+                    f"Creating {service_name} client for region {region_name} "
+                    f"with {pool_size} pooled connections"
+                )
+                client = session.client(
+                    service_name,
+                    region_name=region_name,
+                    config=self.config(pool_size),
+                )
+                self._track_pool(client, key, pool_size)
+                self._clients[key] = client
+            return client
+
+    def override(self, service_name: str, client: Optional[object]) -> None:
+        """
+        Return the given client for a service in every region from now on.
+
+        Used to run against in-process fakes; pass None to remove the
+        override.
+        """
+        with self._lock:
+            if client is None:
+                self._overrides.pop(service_name, None)
+            else:
+                self._overrides[service_name] = client
+
+    def _track_pool(self, client, key: Tuple, pool_size: int) -> None:
+        """Count in-flight calls of a client through botocore events"""
+        stats = {"pool_size": pool_size, "in_flight": 0, "peak": 0, "saturated": 0}
+        self._pool_stats[key] = stats
+        stats_lock = threading.Lock()
+
+        def before_call(**kwargs) -> None:
+            with stats_lock:
+                stats["in_flight"] += 1
+                stats["peak"] = max(stats["peak"], stats["in_flight"])
+                if stats["in_flight"] > pool_size:
+                    stats["saturated"] += 1
+
+        def after_call(**kwargs) -> None:
+            with stats_lock:
+                stats["in_flight"] -= 1
+
+        client.meta.events.register("before-call", before_call)
+        client.meta.events.register("after-call", after_call)
+        client.meta.events.register("after-call-error", after_call)
+
+    def pool_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Return connection pool usage per client.
+
+        "peak" is the most calls in flight at once; "saturated" counts calls
+        that started while every pooled connection was already in use.
+        """
+        with self._lock:
+            return {
+                f"{service}/{region or 'default'}": dict(stats)
+                for (service, region, _, _), stats in self._pool_stats.items()
+            }
+
+    def log_pool_stats(self) -> None:
+        """Log connection pool usage, warning when a pool was too small"""
+        for client_name, stats in self.pool_stats().items():
+            message = (
+                f"{client_name}: peak {stats['peak']}/{stats['pool_size']} "
+                f"connections, {stats['saturated']} calls waited for a connection"
+            )
+            if stats["saturated"]:
+                logger.warning(f"{message}; consider raising max_pool_connections")
+            else:
+                logger.info(message)
+
+
+# Process-wide factory shared by every client helper
+CLIENT_FACTORY = ClientFactory()
@@ -0,0 +1,625 @@
+import itertools
+import logging
+import threading
+import time
+from collections import Counter, deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from botocore.exceptions import ClientError
+
+from common.client_factory import CLIENT_FACTORY
+from common.rate_limiter import api_family
+
+
+logger = logging.getLogger(__name__)
+
+
+class FakeLexModelsClient:
+    """
+    In-process stand-in for the boto3 "lexv2-models" client.
+
+    Models the resources the provisioning code creates (bots, locales, slot
+    types, intents, slots, versions and aliases) and the behaviour that
+    makes real deployments slow or flaky:
+
+    - eventual consistency: a created or updated resource is only returned
+      by describe_* after visibility_delay seconds; until then describe_*
+      returns the previous definition or ResourceNotFoundException
+    - status transitions: bots and locales are Creating for
+      create_seconds, builds run for build_seconds plus
+      build_seconds_per_intent per intent, versions are Versioning for
+      version_seconds
+    - service-side throttling: calls beyond throttle_rate per second per
+      API family fail with ThrottlingException
+    - failure injection: inject_failure() and fail_build()
+
+    Errors are raised as botocore ClientErrors, so callers see the same
+    error codes as against the real service.
+    """
+
+    PAGE_SIZE = 10
+    BUILT_IN_INTENTS = ("AMAZON.FallbackIntent",)
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        visibility_delay: float = 0.0,
+        create_seconds: float = 0.0,
+        build_seconds: float = 1.0,
+        build_seconds_per_intent: float = 0.0,
+        version_seconds: float = 0.5,
+        throttle_rate: Optional[float] = None,
+    ):
+        """
+        Args:
+            latency: Seconds added to every call
+            visibility_delay: Seconds before a write is visible to describe_*
+            create_seconds: Seconds a new bot or locale stays in Creating
+            build_seconds: Base duration of a locale build
+            build_seconds_per_intent: Extra build time per intent in the locale
+            version_seconds: Seconds a new version stays in Versioning
+            throttle_rate: Calls per second per API family before
+                ThrottlingException, or None for no service-side limit
+        """
+        self.latency = latency
+        self.visibility_delay = visibility_delay
+        self.create_seconds = create_seconds
+        self.build_seconds = build_seconds
+        self.build_seconds_per_intent = build_seconds_per_intent
+        self.version_seconds = version_seconds
+        self.throttle_rate = throttle_rate
+
+        self.calls: Counter = Counter()
+        self.throttled: Counter = Counter()
+        self._lock = threading.RLock()
+        self._ids = itertools.count(1)
+        # kind -> resource ID -> [(visible_at, definition)], newest last
+        self._resources: Dict[str, Dict[Any, List[Tuple[float, Dict]]]] = {}
+        self._builds: Dict[Tuple[str, str], Tuple[float, Optional[List[str]]]] = {}
+        self._build_failures: Dict[str, List[str]] = {}
+        self._failures: Dict[str, Deque[str]] = {}
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+
+    # -------------------------------------------------------------------
+    # Test controls
+    # -------------------------------------------------------------------
+
+    def inject_failure(
+        self,
+        operation_name: str,
+        error_code: str = "InternalServerException",
+        times: int = 1,
+    ) -> None:
+        """Make the next `times` calls of an operation fail with error_code"""
+        with self._lock:
+            self._failures.setdefault(operation_name, deque()).extend(
+                [error_code] * times
+            )
+
+    def fail_build(self, locale_id: str, reasons: Optional[List[str]] = None) -> None:
+        """Make every later build of a locale end in the Failed status"""
+        with self._lock:
+            self._build_failures[locale_id] = reasons or [
+                f"Injected build failure for {locale_id}"
+            ]
+
+    def total_calls(self) -> int:
+        """Number of API calls made, including failed ones"""
+        return sum(self.calls.values())
+
+    # -------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------
+
+    def _next_id(self, prefix: str) -> str:
+        return f"{prefix}{next(self._ids):08d}"
+
+    @staticmethod
+    def _error(code: str, operation_name: str, message: str = "") -> ClientError:
+        return ClientError(
+            {"Error": {"Code": code, "Message": message or code}}, operation_name
+        )
+
+    def _begin(self, operation_name: str) -> None:
+        """Count, delay, throttle and fail a call as configured"""
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            self.calls[operation_name] += 1
+            if self.throttle_rate is not None:
+                family = api_family(operation_name)
+                now = time.monotonic()
+                rate = self.throttle_rate
+                tokens, updated = self._buckets.get(family, (rate, now))
+                tokens = min(rate, tokens + (now - updated) * rate)
+                if tokens < 1:
+                    self._buckets[family] = (tokens, now)
+                    self.throttled[operation_name] += 1
+                    raise self._error(
+                        "ThrottlingException", operation_name, "Rate exceeded"
+                    )
+                self._buckets[family] = (tokens - 1, now)
+
+            failures = self._failures.get(operation_name)
+            if failures:
+                raise self._error(
+                    failures.popleft(), operation_name, "Injected failure"
+                )
+
+    def _put(self, kind: str, key: Any, definition: Dict) -> Dict:
+        """Store a new definition that becomes visible after visibility_delay"""
+        visible_at = time.monotonic() + self.visibility_delay
+        history = self._resources.setdefault(kind, {}).setdefault(key, [])
+        history.append((visible_at, definition))
+        del history[:-2]
+        return definition
+
+    def _latest(self, kind: str, key: Any, operation_name: str) -> Dict:
+        """Newest definition regardless of visibility, for writes"""
+        history = self._resources.get(kind, {}).get(key)
+        if not history:
+            raise self._error(
+                "ResourceNotFoundException", operation_name, f"{kind} {key} not found"
+            )
+        return history[-1][1]
+
+    def _visible(self, kind: str, key: Any, operation_name: str) -> Dict:
+        """Newest definition visible to reads"""
+        now = time.monotonic()
+        for visible_at, definition in reversed(
+            self._resources.get(kind, {}).get(key, [])
+        ):
+            if visible_at <= now:
+                return dict(definition)
+        raise self._error(
+            "ResourceNotFoundException", operation_name, f"{kind} {key} not found"
+        )
+
+    def _visible_all(self, kind: str) -> List[Dict]:
+        now = time.monotonic()
+        definitions = []
+        for history in list(self._resources.get(kind, {}).values()):
+            visible = [definition for at, definition in history if at <= now]
+            if visible:
+                definitions.append(visible[-1])
+        return definitions
+
+    def _delete(self, kind: str, key: Any, operation_name: str) -> None:
+        self._latest(kind, key, operation_name)
+        del self._resources[kind][key]
+
+    def _page(self, items: List[Dict], result_key: str, kwargs: Dict) -> Dict:
+        """Paginate a list_* result the way Lex does, with nextToken"""
+        size = kwargs.get("maxResults", self.PAGE_SIZE)
+        start = int(kwargs.get("nextToken") or 0)
+        response = {result_key: items[start : start + size]}
+        if start + size < len(items):
+            response["nextToken"] = str(start + size)
+        return response
+
+    def _invalidate_build(self, bot_id: str, locale_id: str) -> None:
+        """A DRAFT change leaves the locale NotBuilt until the next build"""
+        self._builds.pop((bot_id, locale_id), None)
+
+    @staticmethod
+    def _now() -> datetime:
+        return datetime.now(timezone.utc)
+
+    @staticmethod
+    def _locale_key(kwargs: Dict) -> Tuple[str, str]:
+        return kwargs["botId"], kwargs["localeId"]
+
+    # -------------------------------------------------------------------
+    # Bots
+    # -------------------------------------------------------------------
+
+    def create_bot(self, **kwargs) -> Dict:
+        self._begin("create_bot")
+        with self._lock:
+            for bot in self._visible_all("bot"):
+                if bot["botName"] == kwargs["botName"]:
+                    raise self._error(
+                        "ConflictException", "create_bot", "Bot name already exists"
+                    )
+            bot_id = self._next_id("B")
+            self._put(
+                "bot",
+                bot_id,
+                dict(
+                    kwargs,
+                    botId=bot_id,
+                    creationDateTime=self._now(),
+                    ready_at=time.monotonic() + self.create_seconds,
+                ),
+            )
+            return {
+                "botId": bot_id,
+                "botName": kwargs["botName"],
+                "botStatus": "Creating",
+            }
+
+    def describe_bot(self, **kwargs) -> Dict:
+        self._begin("describe_bot")
+        with self._lock:
+            bot = self._visible("bot", kwargs["botId"], "describe_bot")
+            ready = time.monotonic() >= bot.pop("ready_at")
+            bot["botStatus"] = "Available" if ready else "Creating"
+            return bot
+
+    def update_bot(self, **kwargs) -> Dict:
+        self._begin("update_bot")
+        with self._lock:
+            bot = self._latest("bot", kwargs["botId"], "update_bot")
+            self._put("bot", kwargs["botId"], dict(bot, **kwargs))
+            return {"botId": kwargs["botId"], "botStatus": "Available"}
+
+    def list_bots(self, **kwargs) -> Dict:
+        self._begin("list_bots")
+        with self._lock:
+            names = set()
+            for bot_filter in kwargs.get("filters", []):
+                if bot_filter.get("name") == "BotName":
+                    names.update(bot_filter.get("values", []))
+            summaries = [
+                {"botId": bot["botId"], "botName": bot["botName"]}
+                for bot in self._visible_all("bot")
+                if not names or bot["botName"] in names
+            ]
+            return self._page(summaries, "botSummaries", kwargs)
+
+    # -------------------------------------------------------------------
+    # Locales and builds
+    # -------------------------------------------------------------------
+
+    def create_bot_locale(self, **kwargs) -> Dict:
+        self._begin("create_bot_locale")
+        with self._lock:
+            self._latest("bot", kwargs["botId"], "create_bot_locale")
+            key = self._locale_key(kwargs)
+            if key in self._resources.get("locale", {}):
+                raise self._error(
+                    "ConflictException", "create_bot_locale", "Locale already exists"
+                )
+            self._put(
+                "locale",
+                key,
+                dict(kwargs, ready_at=time.monotonic() + self.create_seconds),
+            )
+            return {
+                "botId": kwargs["botId"],
+                "botVersion": "DRAFT",
+                "localeId": kwargs["localeId"],
+                "botLocaleStatus": "Creating",
+            }
+
+    def update_bot_locale(self, **kwargs) -> Dict:
+        self._begin("update_bot_locale")
+        with self._lock:
+            key = self._locale_key(kwargs)
+            locale = self._latest("locale", key, "update_bot_locale")
+            self._put("locale", key, dict(locale, **kwargs))
+            self._invalidate_build(*key)
+            return {"localeId": kwargs["localeId"], "botLocaleStatus": "NotBuilt"}
+
+    def describe_bot_locale(self, **kwargs) -> Dict:
+        self._begin("describe_bot_locale")
+        with self._lock:
+            key = self._locale_key(kwargs)
+            locale = self._visible("locale", key, "describe_bot_locale")
+            now = time.monotonic()
+            build = self._builds.get(key)
+            if now < locale.pop("ready_at"):
+                locale["botLocaleStatus"] = "Creating"
+            elif build is None:
+                locale["botLocaleStatus"] = "NotBuilt"
+            elif now < build[0]:
+                locale["botLocaleStatus"] = "Building"
+            elif build[1]:
+                locale["botLocaleStatus"] = "Failed"
+                locale["failureReasons"] = build[1]
+            else:
+                locale["botLocaleStatus"] = "Built"
+            return locale
+
+    def list_bot_locales(self, **kwargs) -> Dict:
+        self._begin("list_bot_locales")
+        with self._lock:
+            summaries = [
+                {"localeId": locale["localeId"]}
+                for locale in self._visible_all("locale")
+                if locale["botId"] == kwargs["botId"]
+            ]
+            return self._page(summaries, "botLocaleSummaries", kwargs)
+
+    def build_bot_locale(self, **kwargs) -> Dict:
+        self._begin("build_bot_locale")
+        with self._lock:
+            key = self._locale_key(kwargs)
+            locale = self._latest("locale", key, "build_bot_locale")
+            if time.monotonic() < locale["ready_at"]:
+                raise self._error(
+                    "PreconditionFailedException",
+                    "build_bot_locale",
+                    "Locale is still being created",
+                )
+            intents = sum(
+                1
+                for intent in self._resources.get("intent", {}).values()
+                if self._locale_key(intent[-1][1]) == key
+            )
+            duration = self.build_seconds + self.build_seconds_per_intent * intents
+            self._builds[key] = (
+                time.monotonic() + duration,
+                self._build_failures.get(kwargs["localeId"]),
+            )
+            return {"localeId": kwargs["localeId"], "botLocaleStatus": "Building"}
+
+    # -------------------------------------------------------------------
+    # Slot types, intents and slots
+    # -------------------------------------------------------------------
+
+    def _create_child(
+        self, kind: str, prefix: str, operation_name: str, kwargs: Dict
+    ) -> Dict:
+        self._latest("locale", self._locale_key(kwargs), operation_name)
+        resource_id = self._next_id(prefix)
+        definition = dict(
+            kwargs, **{f"{kind}Id": resource_id, "lastUpdatedDateTime": self._now()}
+        )
+        self._put(kind, resource_id, definition)
+        self._invalidate_build(*self._locale_key(kwargs))
+        return definition
+
+    def _update_child(self, kind: str, operation_name: str, kwargs: Dict) -> Dict:
+        resource_id = kwargs[f"{kind}Id"]
+        self._latest(kind, resource_id, operation_name)
+        definition = dict(kwargs, lastUpdatedDateTime=self._now())
+        self._put(kind, resource_id, definition)
+        self._invalidate_build(*self._locale_key(kwargs))
+        return definition
+
+    def _list_children(self, kind: str, name_key: str, kwargs: Dict) -> List[Dict]:
+        return [
+            {f"{kind}Id": definition[f"{kind}Id"], name_key: definition[name_key]}
+            for definition in self._visible_all(kind)
+            if self._locale_key(definition) == self._locale_key(kwargs)
+            and kwargs.get("intentId") in (None, definition.get("intentId"))
+        ]
+
+    def create_slot_type(self, **kwargs) -> Dict:
+        self._begin("create_slot_type")
+        with self._lock:
+            slot_type = self._create_child("slotType", "ST", "create_slot_type", kwargs)
+            return {"slotTypeId": slot_type["slotTypeId"]}
+
+    def update_slot_type(self, **kwargs) -> Dict:
+        self._begin("update_slot_type")
+        with self._lock:
+            self._update_child("slotType", "update_slot_type", kwargs)
+            return {"slotTypeId": kwargs["slotTypeId"]}
+
+    def describe_slot_type(self, **kwargs) -> Dict:
+        self._begin("describe_slot_type")
+        with self._lock:
+            return self._visible(
+                "slotType", kwargs["slotTypeId"], "describe_slot_type"
+            )
+
+    def delete_slot_type(self, **kwargs) -> Dict:
+        self._begin("delete_slot_type")
+        with self._lock:
+            self._delete("slotType", kwargs["slotTypeId"], "delete_slot_type")
+            self._invalidate_build(*self._locale_key(kwargs))
+            return {}
+
+    def list_slot_types(self, **kwargs) -> Dict:
+        self._begin("list_slot_types")
+        with self._lock:
+            summaries = self._list_children("slotType", "slotTypeName", kwargs)
+            return self._page(summaries, "slotTypeSummaries", kwargs)
+
+    def create_intent(self, **kwargs) -> Dict:
+        self._begin("create_intent")
+        with self._lock:
+            intent = self._create_child("intent", "IN", "create_intent", kwargs)
+            return {
+                "intentId": intent["intentId"],
+                "lastUpdatedDateTime": intent["lastUpdatedDateTime"],
+            }
+
+    def update_intent(self, **kwargs) -> Dict:
+        self._begin("update_intent")
+        with self._lock:
+            intent = self._update_child("intent", "update_intent", kwargs)
+            return {
+                "intentId": intent["intentId"],
+                "lastUpdatedDateTime": intent["lastUpdatedDateTime"],
+            }
+
+    def describe_intent(self, **kwargs) -> Dict:
+        self._begin("describe_intent")
+        with self._lock:
+            return self._visible("intent", kwargs["intentId"], "describe_intent")
+
+    def delete_intent(self, **kwargs) -> Dict:
+        self._begin("delete_intent")
+        with self._lock:
+            self._delete("intent", kwargs["intentId"], "delete_intent")
+            self._invalidate_build(*self._locale_key(kwargs))
+            return {}
+
+    def list_intents(self, **kwargs) -> Dict:
+        self._begin("list_intents")
+        with self._lock:
+            summaries = self._list_children("intent", "intentName", kwargs)
+            summaries += [
+                {
+                    "intentId": signature.split(".")[-1].upper(),
+                    "intentName": signature.split(".")[-1],
+                    "parentIntentSignature": signature,
+                }
+                for signature in self.BUILT_IN_INTENTS
+            ]
+            return self._page(summaries, "intentSummaries", kwargs)
+
+    def create_slot(self, **kwargs) -> Dict:
+        self._begin("create_slot")
+        with self._lock:
+            self._latest("intent", kwargs["intentId"], "create_slot")
+            slot = self._create_child("slot", "SL", "create_slot", kwargs)
+            return {"slotId": slot["slotId"]}
+
+    def update_slot(self, **kwargs) -> Dict:
+        self._begin("update_slot")
+        with self._lock:
+            self._update_child("slot", "update_slot", kwargs)
+            return {"slotId": kwargs["slotId"]}
+
+    def describe_slot(self, **kwargs) -> Dict:
+        self._begin("describe_slot")
+        with self._lock:
+            return self._visible("slot", kwargs["slotId"], "describe_slot")
+
+    def delete_slot(self, **kwargs) -> Dict:
+        self._begin("delete_slot")
+        with self._lock:
+            self._delete("slot", kwargs["slotId"], "delete_slot")
+            self._invalidate_build(*self._locale_key(kwargs))
+            return {}
+
+    def list_slots(self, **kwargs) -> Dict:
+        self._begin("list_slots")
+        with self._lock:
+            summaries = self._list_children("slot", "slotName", kwargs)
+            return self._page(summaries, "slotSummaries", kwargs)
+
+    # -------------------------------------------------------------------
+    # Versions and aliases
+    # -------------------------------------------------------------------
+
+    def create_bot_version(self, **kwargs) -> Dict:
+        self._begin("create_bot_version")
+        with self._lock:
+            bot_id = kwargs["botId"]
+            self._latest("bot", bot_id, "create_bot_version")
+            for locale_id in kwargs.get("botVersionLocaleSpecification", {}):
+                build = self._builds.get((bot_id, locale_id))
+                if build is None or time.monotonic() < build[0] or build[1]:
+                    raise self._error(
+                        "PreconditionFailedException",
+                        "create_bot_version",
+                        f"Locale {locale_id} is not built",
+                    )
+            versions = [
+                key for key in self._resources.get("version", {}) if key[0] == bot_id
+            ]
+            bot_version = str(len(versions) + 1)
+            self._put(
+                "version",
+                (bot_id, bot_version),
+                {
+                    "botId": bot_id,
+                    "botVersion": bot_version,
+                    "ready_at": time.monotonic() + self.version_seconds,
+                },
+            )
+            return {
+                "botId": bot_id,
+                "botVersion": bot_version,
+                "botStatus": "Versioning",
+            }
+
+    def describe_bot_version(self, **kwargs) -> Dict:
+        self._begin("describe_bot_version")
+        with self._lock:
+            version = self._visible(
+                "version",
+                (kwargs["botId"], kwargs["botVersion"]),
+                "describe_bot_version",
+            )
+            ready = time.monotonic() >= version.pop("ready_at")
+            version["botStatus"] = "Available" if ready else "Versioning"
+            return version
+
+    def create_bot_alias(self, **kwargs) -> Dict:
+        self._begin("create_bot_alias")
+        with self._lock:
+            self._latest("bot", kwargs["botId"], "create_bot_alias")
+            alias_id = self._next_id("A")
+            self._put("alias", alias_id, dict(kwargs, botAliasId=alias_id))
+            return {"botAliasId": alias_id, "botAliasStatus": "Creating"}
+
+    def update_bot_alias(self, **kwargs) -> Dict:
+        self._begin("update_bot_alias")
+        with self._lock:
+            alias = self._latest("alias", kwargs["botAliasId"], "update_bot_alias")
+            self._put("alias", kwargs["botAliasId"], dict(alias, **kwargs))
+            return {"botAliasId": kwargs["botAliasId"], "botAliasStatus": "Available"}
+
+    def describe_bot_alias(self, **kwargs) -> Dict:
+        self._begin("describe_bot_alias")
+        with self._lock:
+            alias = self._visible("alias", kwargs["botAliasId"], "describe_bot_alias")
+            alias["botAliasStatus"] = "Available"
+            return alias
+
+    def list_bot_aliases(self, **kwargs) -> Dict:
+        self._begin("list_bot_aliases")
+        with self._lock:
+            summaries = [
+                {
+                    "botAliasId": alias["botAliasId"],
+                    "botAliasName": alias["botAliasName"],
+                }
+                for alias in self._visible_all("alias")
+                if alias["botId"] == kwargs["botId"]
+            ]
+            return self._page(summaries, "botAliasSummaries", kwargs)
+
+
+class FakeIamClient:
+    """In-process stand-in for the boto3 "iam" client"""
+
+    def __init__(self, account_id: str = "123456789012"):
+        self.account_id = account_id
+        self.calls: Counter = Counter()
+
+    def create_service_linked_role(self, **kwargs) -> Dict:
+        self.calls["create_service_linked_role"] += 1
+        service = kwargs["AWSServiceName"]
+        role_name = f"AWSServiceRoleFor{service.split('.')[0].capitalize()}Bots"
+        return {
+            "Role": {
+                "RoleName": role_name,
+                "Arn": (
+                    f"arn:aws:iam::{self.account_id}:role/aws-service-role/"
+                    f"{service}/{role_name}"
+                ),
+            }
+        }
+
+
+def install_fake_clients(
+    lex: Optional[FakeLexModelsClient] = None,
+    iam: Optional[FakeIamClient] = None,
+) -> FakeLexModelsClient:
+    """
+    Make every lexv2-models and iam client of this process a fake.
+
+    BotContext and iam_client() get their clients from CLIENT_FACTORY,
+    so after this call the orchestrators run entirely in-process, through
+    the usual rate limiting and tracing.
+
+    Args:
+        lex: Fake Lex client to install (a default one if not given)
+        iam: Fake IAM client to install (a default one if not given)
+
+    Returns:
+        The installed fake Lex client
+    """
+    lex = lex or FakeLexModelsClient()
+    CLIENT_FACTORY.override("lexv2-models", lex)
+    CLIENT_FACTORY.override("iam", iam or FakeIamClient())
+    logger.info("Using in-process fake Lex and IAM clients")
+    return lex
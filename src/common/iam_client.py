@@ -1,11 +1,10 @@
-import boto3
+from common.client_factory import CLIENT_FACTORY
+from common.rate_limiter import RateLimitedClient
 
 
 def iam_client():
     """
-    arg:
-        region_name: AWS region name (default:us-east-1 )
     Return:
-         amazon iam client
+         cached amazon iam client, rate limited and traced like the Lex client
     """
-    return boto3.client("iam")
+    return RateLimitedClient(CLIENT_FACTORY.client("iam"))
@@ -1,4 +1,4 @@
-import boto3
+from common.client_factory import CLIENT_FACTORY
 
 
 def lex_v2_client(region_name: str = "us-east-1"):
@@ -6,9 +6,9 @@ def lex_v2_client(region_name: str = "us-east-1"):
     arg:
         region_name: AWS region name (default:us-east-1 )
     Return:
-         amazon lex V2 client
+         cached amazon lex V2 client
     """
-    return boto3.client("lexv2-models", region_name=region_name)
+    return CLIENT_FACTORY.client("lexv2-models", region_name)
 
 
 # region = "us-east-1"  # use the region where your bot exists
@@ -0,0 +1,343 @@
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from botocore.exceptions import ConnectionError as EndpointError, HTTPClientError
+
+from common.telemetry import TRACER
+
+
+logger = logging.getLogger(__name__)
+
+
+THROTTLE_ERROR_CODES = (
+    "ThrottlingException",
+    "TooManyRequestsException",
+    "Throttling",
+)
+
+# Errors after which the same call may succeed if it is simply made again
+TRANSIENT_ERROR_CODES = THROTTLE_ERROR_CODES + (
+    "InternalServerException",
+    "ServiceUnavailableException",
+    "PreconditionFailedException",
+)
+
+
+def is_transient_error(error: Optional[BaseException]) -> bool:
+    """
+    Whether an error, or an error it was raised from, is worth retrying.
+
+    Throttling, 5xx responses, PreconditionFailedException (a resource
+    still being modified) and connection failures are transient. Validation
+    errors, conflicts and missing resources are not, and neither are
+    waiter timeouts: retrying those repeats a call that cannot succeed.
+
+    Args:
+        error: Exception, possibly wrapping a botocore error as its __cause__
+    """
+    while error is not None:
+        if isinstance(error, (EndpointError, HTTPClientError)):
+            return True
+        response = getattr(error, "response", None) or {}
+        if response.get("Error", {}).get("Code") in TRANSIENT_ERROR_CODES:
+            return True
+        status = response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+        if isinstance(status, int) and status >= 500:
+            return True
+        error = error.__cause__
+    return False
+
+
+def api_family(operation_name: str) -> str:
+    """
+    Group a client operation into a rate-limited API family.
+
+    Args:
+        operation_name: Client method name, e.g. "describe_intent"
+
+    Returns:
+        One of "read", "write", "build" or "other"
+    """
+    if operation_name.startswith(("describe_", "list_", "get_")):
+        return "read"
+    if operation_name.startswith(("build_", "start_")) or operation_name in (
+        "create_bot_version",
+        "create_upload_url",
+    ):
+        return "build"
+    if operation_name.startswith(("create_", "update_", "delete_")):
+        return "write"
+    return "other"
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket whose rate adapts with AIMD.
+
+    Each success raises the rate additively (about ADDITIVE_INCREASE
+    calls/second per second of sustained traffic); each throttle halves it,
+    at most once per DECREASE_COOLDOWN so a burst of concurrent throttles
+    counts as one congestion signal.
+    """
+
+    ADDITIVE_INCREASE = 0.5
+    MULTIPLICATIVE_DECREASE = 0.5
+    DECREASE_COOLDOWN = 1.0
+
+    def __init__(self, rate: float, burst: float, min_rate: float, max_rate: float):
+        """
+        Args:
+            rate: Initial calls per second
+            burst: Maximum tokens that can accumulate while idle
+            min_rate: Lower bound for the adapted rate
+            max_rate: Upper bound for the adapted rate
+        """
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.calls = 0
+        self.throttles = 0
+        self.wait_seconds = 0.0
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._last_decrease = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take one token without waiting for it.
+
+        Tokens are reserved under the lock and the caller waits outside it,
+        so concurrent callers queue up at the current rate.
+
+        Returns:
+            Seconds the caller must wait before making its call
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            self.calls += 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            self.wait_seconds += delay
+        return delay
+
+    def acquire(self) -> float:
+        """
+        Take one token, sleeping until it is available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def on_success(self) -> None:
+        """Additive increase after a call that was not throttled"""
+        with self._lock:
+            increase = self.ADDITIVE_INCREASE / self.rate
+            self.rate = min(self.max_rate, self.rate + increase)
+
+    def on_throttle(self) -> None:
+        """Multiplicative decrease after a throttled call"""
+        with self._lock:
+            self.throttles += 1
+            now = time.monotonic()
+            if now - self._last_decrease < self.DECREASE_COOLDOWN:
+                return
+            self._last_decrease = now
+            self.rate = max(self.min_rate, self.rate * self.MULTIPLICATIVE_DECREASE)
+            self._tokens = min(self._tokens, 0.0)
+            logger.warning(f"Throttled, reducing rate to {self.rate:.2f} calls/s")
+
+
+class RateLimiter:
+    """Client-side rate limits for each API family, shared across threads"""
+
+    # family: (initial rate, burst, min rate, max rate) in calls per second
+    DEFAULT_LIMITS: Dict[str, tuple] = {
+        "read": (10.0, 10.0, 0.5, 50.0),
+        "write": (5.0, 5.0, 0.2, 20.0),
+        "build": (1.0, 2.0, 0.1, 5.0),
+        "other": (5.0, 5.0, 0.2, 20.0),
+    }
+    MAX_THROTTLE_RETRIES = 4
+
+    def __init__(self, limits: Optional[Dict[str, tuple]] = None):
+        self.limits = limits or self.DEFAULT_LIMITS
+        self.reset()
+
+    def reset(self, limits: Optional[Dict[str, tuple]] = None) -> None:
+        """Restore the initial rates, or switch to new limits, and clear counters"""
+        if limits is not None:
+            self.limits = limits
+        self.buckets: Dict[str, TokenBucket] = {
+            family: TokenBucket(*settings) for family, settings in self.limits.items()
+        }
+
+    def call(self, operation_name: str, func: Callable[..., Any], **kwargs) -> Any:
+        """
+        Call an API operation within its family's rate limit.
+
+        Throttled calls are retried through the (now slower) bucket up to
+        MAX_THROTTLE_RETRIES times before the error is raised.
+
+        Args:
+            operation_name: Client method name
+            func: Bound client method
+            **kwargs: API parameters
+
+        Returns:
+            API response
+        """
+        bucket = self.buckets[api_family(operation_name)]
+        for attempt in range(self.MAX_THROTTLE_RETRIES + 1):
+            start = self._waited(operation_name, bucket.acquire())
+            try:
+                response = func(**kwargs)
+            except Exception as e:
+                self._failed(operation_name, bucket, start, e, attempt)
+                continue
+            self._succeeded(operation_name, bucket, start)
+            return response
+
+    async def call_async(
+        self, operation_name: str, func: Callable[..., Awaitable[Any]], **kwargs
+    ) -> Any:
+        """
+        Await an API operation within its family's rate limit, like call.
+
+        The wait for a token is an asyncio sleep, so coroutines queued on
+        one bucket do not block their event loop.
+
+        Args:
+            operation_name: Client method name
+            func: Bound coroutine client method, e.g. of an aiobotocore client
+            **kwargs: API parameters
+
+        Returns:
+            API response
+        """
+        bucket = self.buckets[api_family(operation_name)]
+        for attempt in range(self.MAX_THROTTLE_RETRIES + 1):
+            delay = bucket.reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            start = self._waited(operation_name, delay)
+            try:
+                response = await func(**kwargs)
+            except Exception as e:
+                self._failed(operation_name, bucket, start, e, attempt)
+                continue
+            self._succeeded(operation_name, bucket, start)
+            return response
+
+    @staticmethod
+    def _waited(operation_name: str, delay: float) -> float:
+        """Record the wait for a token and return the call's start time"""
+        start = time.monotonic()
+        if delay:
+            family = api_family(operation_name)
+            TRACER.record(f"rate limit {family}", "sleep", start - delay, start)
+        return start
+
+    @staticmethod
+    def _succeeded(operation_name: str, bucket: TokenBucket, start: float) -> None:
+        TRACER.record(operation_name, "api", start, time.monotonic())
+        bucket.on_success()
+
+    def _failed(
+        self,
+        operation_name: str,
+        bucket: TokenBucket,
+        start: float,
+        error: Exception,
+        attempt: int,
+    ) -> None:
+        """
+        Record a failed call and decide whether it is retried.
+
+        Raises:
+            The error, unless it is a throttle with retries left
+        """
+        code = (getattr(error, "response", None) or {}).get("Error", {}).get("Code")
+        TRACER.record(
+            operation_name,
+            "api",
+            start,
+            time.monotonic(),
+            error=code or type(error).__name__,
+            throttled=code in THROTTLE_ERROR_CODES,
+        )
+        if code not in THROTTLE_ERROR_CODES:
+            raise error
+        bucket.on_throttle()
+        if attempt == self.MAX_THROTTLE_RETRIES:
+            raise error
+        logger.debug(f"{operation_name} throttled (attempt {attempt + 1})")
+
+    def reset_stats(self) -> None:
+        """Clear the per-family counters, keeping the adapted rates"""
+        for bucket in self.buckets.values():
+            with bucket._lock:
+                bucket.calls = 0
+                bucket.throttles = 0
+                bucket.wait_seconds = 0.0
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Return calls, throttles, wait time and current rate per API family"""
+        return {
+            family: {
+                "calls": bucket.calls,
+                "throttles": bucket.throttles,
+                "wait_seconds": round(bucket.wait_seconds, 3),
+                "rate": round(bucket.rate, 2),
+            }
+            for family, bucket in self.buckets.items()
+            if bucket.calls
+        }
+
+    def log_stats(self) -> None:
+        """Log the per-family counters"""
+        for family, family_stats in self.stats().items():
+            logger.info(
+                f"Lex API {family}: {family_stats['calls']} calls, "
+                f"{family_stats['throttles']} throttled, "
+                f"{family_stats['wait_seconds']:.1f}s waiting, "
+                f"rate now {family_stats['rate']}/s"
+            )
+
+
+# One limiter per process, so every client wrapper shares the same budget
+RATE_LIMITER = RateLimiter()
+TRACER.on_reset(RATE_LIMITER.reset_stats)
+
+
+class RateLimitedClient:
+    """Proxy for a boto3 client that routes API calls through a RateLimiter"""
+
+    # Client attributes that are not API operations
+    PASSTHROUGH = ("meta", "exceptions", "can_paginate", "get_paginator", "get_waiter")
+
+    def __init__(self, client, limiter: Optional[RateLimiter] = None):
+        self._client = client
+        self._limiter = limiter or RATE_LIMITER
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._client, name)
+        if name.startswith("_") or name in self.PASSTHROUGH or not callable(attribute):
+            return attribute
+
+        def rate_limited(**kwargs):
+            return self._limiter.call(name, attribute, **kwargs)
+
+        return rate_limited
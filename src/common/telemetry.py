@@ -0,0 +1,246 @@
+import itertools
+import math
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+
+# Span kinds: "step" for orchestrator steps, "api" for AWS calls (working
+# time), "wait" for status polling and "sleep" for rate limits and backoff
+SPAN_KINDS = ("step", "api", "wait", "sleep")
+
+# A step a thread or task works for: its name and an id unique within the
+# run, as the same step name recurs (e.g. "bot" for every bot of a fleet)
+Step = Tuple[str, int]
+
+# Step of the current context: a thread, or an asyncio task, so coroutines
+# sharing the event loop thread keep their own steps
+_CURRENT_STEP: ContextVar[Optional[Step]] = ContextVar("current_step", default=None)
+
+# Labels of every step recorded in the current context, e.g. the bot a
+# fleet worker deploys; plan workers run in a copy of the caller's context
+_STEP_LABELS: ContextVar[Dict[str, str]] = ContextVar("step_labels", default={})
+
+
+class Span:
+    """One timed interval of a provisioning run"""
+
+    __slots__ = ("name", "kind", "start", "end", "thread", "attributes")
+
+    def __init__(
+        self,
+        name: str,
+        kind: str,
+        start: float,
+        end: float,
+        attributes: Dict,
+    ):
+        self.name = name
+        self.kind = kind
+        self.start = start
+        self.end = end
+        self.thread = threading.current_thread().name
+        self.attributes = attributes
+
+    @property
+    def seconds(self) -> float:
+        return self.end - self.start
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted, non-empty list"""
+    index = max(math.ceil(fraction * len(sorted_values)) - 1, 0)
+    return sorted_values[index]
+
+
+class Tracer:
+    """
+    Collects timed spans from every thread of a run.
+
+    Spans are kept in memory and only summarised at the end, so recording
+    one costs a lock and a list append. Each thread or task also tracks the
+    step it is working for, and every span records that step's name and id,
+    so API calls and waits can be attributed to the plan node that caused
+    them.
+    """
+
+    def __init__(self):
+        self._spans: List[Span] = []
+        self._lock = threading.Lock()
+        self._step_ids = itertools.count(1)
+        self._reset_callbacks: List[Callable[[], None]] = []
+        self.started = time.monotonic()
+
+    def on_reset(self, callback: Callable[[], None]) -> None:
+        """
+        Call a function on every reset, so run statistics kept elsewhere
+        (status polling, rate limits) start over with the spans.
+        """
+        self._reset_callbacks.append(callback)
+
+    def reset(self) -> None:
+        """Drop recorded spans and run statistics and restart the run clock"""
+        with self._lock:
+            self._spans = []
+            self.started = time.monotonic()
+        for callback in self._reset_callbacks:
+            callback()
+
+    def current_step(self) -> Optional[Step]:
+        """Step the calling thread or task is working for, if any"""
+        return _CURRENT_STEP.get()
+
+    @contextmanager
+    def in_step(self, step: Union[str, Step, None]) -> Iterator[Optional[Step]]:
+        """
+        Attribute spans recorded by this thread or task in the block to a step.
+
+        Args:
+            step: Name of a new step, or a step from current_step() to keep
+                working for it from another thread
+
+        Yields:
+            The step
+        """
+        if isinstance(step, str):
+            step = (step, next(self._step_ids))
+        token = _CURRENT_STEP.set(step)
+        try:
+            yield step
+        finally:
+            _CURRENT_STEP.reset(token)
+
+    @contextmanager
+    def labels(self, **labels: str) -> Iterator[None]:
+        """Add attributes to every step recorded in the block's context"""
+        token = _STEP_LABELS.set({**_STEP_LABELS.get(), **labels})
+        try:
+            yield
+        finally:
+            _STEP_LABELS.reset(token)
+
+    def record(
+        self, name: str, kind: str, start: float, end: float, **attributes
+    ) -> None:
+        """
+        Record an interval measured by the caller with time.monotonic().
+
+        The span is attributed to the calling thread's current step unless a
+        "step" attribute (a step from current_step(), or None) is given.
+        """
+        if kind == "step":
+            attributes = {**_STEP_LABELS.get(), **attributes}
+        step = attributes.pop("step", self.current_step())
+        attributes["step"], attributes["step_id"] = step or (None, None)
+        span = Span(name, kind, start, end, attributes)
+        with self._lock:
+            self._spans.append(span)
+
+    @contextmanager
+    def span(self, name: str, kind: str = "step", **attributes) -> Iterator[Dict]:
+        """
+        Time the enclosed block.
+
+        Yields the span attributes so the block can add to them; an "error"
+        attribute is set if the block raises. A "step" span also becomes the
+        current step of the thread for the duration of the block.
+        """
+        start = time.monotonic()
+        parent = self.current_step()
+        try:
+            if kind == "step":
+                with self.in_step(name) as step:
+                    attributes["id"] = step[1]
+                    yield attributes
+            else:
+                yield attributes
+        except Exception as e:
+            attributes["error"] = type(e).__name__
+            raise
+        finally:
+            attributes.setdefault("step", parent)
+            self.record(name, kind, start, time.monotonic(), **attributes)
+
+    def spans(self, kind: Optional[str] = None) -> List[Span]:
+        """Return recorded spans, optionally only those of one kind"""
+        with self._lock:
+            return [span for span in self._spans if kind in (None, span.kind)]
+
+    def summary(self) -> Dict:
+        """
+        Summarise the recorded spans.
+
+        Returns:
+            Dict with the run wall time, every step in start order with its
+            wall time and API calls, per-API call counts and latency
+            percentiles, and thread-seconds per span kind
+        """
+        spans = self.spans()
+        wall = time.monotonic() - self.started
+
+        # By step id, as step names recur within a run
+        steps: Dict[int, Dict] = {}
+        for span in spans:
+            if span.kind == "step":
+                steps[span.attributes.get("id") or id(span)] = {
+                    "name": span.name,
+                    "start": round(span.start - self.started, 3),
+                    "seconds": round(span.seconds, 3),
+                    "api_calls": 0,
+                    **{
+                        k: v
+                        for k, v in span.attributes.items()
+                        if k not in ("id", "step", "step_id")
+                    },
+                }
+
+        latencies: Dict[str, List[float]] = {}
+        api_calls: Dict[str, Dict] = {}
+        for span in spans:
+            if span.kind != "api":
+                continue
+            latencies.setdefault(span.name, []).append(span.seconds)
+            counts = api_calls.setdefault(
+                span.name, {"calls": 0, "errors": 0, "throttled": 0}
+            )
+            counts["calls"] += 1
+            if span.attributes.get("step_id") in steps:
+                steps[span.attributes["step_id"]]["api_calls"] += 1
+            if span.attributes.get("throttled"):
+                counts["throttled"] += 1
+            elif "error" in span.attributes:
+                counts["errors"] += 1
+
+        for name, values in latencies.items():
+            values.sort()
+            api_calls[name].update(
+                {
+                    "total_seconds": round(sum(values), 3),
+                    "p50": round(percentile(values, 0.50), 3),
+                    "p90": round(percentile(values, 0.90), 3),
+                    "p99": round(percentile(values, 0.99), 3),
+                    "max": round(values[-1], 3),
+                }
+            )
+
+        thread_seconds: Dict[str, float] = defaultdict(float)
+        for span in spans:
+            thread_seconds[span.kind] += span.seconds
+
+        return {
+            "wall_seconds": round(wall, 3),
+            "steps": sorted(steps.values(), key=lambda step: step["start"]),
+            "api_calls": dict(sorted(api_calls.items())),
+            "time": {
+                "working_seconds": round(thread_seconds["api"], 3),
+                "waiting_seconds": round(thread_seconds["wait"], 3),
+                "sleeping_seconds": round(thread_seconds["sleep"], 3),
+            },
+        }
+
+
+# One tracer per process, shared by the rate limiter, waiters and schedulers
+TRACER = Tracer()
@@ -0,0 +1,6 @@
+import sys
+from pathlib import Path
+
+# Modules import each other as bot_engine.* and common.*, as run_bot.py
+# arranges by putting src on the path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
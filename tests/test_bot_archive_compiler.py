@@ -0,0 +1,69 @@
+"""
+Golden-file tests of the import archive compiler.
+
+After an intended change to the archive format, refresh the golden files
+with BotArchiveCompiler(config).write_directory(GOLDEN_DIR) and review the
+diff.
+"""
+
+import io
+import json
+import zipfile
+from pathlib import Path
+
+import pytest
+import yaml
+
+from bot_engine.builder.bot_archive_compiler import (
+    BotArchiveCompiler,
+    BotArchiveException,
+)
+from bot_engine.utils.config_model import BotConfig
+from bot_engine.utils.yaml_loader import load_bot_config
+
+
+FIXTURES = Path(__file__).parent / "fixtures"
+TEMPLATE = FIXTURES / "archive_bot.yaml"
+GOLDEN_DIR = FIXTURES / "archive"
+GOLDEN_PATHS = sorted(
+    path.relative_to(GOLDEN_DIR).as_posix() for path in GOLDEN_DIR.rglob("*.json")
+)
+
+
+@pytest.fixture(scope="module")
+def compiler():
+    return BotArchiveCompiler(load_bot_config(TEMPLATE, cache_dir=None))
+
+
+@pytest.fixture(scope="module")
+def compiled(compiler):
+    return compiler.compile()
+
+
+def test_archive_has_exactly_the_golden_files(compiled):
+    assert sorted(compiled) == GOLDEN_PATHS
+
+
+@pytest.mark.parametrize("path", GOLDEN_PATHS)
+def test_archive_entry_matches_golden_file(compiled, path):
+    expected = json.loads((GOLDEN_DIR / path).read_text(encoding="utf-8"))
+    assert compiled[path] == expected
+
+
+def test_zip_entries_are_the_golden_bytes(compiler):
+    archive = zipfile.ZipFile(io.BytesIO(compiler.to_zip_bytes()))
+    assert archive.namelist() == GOLDEN_PATHS
+    for path in GOLDEN_PATHS:
+        assert archive.read(path) == (GOLDEN_DIR / path).read_bytes(), path
+
+
+def test_zip_is_deterministic(compiler):
+    assert compiler.to_zip_bytes() == compiler.to_zip_bytes()
+
+
+def test_slot_without_priority_is_rejected():
+    data = yaml.safe_load(TEMPLATE.read_text(encoding="utf-8"))
+    del data["bot"]["locale"][0]["slotDefinitions"][1]["priority"]
+    compiler = BotArchiveCompiler(BotConfig.from_dict(data["bot"]))
+    with pytest.raises(BotArchiveException, match="FIXTURE_ORDER_ID"):
+        compiler.compile()
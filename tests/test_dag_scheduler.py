@@ -0,0 +1,88 @@
+import threading
+
+import pytest
+from botocore.exceptions import ClientError
+
+from bot_engine.utils.dag_scheduler import (
+    DagCycleException,
+    DagExecutionException,
+    DagScheduler,
+)
+
+
+def client_error(code):
+    return ClientError({"Error": {"Code": code, "Message": code}}, "create_intent")
+
+
+def failing(code, times, calls):
+    def func(inputs):
+        calls.append(code)
+        if len(calls) <= times:
+            raise client_error(code)
+        return "done"
+
+    return func
+
+
+@pytest.fixture(autouse=True)
+def fast_retries(monkeypatch):
+    monkeypatch.setattr(DagScheduler, "RETRY_DELAY", 0.001)
+
+
+def test_nodes_run_after_their_dependencies_and_receive_their_results():
+    order = []
+    lock = threading.Lock()
+
+    def node(name, value):
+        def func(inputs):
+            with lock:
+                order.append(name)
+            return value + sum(inputs.values())
+
+        return func
+
+    scheduler = DagScheduler(max_workers=4)
+    scheduler.add_node("bot", node("bot", 1))
+    scheduler.add_node("slot_type", node("slot_type", 10), ["bot"])
+    scheduler.add_node("intent", node("intent", 100), ["bot"])
+    scheduler.add_node("slot", node("slot", 1000), ["slot_type", "intent"])
+
+    results = scheduler.run()
+    assert results == {"bot": 1, "slot_type": 11, "intent": 101, "slot": 1112}
+    assert order[0] == "bot" and order[-1] == "slot"
+    assert set(scheduler.timings) == set(results)
+
+
+def test_completed_nodes_are_not_run_again():
+    scheduler = DagScheduler()
+    scheduler.add_node("bot", lambda inputs: pytest.fail("bot ran again"))
+    scheduler.add_node("intent", lambda inputs: inputs["bot"] + "/I1", ["bot"])
+    assert scheduler.run(completed={"bot": "B1"}) == {"bot": "B1", "intent": "B1/I1"}
+
+
+def test_cycles_are_rejected():
+    scheduler = DagScheduler()
+    scheduler.add_node("a", lambda inputs: None, ["b"])
+    scheduler.add_node("b", lambda inputs: None, ["a"])
+    with pytest.raises(DagCycleException):
+        scheduler.run()
+
+
+def test_transient_failures_are_retried():
+    calls = []
+    scheduler = DagScheduler()
+    scheduler.add_node("intent", failing("ThrottlingException", 2, calls), retries=2)
+    assert scheduler.run() == {"intent": "done"}
+    assert len(calls) == 3
+
+
+def test_validation_errors_are_not_retried_and_skip_dependents():
+    calls = []
+    scheduler = DagScheduler()
+    scheduler.add_node("intent", failing("ValidationException", 1, calls), retries=3)
+    scheduler.add_node("slot", lambda inputs: "done", ["intent"])
+    with pytest.raises(DagExecutionException) as raised:
+        scheduler.run()
+    assert len(calls) == 1
+    assert list(raised.value.errors) == ["intent"]
+    assert raised.value.skipped == ["slot"]
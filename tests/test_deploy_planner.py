@@ -0,0 +1,45 @@
+from collections import Counter
+
+from bot_engine.utils.deploy_planner import DeploymentPlanner, LatencyModel
+from common.client_factory import CLIENT_FACTORY
+from common.rate_limiter import RATE_LIMITER, RateLimiter
+
+
+def test_dry_run_lists_the_calls_of_a_fresh_deployment():
+    planner = DeploymentPlanner()
+    planner.dry_run()
+
+    calls = Counter(operation for _, operation in planner.calls)
+    kinds = Counter(node_id.partition(":")[0] for node_id in planner.plan.nodes)
+    assert calls["create_bot"] == 1
+    assert calls["create_bot_locale"] == kinds["locale"]
+    assert calls["create_slot_type"] == kinds["slot_type"]
+    assert calls["create_intent"] == kinds["intent"]
+    assert calls["create_slot"] == kinds["slot"]
+    assert calls["build_bot_locale"] == kinds["build"]
+    # Calls of plan nodes are attributed to them
+    steps = {step for step, operation in planner.calls if operation == "create_slot"}
+    assert steps == {
+        node_id for node_id in planner.plan.nodes if node_id.startswith("slot:")
+    }
+
+
+def test_dry_run_leaves_no_fake_clients_or_limits_behind():
+    RATE_LIMITER.reset(RateLimiter.DEFAULT_LIMITS)
+    DeploymentPlanner().dry_run()
+    assert CLIENT_FACTORY._overrides == {}
+    assert RATE_LIMITER.limits == RateLimiter.DEFAULT_LIMITS
+
+
+def test_estimate_is_bounded_by_the_serial_and_unlimited_runs():
+    planner = DeploymentPlanner(LatencyModel())
+    planner.dry_run()
+    few = planner.estimate(max_workers=1)
+    many = planner.estimate(max_workers=16)
+    assert few["estimated_seconds"] == few["serial_seconds"]
+    assert (
+        many["unlimited_workers_seconds"]
+        <= many["estimated_seconds"]
+        <= few["estimated_seconds"]
+    )
+    assert many["estimated_seconds"] > 0
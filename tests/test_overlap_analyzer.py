@@ -0,0 +1,69 @@
+from types import SimpleNamespace
+
+from bot_engine.utils.overlap_analyzer import OverlapAnalyzer
+
+
+def locale(**intents):
+    return SimpleNamespace(
+        localeId="en_US",
+        intents=[
+            SimpleNamespace(name=name, sampleUtterances=utterances)
+            for name, utterances in intents.items()
+        ],
+    )
+
+
+def test_shingles_reduce_slot_references():
+    assert OverlapAnalyzer.shingles("Track {OrderId} now") == {
+        "track",
+        "{slot}",
+        "now",
+        "track {slot}",
+        "{slot} now",
+    }
+
+
+def test_signatures_are_reproducible():
+    shingles = OverlapAnalyzer.shingles("where is my order")
+    signature = OverlapAnalyzer().signature(shingles)
+    assert len(signature) == OverlapAnalyzer.BANDS * OverlapAnalyzer.ROWS
+    assert OverlapAnalyzer().signature(shingles) == signature
+
+
+def test_near_duplicates_across_intents_are_reported():
+    overlaps = OverlapAnalyzer().analyze_locale(
+        locale(
+            ORDER_STATUS=["where is my order {OrderId}", "track my package"],
+            CANCEL_ORDER=["where is my order {Number}", "cancel my subscription"],
+        )
+    )
+    pairs = [(o.intent_a, o.utterance_a, o.intent_b, o.utterance_b) for o in overlaps]
+    assert pairs == [
+        (
+            "ORDER_STATUS",
+            "where is my order {OrderId}",
+            "CANCEL_ORDER",
+            "where is my order {Number}",
+        )
+    ]
+    assert overlaps[0].similarity == 1.0
+
+
+def test_near_duplicates_within_one_intent_are_ignored():
+    overlaps = OverlapAnalyzer().analyze_locale(
+        locale(
+            ORDER_STATUS=["where is my order", "where is my order now"],
+            HELP=["talk to an agent"],
+        )
+    )
+    assert overlaps == []
+
+
+def test_dissimilar_utterances_are_not_reported():
+    overlaps = OverlapAnalyzer(min_similarity=0.9).analyze_locale(
+        locale(
+            ORDER_STATUS=["where is my order today"],
+            CANCEL_ORDER=["where is my refund today"],
+        )
+    )
+    assert overlaps == []
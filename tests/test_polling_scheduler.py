@@ -0,0 +1,80 @@
+import threading
+import time
+
+import pytest
+
+from bot_engine.builder.bot_base import BotBase, BotContext
+from bot_engine.builder.polling_scheduler import (
+    PollingScheduler,
+    WaiterException,
+    WaiterTimeoutException,
+)
+from bot_engine.builder.resource_waiter import ResourceWaiter
+
+
+def ready_after(seconds):
+    start = time.monotonic()
+    return lambda: {"ready": time.monotonic() - start >= seconds}
+
+
+def test_handles_become_ready():
+    scheduler = PollingScheduler()
+    handles = [
+        scheduler.register(f"resource {i}", ready_after(0.2), lambda r: r["ready"])
+        for i in range(3)
+    ]
+    responses = scheduler.wait_all(handles)
+    assert [response["ready"] for response in responses] == [True] * 3
+
+
+def test_group_deadline_fails_pending_handles():
+    scheduler = PollingScheduler()
+    scheduler.set_deadline(0.2, group="bot")
+    with pytest.raises(WaiterTimeoutException):
+        scheduler.wait(
+            "slow", ready_after(60), lambda r: r["ready"], timeout=60, group="bot"
+        )
+
+
+def test_passed_deadline_of_another_group_does_not_spin():
+    scheduler = PollingScheduler()
+    scheduler.set_deadline(0, group="finished")
+    waits = 0
+    condition_wait = scheduler._condition.wait
+
+    def counting_wait(timeout=None):
+        nonlocal waits
+        waits += 1
+        return condition_wait(timeout)
+
+    scheduler._condition.wait = counting_wait
+    scheduler.wait("resource", ready_after(1), lambda r: r["ready"], group="active")
+    assert waits < 100
+
+
+def test_resource_waits_stop_when_the_bot_context_is_cancelled():
+    cancel_event = threading.Event()
+    context = BotContext("bot", "", "us-east-1", object(), cancel_event)
+    with BotBase.use_context(context):
+        waiter = ResourceWaiter()
+    threading.Timer(0.2, cancel_event.set).start()
+    start = time.monotonic()
+    with pytest.raises(WaiterException, match="cancelled"):
+        waiter.wait("slow", ready_after(60), lambda r: r["ready"], timeout=60)
+    assert time.monotonic() - start < 5
+
+
+def test_readiness_is_kept_per_group_until_reset():
+    scheduler = PollingScheduler()
+    for group, seconds in (("bot a", 0.1), ("bot b", 0.3)):
+        scheduler.wait(
+            "Locale en_US", ready_after(seconds), lambda r: r["ready"], group=group
+        )
+    first, second = scheduler.readiness("bot a"), scheduler.readiness("bot b")
+    assert list(first) == list(second) == ["Locale en_US"]
+    assert first["Locale en_US"] < second["Locale en_US"]
+    assert scheduler.stats()["ready"] == 2
+
+    scheduler.reset_stats()
+    assert scheduler.readiness("bot a") == {}
+    assert scheduler.stats() == {"ticks": 0, "polls": 0, "ready": 0}
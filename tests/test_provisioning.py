@@ -0,0 +1,221 @@
+import asyncio
+import functools
+from pathlib import Path
+
+import pytest
+
+from bot_engine import async_bot_orchestrator, universal_bot_fleet
+from bot_engine.builder.bot_base import BotBase, BotContext
+from bot_engine.builder.build_monitor import BuildMonitor, LocaleBuildFailedException
+from bot_engine.builder.polling_scheduler import PollingScheduler
+from bot_engine.builder.resource_waiter import ResourceWaiter
+from bot_engine.universal_bot_orchestrator import (
+    BotCreationException,
+    CreateUniversalBot,
+)
+from bot_engine.universal_bot_fleet import DeployBotFleet, FleetDeploymentException
+from bot_engine.universal_bot_updater import UpdateUniversalBot
+from bot_engine.utils.dag_scheduler import DagScheduler
+from bot_engine.utils.deployment_state import DeploymentState
+from bot_engine.utils.yaml_loader import load_bot_config
+from common.client_factory import CLIENT_FACTORY
+from common.fake_lex_client import FakeLexModelsClient, install_fake_clients
+from common.rate_limiter import RATE_LIMITER, RateLimiter
+
+
+TEMPLATE = Path(__file__).parent / "fixtures" / "archive_bot.yaml"
+# Two slot types, two intents and three slots in one locale
+CREATED = {
+    "create_bot": 1,
+    "create_bot_locale": 1,
+    "create_slot_type": 2,
+    "create_intent": 2,
+    "create_slot": 3,
+    "build_bot_locale": 1,
+    "create_bot_version": 1,
+    "create_bot_alias": 1,
+}
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    monkeypatch.setattr(DagScheduler, "RETRY_DELAY", 0.01)
+    monkeypatch.setattr(PollingScheduler, "INITIAL_DELAY", 0.05)
+    monkeypatch.setattr(ResourceWaiter, "INITIAL_DELAY", 0.05)
+    RATE_LIMITER.reset(
+        {family: (100.0, 100.0, 1.0, 200.0) for family in RateLimiter.DEFAULT_LIMITS}
+    )
+    fake = install_fake_clients(
+        FakeLexModelsClient(build_seconds=0.1, version_seconds=0.1)
+    )
+    yield fake
+    CLIENT_FACTORY.override("lexv2-models", None)
+    CLIENT_FACTORY.override("iam", None)
+    RATE_LIMITER.reset(RateLimiter.DEFAULT_LIMITS)
+
+
+@pytest.fixture
+def state_path(tmp_path):
+    return tmp_path / "state.json"
+
+
+def deploy(state_path, **kwargs):
+    config = load_bot_config(TEMPLATE, cache_dir=None)
+    return CreateUniversalBot(state_path, bot_config=config, **kwargs)
+
+
+def calls_during(fake, func, *args, **kwargs):
+    before = fake.calls.copy()
+    result = func(*args, **kwargs)
+    return result, fake.calls - before
+
+
+def test_create(fake, state_path):
+    bot, calls = calls_during(fake, deploy, state_path)
+    assert dict(bot.actions) == {"created": 11}
+    assert bot.bot_version == "1"
+    assert {operation: calls[operation] for operation in CREATED} == CREATED
+
+
+def test_rerun_without_changes_makes_no_writes(fake, state_path):
+    first = deploy(state_path)
+    bot, calls = calls_during(fake, deploy, state_path)
+    assert dict(bot.actions) == {"unchanged": 11}
+    assert (bot.bot_id, bot.bot_version) == (first.bot_id, first.bot_version)
+    assert dict(calls) == {"list_bots": 1}
+
+
+@pytest.mark.parametrize("operation", ["create_slot", "create_bot_version"])
+def test_resume_after_failure_creates_only_what_is_missing(
+    fake, state_path, operation
+):
+    fake.inject_failure(operation, "ValidationException")
+    with pytest.raises(BotCreationException):
+        deploy(state_path)
+
+    bot, calls = calls_during(fake, deploy, state_path, resume=True)
+    assert bot.bot_version == "1"
+    # Every resource created once, plus the injected failure
+    assert fake.calls[operation] == CREATED[operation] + 1
+    for created in ("create_bot", "create_slot_type", "create_intent"):
+        assert calls[created] == 0
+    assert calls["create_bot_alias"] == 1
+
+    for _ in range(2):
+        bot, calls = calls_during(fake, deploy, state_path)
+        assert dict(bot.actions) == {"unchanged": 11}
+        assert dict(calls) == {"list_bots": 1}
+
+
+def test_async_engine_create(fake, monkeypatch):
+    # The fake replaces boto3 clients, so use the executor path even where
+    # aiobotocore is installed
+    monkeypatch.setattr(async_bot_orchestrator, "get_session", None)
+    config = load_bot_config(TEMPLATE, cache_dir=None)
+    result, calls = calls_during(
+        fake, asyncio.run, async_bot_orchestrator.deploy(config)
+    )
+    assert result["botVersion"] == "1"
+    assert set(result["locales"]) == {"en_US"}
+    assert {operation: calls[operation] for operation in CREATED} == CREATED
+
+
+def writes(calls):
+    return {
+        operation: count
+        for operation, count in calls.items()
+        if not operation.startswith(("describe_", "list_"))
+    }
+
+
+def test_update_without_changes_makes_no_writes(fake, state_path):
+    deploy(state_path)
+    config = load_bot_config(TEMPLATE, cache_dir=None)
+    bot, calls = calls_during(fake, UpdateUniversalBot, bot_config=config)
+    assert bot.changes == []
+    assert writes(calls) == {}
+
+
+def test_update_applies_only_the_changed_intent(fake, state_path):
+    deploy(state_path)
+    config = load_bot_config(TEMPLATE, cache_dir=None)
+    intent = config.locale[0].intents[1]
+    intent.description = "Changed"
+    bot, calls = calls_during(fake, UpdateUniversalBot, bot_config=config)
+    assert bot.changes == [f"update intent en_US/{intent.name}"]
+    assert writes(calls) == {
+        "update_intent": 1,
+        "build_bot_locale": 1,
+        "create_bot_version": 1,
+        "update_bot_alias": 1,
+    }
+
+
+def test_failed_build_stops_the_run_with_its_reasons(fake, state_path):
+    fake.fail_build("en_US", ["Intent ORDER_STATUS: bad utterance"])
+    with pytest.raises(BotCreationException) as raised:
+        deploy(state_path)
+    assert "Locale en_US build failed" in str(raised.value)
+    assert "Intent ORDER_STATUS: bad utterance" in str(raised.value)
+    assert fake.calls["create_bot_version"] == 0
+    assert fake.calls["create_bot_alias"] == 0
+
+
+def test_build_monitor_reports_the_failed_locale(fake):
+    fake.fail_build("en_GB", ["Missing slot type"])
+    bot_id = fake.create_bot(botName="bot")["botId"]
+    for locale_id in ("en_US", "en_GB"):
+        fake.create_bot_locale(botId=bot_id, botVersion="DRAFT", localeId=locale_id)
+        fake.build_bot_locale(botId=bot_id, botVersion="DRAFT", localeId=locale_id)
+    context = BotContext("bot", "", "us-east-1", fake)
+    with BotBase.use_context(context):
+        monitor = BuildMonitor()
+    with pytest.raises(LocaleBuildFailedException) as raised:
+        monitor.wait_for_builds(bot_id, ["en_US", "en_GB"])
+    assert raised.value.locale_id == "en_GB"
+    assert raised.value.failure_reasons == ["Missing slot type"]
+
+
+@pytest.fixture
+def templates(fake, tmp_path, monkeypatch):
+    monkeypatch.setattr(DeploymentState, "DEFAULT_DIR", str(tmp_path / "state"))
+    monkeypatch.setattr(
+        universal_bot_fleet,
+        "load_bot_config",
+        functools.partial(load_bot_config, cache_dir=None),
+    )
+    templates = tmp_path / "templates"
+    templates.mkdir()
+    return templates
+
+
+def test_fleet_rejects_duplicate_bots_and_deploys_the_rest(fake, templates):
+    template = TEMPLATE.read_text(encoding="utf-8")
+    (templates / "a.yaml").write_text(template, encoding="utf-8")
+    (templates / "b.yaml").write_text(template, encoding="utf-8")
+    (templates / "c.yaml").write_text(
+        template.replace("archive_fixture_bot", "other_bot"), encoding="utf-8"
+    )
+
+    with pytest.raises(FleetDeploymentException) as raised:
+        DeployBotFleet(templates)
+    outcomes = {outcome.template.name: outcome for outcome in raised.value.outcomes}
+    assert outcomes["a.yaml"].succeeded and outcomes["c.yaml"].succeeded
+    assert not outcomes["b.yaml"].succeeded
+    assert "also defined in a.yaml" in outcomes["b.yaml"].error
+    assert fake.calls["create_bot"] == 2
+
+
+def test_fleet_resumes_each_bot_from_its_journal(fake, templates):
+    (templates / "a.yaml").write_text(
+        TEMPLATE.read_text(encoding="utf-8"), encoding="utf-8"
+    )
+    fake.inject_failure("create_bot_alias", "ValidationException")
+    with pytest.raises(FleetDeploymentException):
+        DeployBotFleet(templates)
+
+    fleet, calls = calls_during(fake, DeployBotFleet, templates, resume=True)
+    assert [outcome.succeeded for outcome in fleet.outcomes] == [True]
+    assert calls["create_bot_alias"] == 1
+    for operation in ("create_bot", "create_slot_type", "create_intent"):
+        assert calls[operation] == 0
@@ -0,0 +1,132 @@
+import asyncio
+
+import pytest
+from botocore.exceptions import ClientError
+
+from common.rate_limiter import RateLimiter, TokenBucket, api_family
+
+
+def throttled(operation_name):
+    return ClientError(
+        {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}},
+        operation_name,
+    )
+
+
+def test_api_families():
+    assert api_family("describe_intent") == "read"
+    assert api_family("create_intent") == "write"
+    assert api_family("build_bot_locale") == "build"
+    assert api_family("create_bot_version") == "build"
+    assert api_family("tag_resource") == "other"
+
+
+def test_throttle_halves_the_rate_once_per_cooldown():
+    bucket = TokenBucket(rate=8.0, burst=8.0, min_rate=1.0, max_rate=20.0)
+    bucket.on_throttle()
+    bucket.on_throttle()
+    assert bucket.rate == 4.0
+    assert bucket.throttles == 2
+
+
+def test_rate_never_drops_below_the_minimum(monkeypatch):
+    monkeypatch.setattr(TokenBucket, "DECREASE_COOLDOWN", 0.0)
+    bucket = TokenBucket(rate=2.0, burst=2.0, min_rate=0.5, max_rate=20.0)
+    for _ in range(5):
+        bucket.on_throttle()
+    assert bucket.rate == 0.5
+
+
+def test_successes_raise_the_rate_additively_up_to_the_maximum():
+    bucket = TokenBucket(rate=4.0, burst=4.0, min_rate=1.0, max_rate=5.0)
+    # Each success adds ADDITIVE_INCREASE / rate: 0.5 calls/s per second
+    # of traffic at the current rate
+    for _ in range(8):
+        bucket.on_success()
+    assert 4.5 < bucket.rate < 5.0
+    for _ in range(100):
+        bucket.on_success()
+    assert bucket.rate == 5.0
+
+
+def test_call_retries_throttles_through_the_slower_bucket():
+    limiter = RateLimiter({"write": (100.0, 100.0, 1.0, 200.0)})
+    attempts = []
+
+    def create_intent(**kwargs):
+        attempts.append(kwargs)
+        if len(attempts) < 3:
+            raise throttled("create_intent")
+        return {"intentId": "I1"}
+
+    assert limiter.call("create_intent", create_intent, intentName="A") == {
+        "intentId": "I1"
+    }
+    assert attempts == [{"intentName": "A"}] * 3
+    assert limiter.buckets["write"].throttles == 2
+    assert limiter.buckets["write"].rate < 100.0
+
+
+def test_call_gives_up_after_max_throttle_retries(monkeypatch):
+    monkeypatch.setattr(RateLimiter, "MAX_THROTTLE_RETRIES", 2)
+    limiter = RateLimiter({"write": (100.0, 100.0, 1.0, 200.0)})
+    attempts = []
+
+    def create_intent():
+        attempts.append(1)
+        raise throttled("create_intent")
+
+    with pytest.raises(ClientError):
+        limiter.call("create_intent", create_intent)
+    assert len(attempts) == 3
+
+
+def test_other_errors_are_not_retried():
+    limiter = RateLimiter({"write": (100.0, 100.0, 1.0, 200.0)})
+    attempts = []
+
+    def create_intent():
+        attempts.append(1)
+        raise ValueError("bad request")
+
+    with pytest.raises(ValueError):
+        limiter.call("create_intent", create_intent)
+    assert len(attempts) == 1
+    assert limiter.buckets["write"].rate == 100.0
+
+
+def test_call_async_retries_throttles_without_blocking_the_loop():
+    limiter = RateLimiter({"write": (100.0, 1.0, 1.0, 200.0)})
+    attempts = []
+
+    async def create_intent(**kwargs):
+        attempts.append(kwargs)
+        if len(attempts) < 2:
+            raise throttled("create_intent")
+        return {"intentId": "I1"}
+
+    async def deploy():
+        return await asyncio.gather(
+            limiter.call_async("create_intent", create_intent, intentName="A"),
+            asyncio.sleep(0, "loop ran"),
+        )
+
+    assert asyncio.run(deploy()) == [{"intentId": "I1"}, "loop ran"]
+    assert len(attempts) == 2
+    assert limiter.buckets["write"].throttles == 1
+
+
+def test_reset_stats_keeps_the_adapted_rate():
+    limiter = RateLimiter({"write": (100.0, 100.0, 1.0, 200.0)})
+    attempts = []
+
+    def create_intent():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise throttled("create_intent")
+
+    limiter.call("create_intent", create_intent)
+    rate = limiter.buckets["write"].rate
+    limiter.reset_stats()
+    assert limiter.stats() == {}
+    assert limiter.buckets["write"].rate == rate < 100.0
@@ -0,0 +1,74 @@
+import pytest
+
+from bot_engine.utils.slot_value_catalog import (
+    SlotValueCatalog,
+    SlotValueCatalogException,
+    build_slot_type_values,
+)
+
+
+def payload(entries):
+    return {
+        entry["sampleValue"]["value"]: [s["value"] for s in entry["synonyms"]]
+        for entry in entries
+    }
+
+
+def test_csv_catalog_follows_inline_values(tmp_path):
+    catalog = tmp_path / "products.csv"
+    catalog.write_text(
+        "value,synonym\n"
+        "# comment\n"
+        "Laptop,notebook,LAPTOP\n"
+        "\n"
+        "laptop,  portable   computer \n"
+        "Phone\n",
+        encoding="utf-8",
+    )
+    entries = build_slot_type_values(
+        [("slotTypeValues[0]", "Tablet", ["pad"])], SlotValueCatalog(catalog)
+    )
+    assert payload(entries) == {
+        "Tablet": ["pad"],
+        "Laptop": ["notebook", "portable computer"],
+        "Phone": [],
+    }
+
+
+def test_jsonl_catalog(tmp_path):
+    catalog = tmp_path / "cities.jsonl"
+    catalog.write_text(
+        '{"sampleValue": "Paris", "synonyms": ["City of Light"]}\n'
+        '{"value": "Rome"}\n',
+        encoding="utf-8",
+    )
+    entries = build_slot_type_values(catalog=SlotValueCatalog(catalog))
+    assert payload(entries) == {"Paris": ["City of Light"], "Rome": []}
+
+
+def test_values_with_colliding_hashes_are_kept(monkeypatch):
+    # Every value collides; only equal values may be merged
+    monkeypatch.setattr("builtins.hash", lambda value: 0)
+    rows = [(f"row {i}", value, ["x", "X"]) for i, value in enumerate("abA")]
+    assert payload(build_slot_type_values(rows)) == {"a": ["x"], "b": ["x"]}
+
+
+def test_every_problem_is_reported(tmp_path):
+    catalog = tmp_path / "bad.jsonl"
+    catalog.write_text('{"sampleValue": 3}\nnot json\n{"sampleValue": ""}\n')
+    with pytest.raises(SlotValueCatalogException) as error:
+        build_slot_type_values(catalog=SlotValueCatalog(catalog), max_entries=0)
+    assert len(error.value.problems) == 3
+
+
+def test_limits_are_enforced():
+    rows = [("row", "value", ["one", "two"])]
+    with pytest.raises(SlotValueCatalogException, match="Lex allows 2"):
+        build_slot_type_values(rows, max_entries=2)
+    with pytest.raises(SlotValueCatalogException, match="longer than 3"):
+        build_slot_type_values([("row", "long value", [])], max_length=3)
+
+
+def test_unknown_format_is_rejected(tmp_path):
+    with pytest.raises(SlotValueCatalogException, match="unknown"):
+        SlotValueCatalog(tmp_path / "values.txt")
@@ -0,0 +1,83 @@
+import asyncio
+import threading
+from collections import Counter
+
+from common.telemetry import Tracer
+
+
+def record_call(tracer, name="describe_bot"):
+    tracer.record(name, "api", 0.0, 0.0)
+
+
+def test_steps_with_the_same_name_are_kept_apart():
+    tracer = Tracer()
+    for calls in (1, 3):
+        with tracer.span("bot"):
+            for _ in range(calls):
+                record_call(tracer)
+
+    steps = tracer.summary()["steps"]
+    assert [(step["name"], step["api_calls"]) for step in steps] == [
+        ("bot", 1),
+        ("bot", 3),
+    ]
+
+
+def test_worker_threads_keep_the_callers_step():
+    tracer = Tracer()
+    with tracer.span("locale"):
+        step = tracer.current_step()
+
+        def work():
+            with tracer.in_step(step):
+                record_call(tracer)
+
+        worker = threading.Thread(target=work)
+        worker.start()
+        worker.join()
+    with tracer.span("locale"):
+        pass
+
+    steps = tracer.summary()["steps"]
+    assert [step["api_calls"] for step in steps] == [1, 0]
+
+
+def test_api_calls_are_counted_per_operation():
+    tracer = Tracer()
+    record_call(tracer)
+    record_call(tracer)
+    tracer.record(
+        "create_bot", "api", 0.0, 0.1, error="ThrottlingException", throttled=True
+    )
+
+    api_calls = tracer.summary()["api_calls"]
+    assert api_calls["describe_bot"]["calls"] == 2
+    assert api_calls["create_bot"]["throttled"] == 1
+
+
+def test_coroutines_on_one_thread_keep_their_own_steps():
+    tracer = Tracer()
+
+    async def intent(name, calls):
+        with tracer.in_step(name):
+            for _ in range(calls):
+                # Let the other coroutine run inside this step
+                await asyncio.sleep(0)
+                record_call(tracer)
+
+    async def deploy():
+        await asyncio.gather(intent("intent:A", 2), intent("intent:B", 3))
+
+    asyncio.run(deploy())
+    steps = Counter(span.attributes["step"] for span in tracer.spans("api"))
+    assert steps == {"intent:A": 2, "intent:B": 3}
+
+
+def test_reset_clears_registered_run_statistics():
+    tracer = Tracer()
+    resets = []
+    tracer.on_reset(lambda: resets.append(True))
+    record_call(tracer)
+    tracer.reset()
+    assert tracer.spans() == []
+    assert resets == [True]
@@ -0,0 +1,67 @@
+import pytest
+
+from bot_engine.utils.utterance_expander import (
+    UtteranceExpander,
+    UtteranceGrammarException,
+    expand_template_utterances,
+)
+
+
+def test_grammar_constructs():
+    expander = UtteranceExpander({"device": ["laptop", "phone"]})
+    assert expander.expand(["[please] (fix|check) my <device> {ORDER_ID}"]) == [
+        "please fix my laptop {ORDER_ID}",
+        "please fix my phone {ORDER_ID}",
+        "please check my laptop {ORDER_ID}",
+        "please check my phone {ORDER_ID}",
+        "fix my laptop {ORDER_ID}",
+        "fix my phone {ORDER_ID}",
+        "check my laptop {ORDER_ID}",
+        "check my phone {ORDER_ID}",
+    ]
+
+
+def test_hand_written_utterances_come_first_and_win_duplicates():
+    expander = UtteranceExpander()
+    assert expander.expand(["(hi|hello) there", "Hello  There", "hi"]) == [
+        "Hello  There",
+        "hi",
+        "hi there",
+    ]
+
+
+def test_utterances_with_colliding_hashes_are_kept(monkeypatch):
+    # Every utterance collides; only equal ones may be dropped
+    monkeypatch.setattr("builtins.hash", lambda value: 0)
+    expander = UtteranceExpander()
+    assert expander.expand(["one", "(two|three|TWO)"]) == ["one", "two", "three"]
+
+
+def test_expansions_beyond_the_limit_are_sampled_across_patterns():
+    expander = UtteranceExpander(max_utterances=5)
+    utterances = expander.expand(["hand written", "a (1|2|3|4)", "b (1|2|3|4)"])
+    assert utterances == ["hand written", "a 1", "a 3", "b 1", "b 3"]
+
+
+def test_huge_patterns_are_not_generated_in_full():
+    synonyms = {f"list{i}": [f"w{i}{j}" for j in range(10)] for i in range(12)}
+    pattern = " ".join(f"<list{i}>" for i in range(12))
+    utterances = UtteranceExpander(synonyms, max_utterances=100).expand([pattern])
+    assert len(utterances) == len(set(utterances)) == 100
+
+
+def test_malformed_patterns_are_all_reported():
+    with pytest.raises(UtteranceGrammarException) as error:
+        UtteranceExpander().expand(["(open", "<missing>", "fine"])
+    assert "missing ')'" in str(error.value)
+    assert "unknown synonym list <missing>" in str(error.value)
+
+
+def test_template_synonyms_are_consumed():
+    locale = {
+        "utteranceSynonyms": {"greeting": ["hi", "hello"]},
+        "intents": [{"name": "GREET", "sampleUtterances": ["<greeting> bot"]}],
+    }
+    expand_template_utterances({"bot": {"locale": [locale]}})
+    assert "utteranceSynonyms" not in locale
+    assert locale["intents"][0]["sampleUtterances"] == ["hi bot", "hello bot"]
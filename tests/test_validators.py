@@ -0,0 +1,74 @@
+import copy
+from pathlib import Path
+
+import pytest
+import yaml
+
+from bot_engine.utils.overlap_analyzer import OverlapAnalyzer
+from bot_engine.utils.validators import TemplateValidator
+from bot_engine.utils.yaml_loader import BotConfigException, load_bot_config
+
+
+TEMPLATE = Path(__file__).parent / "fixtures" / "archive_bot.yaml"
+BOT = yaml.safe_load(TEMPLATE.read_text(encoding="utf-8"))["bot"]
+
+
+@pytest.fixture
+def bot():
+    return copy.deepcopy(BOT)
+
+
+def messages(issues):
+    return [str(issue) for issue in issues]
+
+
+def add_duplicate_utterance(bot):
+    intents = bot["locale"][0]["intents"]
+    intents[0]["sampleUtterances"].append(intents[1]["sampleUtterances"][0].upper())
+
+
+def test_fixture_is_valid(bot):
+    assert TemplateValidator().validate(bot) == []
+
+
+def test_every_problem_is_reported(bot):
+    bot["name"] = "not a valid name!"
+    bot["idleSessionTTLInSeconds"] = 10
+    bot["locale"][0]["slotDefinitions"][0]["intent"] = "MISSING_INTENT"
+    bot["locale"][0]["intents"][0]["sampleUtterances"].append("Ship to {NOWHERE}")
+
+    issues = messages(TemplateValidator().validate(bot))
+
+    assert any(issue.startswith("bot.name:") for issue in issues)
+    assert any(issue.startswith("bot.idleSessionTTLInSeconds:") for issue in issues)
+    assert any("MISSING_INTENT" in issue for issue in issues)
+    assert any("{NOWHERE}" in issue for issue in issues)
+
+
+def test_duplicate_utterance_across_intents_is_an_issue(bot):
+    add_duplicate_utterance(bot)
+    issues = messages(TemplateValidator().validate(bot))
+    assert len(issues) == 1
+    assert "duplicate of an utterance in ORDER_STATUS" in issues[0]
+
+
+def test_duplicate_utterance_can_be_allowed(bot):
+    add_duplicate_utterance(bot)
+    validator = TemplateValidator(allow_duplicate_utterances=True)
+    assert validator.validate(bot) == []
+    assert len(validator.warnings) == 1
+
+
+def test_overlap_analysis_loads_a_template_with_duplicates(bot, tmp_path):
+    add_duplicate_utterance(bot)
+    template = tmp_path / "bot.yaml"
+    template.write_text(yaml.safe_dump({"bot": bot}), encoding="utf-8")
+
+    with pytest.raises(BotConfigException, match="duplicate of an utterance"):
+        load_bot_config(template, cache_dir=None)
+    config = load_bot_config(template, cache_dir=None, allow_duplicate_utterances=True)
+
+    overlaps = OverlapAnalyzer().analyze(config)["en_US"]
+    assert [(o.intent_a, o.intent_b, o.similarity) for o in overlaps] == [
+        ("ORDER_STATUS", "TALK_TO_AGENT", 1.0)
+    ]
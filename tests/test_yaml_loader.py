@@ -0,0 +1,55 @@
+import hashlib
+import os
+import pickle
+from pathlib import Path
+
+from bot_engine.utils import yaml_loader
+from bot_engine.utils.yaml_loader import CACHE_FORMAT, load_template_data
+
+
+TEMPLATE = Path(__file__).parent / "fixtures" / "archive_bot.yaml"
+
+
+def cache_file(cache_dir: Path) -> Path:
+    digest = hashlib.sha256(TEMPLATE.read_bytes()).hexdigest()
+    return cache_dir / f"{digest}.v{CACHE_FORMAT}.pickle"
+
+
+def test_cached_template_matches_parsed_one(tmp_path):
+    parsed = load_template_data(TEMPLATE, cache_dir=None)
+    assert load_template_data(TEMPLATE, tmp_path) == parsed
+    assert cache_file(tmp_path).exists()
+    assert load_template_data(TEMPLATE, tmp_path) == parsed
+
+
+def test_unsigned_entry_is_not_unpickled(tmp_path):
+    parsed = load_template_data(TEMPLATE, tmp_path)
+    cache_file(tmp_path).write_bytes(pickle.dumps({"bot": "planted"}))
+    assert load_template_data(TEMPLATE, tmp_path) == parsed
+
+
+def test_entry_signed_with_another_key_is_not_unpickled(tmp_path):
+    parsed = load_template_data(TEMPLATE, tmp_path)
+    entry = cache_file(tmp_path).read_bytes()
+    (tmp_path / yaml_loader.CACHE_KEY_FILE).write_bytes(b"another key")
+    load_template_data(TEMPLATE, tmp_path)
+    # The entry was parsed again and re-signed with the new key
+    assert cache_file(tmp_path).read_bytes() != entry
+    assert load_template_data(TEMPLATE, tmp_path) == parsed
+
+
+def test_stale_entries_are_evicted(tmp_path, monkeypatch):
+    monkeypatch.setattr(yaml_loader, "CACHE_MAX_ENTRIES", 1)
+    old_format = tmp_path / f"{'0' * 64}.v1.pickle"
+    old_entry = tmp_path / f"{'1' * 64}.v{CACHE_FORMAT}.pickle"
+    recent_entry = tmp_path / f"{'2' * 64}.v{CACHE_FORMAT}.pickle"
+    for path in (old_format, old_entry, recent_entry):
+        path.write_bytes(b"")
+    os.utime(old_entry, (0, 0))
+
+    load_template_data(TEMPLATE, tmp_path)
+
+    assert not old_format.exists()
+    assert not old_entry.exists()
+    assert recent_entry.exists()
+    assert cache_file(tmp_path).exists()